@@ -10,6 +10,7 @@ import mimetypes
 import os
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import BrokenExecutor
 from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
@@ -17,7 +18,12 @@ from urllib.parse import urljoin, urlparse
 import requests
 from bs4 import BeautifulSoup
 
-from capcat.core.conversion_executor import get_conversion_executor
+from capcat.core.conversion_executor import (
+    CONVERSION_SETTINGS,
+    convert_html,
+    get_conversion_executor,
+    shutdown_conversion_executor,
+)
 from .config import get_config
 from .async_pdf_manager import (
     get_pdf_manager,
@@ -75,6 +81,43 @@ _GLOBAL_UPDATE_MODE = False
 
 BYTES_TO_MB = 1024 * 1024
 
+# Error classification for _create_error_article, checked in order against
+# the lowercased error text: (substrings, category, recommendation).
+_ERROR_TABLE = (
+    (
+        ("403", "forbidden"),
+        "Access Denied (403 Forbidden)",
+        "This website restricts automated access. Capcat follows "
+        "ethical scraping principles and does not bypass access "
+        "controls.",
+    ),
+    (
+        ("404", "not found"),
+        "Article Not Found (404)",
+        "The article may have been removed or the URL is incorrect.",
+    ),
+    (
+        ("timeout",),
+        "Connection Timeout",
+        "The server took too long to respond. Try again later.",
+    ),
+    (
+        ("connection",),
+        "Connection Error",
+        "Could not establish connection to the server. Check "
+        "your network or try again later.",
+    ),
+    (
+        ("500", "502", "503", "504"),
+        "Server Error",
+        "The website's server is experiencing issues. Try again later.",
+    ),
+)
+_UNKNOWN_ERROR_CATEGORY = "Unknown Error"
+_UNKNOWN_ERROR_RECOMMENDATION = (
+    "Try accessing the article directly via the source URL below."
+)
+
 
 def set_global_update_mode(update_mode: bool):
     """Set the global update mode flag."""
@@ -120,6 +163,23 @@ def _append_orphan_images(content: str, article_folder_path: str) -> str:
     return content + section
 
 
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write ``data`` to ``path`` with raw ``os`` calls.
+
+    Skips Python-level ``io`` buffering for one-shot writes whose payload
+    is already fully in memory. Loops on ``os.write`` because it may
+    perform a short write on large buffers.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
 def convert_html_with_timeout(
     html_content: str,
     url: str,
@@ -151,9 +211,9 @@ def convert_html_with_timeout(
         This function is thread-safe and can be called concurrently
         from multiple threads without race conditions.
     """
+    processing = get_config().processing
     if timeout is None:
-        from capcat.core.config import get_config
-        timeout = get_config().processing.conversion_timeout
+        timeout = processing.conversion_timeout
 
     logger = get_logger("convert_html_with_timeout")
 
@@ -165,11 +225,12 @@ def convert_html_with_timeout(
     if not html_content:
         return ""
 
-    # Execute conversion in shared thread pool with timeout
+    # Execute conversion in the shared worker pool with timeout
     # Using shared executor prevents nested ThreadPoolExecutor deadlock
+    settings = {name: getattr(processing, name) for name in CONVERSION_SETTINGS}
     executor = get_conversion_executor()
-    future = executor.submit(html_to_markdown, html_content, url)
     try:
+        future = executor.submit(convert_html, html_content, url, settings)
         result = future.result(timeout=timeout)
         return result if result else ""
     except FutureTimeoutError:
@@ -177,6 +238,11 @@ def convert_html_with_timeout(
             f"Conversion timeout after {timeout}s for {url} - skipping"
         )
         return ""
+    except BrokenExecutor as e:
+        # A worker died (e.g. killed for memory); start a fresh pool next time
+        logger.error(f"Conversion pool failed for {url}: {e}")
+        shutdown_conversion_executor(wait=False, executor=executor)
+        return ""
     except Exception as e:
         logger.error(f"Conversion failed for {url}: {e}")
         return ""
@@ -2693,8 +2759,7 @@ class ArticleFetcher(ABC):
 
             # Save PDF with original filename
             pdf_path = os.path.join(article_folder, original_filename)
-            with open(pdf_path, 'wb') as f:
-                f.write(pdf_content)
+            _write_bytes(pdf_path, pdf_content)
 
             self.logger.info(f"Saved PDF file: {pdf_path} ({len(pdf_content)} bytes)")
 
@@ -2711,8 +2776,7 @@ class ArticleFetcher(ABC):
 
             # Save markdown placeholder
             md_path = os.path.join(article_folder, article_md_filename(title))
-            with open(md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            _write_bytes(md_path, markdown_content.encode('utf-8'))
 
             # Generate HTML output if enabled
             if self.generate_html:
@@ -2783,43 +2847,13 @@ class ArticleFetcher(ABC):
             # Determine error category and recommendation
             # Check both error_type and error_details for patterns
             combined_error = f"{error_type} {error_details}".lower()
-            error_category = "Unknown Error"
-            recommendation = (
-                "Try accessing the article directly via the source URL "
-                "below."
-            )
-
-            if "403" in combined_error or "forbidden" in combined_error:
-                error_category = "Access Denied (403 Forbidden)"
-                recommendation = (
-                    "This website restricts automated access. Capcat follows "
-                    "ethical scraping principles and does not bypass access "
-                    "controls."
-                )
-            elif "404" in combined_error or "not found" in combined_error:
-                error_category = "Article Not Found (404)"
-                recommendation = (
-                    "The article may have been removed or the URL is "
-                    "incorrect."
-                )
-            elif "timeout" in combined_error:
-                error_category = "Connection Timeout"
-                recommendation = (
-                    "The server took too long to respond. Try again later."
-                )
-            elif "connection" in combined_error:
-                error_category = "Connection Error"
-                recommendation = (
-                    "Could not establish connection to the server. Check "
-                    "your network or try again later."
-                )
-            elif any(code in combined_error
-                     for code in ["500", "502", "503", "504"]):
-                error_category = "Server Error"
-                recommendation = (
-                    "The website's server is experiencing issues. Try "
-                    "again later."
-                )
+            error_category = _UNKNOWN_ERROR_CATEGORY
+            recommendation = _UNKNOWN_ERROR_RECOMMENDATION
+            for patterns, category, advice in _ERROR_TABLE:
+                if any(p in combined_error for p in patterns):
+                    error_category = category
+                    recommendation = advice
+                    break
 
             # Build error article content
             article_content = f"# {title}\n\n"
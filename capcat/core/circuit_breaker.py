@@ -9,7 +9,7 @@ import threading
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .logging_config import get_logger
 
@@ -348,6 +348,12 @@ class CircuitBreakerPool:
         Returns:
             CircuitBreaker instance for the source
         """
+        # Fast path: existing breakers are never replaced, so a plain dict
+        # read is safe without taking the pool lock.
+        breaker = self.breakers.get(source_code)
+        if breaker is not None:
+            return breaker
+
         with self.lock:
             if source_code not in self.breakers:
                 # Get source-specific config or default
@@ -363,6 +369,15 @@ class CircuitBreakerPool:
 
             return self.breakers[source_code]
 
+    def _snapshot(self) -> List[Tuple[str, CircuitBreaker]]:
+        """Copy the breaker map under the pool lock.
+
+        Callers iterate the copy without holding the pool lock; each
+        breaker guards its own state with its own lock.
+        """
+        with self.lock:
+            return list(self.breakers.items())
+
     def call(self, source_code: str, func: Callable, *args, **kwargs) -> Any:
         """
         Execute function through circuit breaker for a source.
@@ -390,11 +405,10 @@ class CircuitBreakerPool:
         Returns:
             Dictionary mapping source codes to their states
         """
-        with self.lock:
-            return {
-                source: breaker.get_state().value
-                for source, breaker in self.breakers.items()
-            }
+        return {
+            source: breaker.get_state().value
+            for source, breaker in self._snapshot()
+        }
 
     def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -403,18 +417,16 @@ class CircuitBreakerPool:
         Returns:
             Dictionary mapping source codes to their statistics
         """
-        with self.lock:
-            return {
-                source: breaker.get_stats()
-                for source, breaker in self.breakers.items()
-            }
+        return {
+            source: breaker.get_stats()
+            for source, breaker in self._snapshot()
+        }
 
     def reset_all(self):
         """Reset all circuit breakers."""
-        with self.lock:
-            for breaker in self.breakers.values():
-                breaker.reset()
-            logger.info("Reset all circuit breakers")
+        for _, breaker in self._snapshot():
+            breaker.reset()
+        logger.info("Reset all circuit breakers")
 
 
 # Global circuit breaker pool instance
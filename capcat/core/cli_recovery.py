@@ -4,16 +4,66 @@ CLI error recovery and user guidance system.
 """
 
 import sys
+from functools import lru_cache
 from typing import List, Dict, Optional
-from capcat.core.cli_validation import CLIValidator
+
+from capcat.core.cli_validation import FLAG_FIX_PATTERN, SINGLE_DASH_LONG_FLAGS
+
+# Single-dash spellings of long flags; the fix is always one extra dash
+_SUSPICIOUS_FLAGS = frozenset('-' + flag for flag in SINGLE_DASH_LONG_FLAGS)
+
+# Static help blocks, each written to stderr in a single call
+_QUICK_REF = (
+    "\nQuick reference for common flags:\n"
+    "  --html or -H     Generate HTML files\n"
+    "  --verbose or -V  Enable verbose output\n"
+    "  --count N or -c N   Number of articles\n"
+    "  --media or -M    Download media files\n"
+    "  --help or -h     Show help\n"
+)
+_HELP_FETCH = (
+    "  Purpose: Download articles from news sources\n"
+    "  Format:  capcat fetch <sources> [options]\n"
+    "  Example: capcat fetch hn --html --count 10\n"
+)
+_HELP_BUNDLE = (
+    "  Purpose: Download articles from predefined source bundles\n"
+    "  Format:  capcat bundle <bundle_name> [options]\n"
+    "  Example: capcat bundle tech --html --count 15\n"
+)
+_HELP_SINGLE = (
+    "  Purpose: Download a single article from URL\n"
+    "  Format:  capcat single <URL> [options]\n"
+    "  Example: capcat single https://example.com/article --html\n"
+)
+# Alternative commands offered when a command of the given type fails
+_ALT_COMMANDS = {
+    'fetch': (
+        "capcat fetch hn --html",
+        "capcat fetch hn --count 10",
+        "capcat fetch hn --verbose",
+        "capcat list sources  # See available sources",
+    ),
+    'bundle': (
+        "capcat bundle tech --html",
+        "capcat bundle news --count 15",
+        "capcat list bundles  # See available bundles",
+    ),
+    'single': (
+        "capcat single https://example.com/article --html",
+        "capcat single URL --media",
+    ),
+}
+_HELP_BY_CMD = {
+    'fetch': _HELP_FETCH,
+    'bundle': _HELP_BUNDLE,
+    'single': _HELP_SINGLE,
+}
 
 
 class CLIRecovery:
     """System for recovering from CLI errors and guiding users."""
 
-    def __init__(self):
-        self.validator = CLIValidator()
-
     def handle_help_triggered_by_error(self, args: List[str]) -> bool:
         """
         Handle cases where help was triggered by a syntax error.
@@ -24,76 +74,51 @@ class CLIRecovery:
         Returns:
             True if error was detected and handled, False otherwise
         """
-        # Check if help was likely triggered by a flag mistake
-        suspicious_flags = [arg for arg in args if self._is_suspicious_flag(arg)]
-
-        if suspicious_flags:
-            print("\n🔍 It looks like help was displayed due to a flag syntax error!", file=sys.stderr)
-            print("\nDetected issues:", file=sys.stderr)
-
-            for flag in suspicious_flags:
-                suggestion = self._get_flag_suggestion(flag)
-                if suggestion:
-                    print(f"  • '{flag}' should be '{suggestion}'", file=sys.stderr)
-
-            self._show_recovery_options(args)
+        # Check if help was likely triggered by a flag mistake; output is
+        # collected and written to stderr in one call
+        out: List[str] = []
+        for arg in args:
+            if arg in _SUSPICIOUS_FLAGS:
+                if not out:
+                    out.append(
+                        "\n🔍 It looks like help was displayed due to a flag syntax error!\n"
+                        "\nDetected issues:\n"
+                    )
+                out.append(f"  • '{arg}' should be '-{arg}'\n")
+
+        if out:
+            out.extend(self._recovery_option_lines(args))
+            sys.stderr.writelines(out)
             return True
 
         return False
 
     def _is_suspicious_flag(self, arg: str) -> bool:
         """Check if argument looks like a common flag mistake."""
-        suspicious_patterns = [
-            '-html', '-verbose', '-count', '-media', '-output', '-update', '-quiet'
-        ]
-        return arg in suspicious_patterns
+        return arg in _SUSPICIOUS_FLAGS
 
     def _get_flag_suggestion(self, flag: str) -> Optional[str]:
         """Get suggested correction for a flag."""
-        corrections = {
-            '-html': '--html',
-            '-verbose': '--verbose',
-            '-count': '--count',
-            '-media': '--media',
-            '-output': '--output',
-            '-update': '--update',
-            '-quiet': '--quiet'
-        }
-        return corrections.get(flag)
+        return '-' + flag if flag in _SUSPICIOUS_FLAGS else None
 
     def _show_recovery_options(self, args: List[str]):
         """Show recovery options to the user."""
+        sys.stderr.writelines(self._recovery_option_lines(args))
+
+    def _recovery_option_lines(self, args: List[str]) -> List[str]:
+        """Build the recovery-options output as newline-terminated lines."""
         original_command = ' '.join(['capcat'] + args)
         corrected = self._auto_correct_command(original_command)
 
+        lines = []
         if corrected and corrected != original_command:
-            print("\nSuggested correction:", file=sys.stderr)
-            print(f"  {corrected}", file=sys.stderr)
-
-        print("\nQuick reference for common flags:", file=sys.stderr)
-        print("  --html or -H     Generate HTML files", file=sys.stderr)
-        print("  --verbose or -V  Enable verbose output", file=sys.stderr)
-        print("  --count N or -c N   Number of articles", file=sys.stderr)
-        print("  --media or -M    Download media files", file=sys.stderr)
-        print("  --help or -h     Show help", file=sys.stderr)
+            lines.append(f"\nSuggested correction:\n  {corrected}\n")
+        lines.append(_QUICK_REF)
+        return lines
 
     def _auto_correct_command(self, command: str) -> str:
         """Automatically correct common command mistakes."""
-        corrections = {
-            ' -html': ' --html',
-            ' -verbose': ' --verbose',
-            ' -count': ' --count',
-            ' -media': ' --media',
-            ' -output': ' --output',
-            ' -update': ' --update',
-            ' -quiet': ' --quiet'
-        }
-
-        corrected = command
-        for mistake, correction in corrections.items():
-            corrected = corrected.replace(mistake, correction)
-
-        return corrected
+        return FLAG_FIX_PATTERN.sub(r'--\1', command)
 
     def suggest_alternative_commands(self, _failed_command: str, command_type: str) -> List[str]:
         """
@@ -106,30 +131,7 @@ class CLIRecovery:
         Returns:
             List of suggested alternative commands
         """
-        suggestions = []
-
-        if command_type == 'fetch':
-            suggestions.extend([
-                "capcat fetch hn --html",
-                "capcat fetch hn --count 10",
-                "capcat fetch hn --verbose",
-                "capcat list sources  # See available sources"
-            ])
-
-        elif command_type == 'bundle':
-            suggestions.extend([
-                "capcat bundle tech --html",
-                "capcat bundle news --count 15",
-                "capcat list bundles  # See available bundles"
-            ])
-
-        elif command_type == 'single':
-            suggestions.extend([
-                "capcat single https://example.com/article --html",
-                "capcat single URL --media"
-            ])
-
-        return suggestions
+        return list(_ALT_COMMANDS.get(command_type, ()))
 
     def provide_contextual_help(self, command_type: str, _error_context: Dict):
         """
@@ -139,24 +141,17 @@ class CLIRecovery:
             command_type: Type of command that failed
             error_context: Context about what went wrong
         """
-        print(f"\n💡 Help for '{command_type}' command:", file=sys.stderr)
-
-        if command_type == 'fetch':
-            print("  Purpose: Download articles from news sources", file=sys.stderr)
-            print("  Format:  capcat fetch <sources> [options]", file=sys.stderr)
-            print("  Example: capcat fetch hn --html --count 10", file=sys.stderr)
-
-        elif command_type == 'bundle':
-            print("  Purpose: Download articles from predefined source bundles", file=sys.stderr)
-            print("  Format:  capcat bundle <bundle_name> [options]", file=sys.stderr)
-            print("  Example: capcat bundle tech --html --count 15", file=sys.stderr)
+        sys.stderr.write(
+            f"\n💡 Help for '{command_type}' command:\n"
+            f"{_HELP_BY_CMD.get(command_type, '')}"
+            f"\n  Run 'capcat {command_type} --help' for detailed options\n"
+        )
 
-        elif command_type == 'single':
-            print("  Purpose: Download a single article from URL", file=sys.stderr)
-            print("  Format:  capcat single <URL> [options]", file=sys.stderr)
-            print("  Example: capcat single https://example.com/article --html", file=sys.stderr)
 
-        print(f"\n  Run 'capcat {command_type} --help' for detailed options", file=sys.stderr)
+@lru_cache(maxsize=1)
+def _get_recovery() -> CLIRecovery:
+    """Return the shared CLIRecovery; it holds no per-call state."""
+    return CLIRecovery()
 
 
 def handle_cli_error_recovery(args: List[str], command_type: Optional[str] = None) -> bool:
@@ -170,7 +165,7 @@ def handle_cli_error_recovery(args: List[str], command_type: Optional[str] = Non
     Returns:
         True if recovery guidance was provided
     """
-    recovery = CLIRecovery()
+    recovery = _get_recovery()
 
     # Try to handle help triggered by error
     if recovery.handle_help_triggered_by_error(args):
@@ -3,9 +3,70 @@
 Enhanced CLI validation and error handling for better user experience.
 """
 
+import re
 import sys
-from typing import List, Any, Optional
-from difflib import get_close_matches
+from bisect import bisect_left
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Any, Optional, Tuple
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz = None  # type: ignore[assignment]
+    fuzz_process = None  # type: ignore[assignment]
+
+# Long flags users commonly type with a single dash ("-html" for "--html").
+# Every fix is "add one more dash", so one compiled pattern covers them all.
+SINGLE_DASH_LONG_FLAGS = (
+    'html', 'verbose', 'count', 'media', 'output', 'update', 'quiet',
+)
+FLAG_FIX_PATTERN = re.compile(
+    r'(?<=\s)-(' + '|'.join(SINGLE_DASH_LONG_FLAGS) + r')(?=[\s=]|$)'
+)
+
+# Single-dash flags with long names, e.g. " -html" or " -verbose"
+_SINGLE_DASH_LONG_RE = re.compile(r'\s(-[a-zA-Z]{2,})')
+
+
+@lru_cache(maxsize=8)
+def _flag_prefix_index(
+    valid_flags: Tuple[str, ...]
+) -> Tuple[List[str], List[str]]:
+    """Sort flags by their dash-less name for bisect prefix lookups."""
+    entries = sorted((flag.lstrip('-'), flag) for flag in valid_flags)
+    return [name for name, _ in entries], [flag for _, flag in entries]
+
+
+def _prefix_flag_matches(arg: str, valid_flags: List[str]) -> List[str]:
+    """Return up to two flags sharing the first three letters of ``arg``."""
+    prefix = arg.lstrip('-')[:3]
+    if len(prefix) < 3:
+        return []
+    names, flags = _flag_prefix_index(tuple(valid_flags))
+    start = bisect_left(names, prefix)
+    end = start
+    while end < len(names) and names[end].startswith(prefix):
+        end += 1
+    return flags[start:end][:2]
+
+
+def _close_flag_matches(arg: str, candidates: List[str]) -> List[str]:
+    """Return up to two flags similar to ``arg`` (similarity >= 0.6).
+
+    Uses rapidfuzz's C scorer when installed and falls back to difflib,
+    imported here so CLI start-up does not pay for it.
+    """
+    if fuzz_process is not None:
+        return [
+            match for match, _score, _index in fuzz_process.extract(
+                arg, candidates, scorer=fuzz.ratio,
+                limit=2, score_cutoff=60,
+            )
+        ]
+    from difflib import get_close_matches
+
+    return get_close_matches(arg, candidates, n=2, cutoff=0.6)
 
 
 class CLIValidationError(Exception):
@@ -16,21 +77,23 @@ class CLIValidationError(Exception):
 class CLIValidator:
     """Enhanced CLI validation with helpful error messages."""
 
-    def __init__(self):
-        self.common_flag_mistakes = {
-            # Common mistakes mapping to correct flags
-            '-html': '--html or -H',
-            '-verbose': '--verbose or -V',
-            '-count': '--count or -c',
-            '-media': '--media or -M',
-            '-output': '--output or -o',
-            '-update': '--update or -U',
-            '-quiet': '--quiet or -q',
-            '-help': '--help or -h',
-            # Single letter mistakes
-            '-v': '--verbose (note: -v is --version)',
-            '-h': '--help (triggered help display)',
-        }
+    __slots__ = ()
+
+    # Common mistakes mapping to correct flags. Read-only and shared by
+    # every instance, so it is built once at import time.
+    common_flag_mistakes = MappingProxyType({
+        '-html': '--html or -H',
+        '-verbose': '--verbose or -V',
+        '-count': '--count or -c',
+        '-media': '--media or -M',
+        '-output': '--output or -o',
+        '-update': '--update or -U',
+        '-quiet': '--quiet or -q',
+        '-help': '--help or -h',
+        # Single letter mistakes
+        '-v': '--verbose (note: -v is --version)',
+        '-h': '--help (triggered help display)',
+    })
 
     def validate_unknown_args(self, unknown_args: List[str], valid_flags: List[str]) -> None:
         """
@@ -54,8 +117,20 @@ class CLIValidator:
                 if arg in self.common_flag_mistakes:
                     errors.append(f"Invalid flag '{arg}' - did you mean {self.common_flag_mistakes[arg]}?")
                 else:
-                    # Use fuzzy matching to find close matches
-                    close_matches = get_close_matches(arg, valid_flags, n=2, cutoff=0.6)
+                    # Prefix lookup first; fuzzy matching only when no flag
+                    # shares the typed prefix
+                    close_matches = _prefix_flag_matches(arg, valid_flags)
+                    if not close_matches:
+                        # Similarity ratio is at most 2*min(len)/(sum of
+                        # lens), so flags whose length alone rules out 0.6
+                        # are skipped.
+                        arg_len = len(arg)
+                        candidates = [
+                            flag for flag in valid_flags
+                            if 2 * min(len(flag), arg_len)
+                            >= 0.6 * (len(flag) + arg_len)
+                        ]
+                        close_matches = _close_flag_matches(arg, candidates)
                     if close_matches:
                         suggestions = ', '.join(close_matches)
                         errors.append(f"Invalid flag '{arg}' - did you mean: {suggestions}?")
@@ -76,11 +151,14 @@ class CLIValidator:
         Returns:
             List of detected issues with suggestions
         """
+        # Callers join argv with spaces, so no " -" means no flags at all
+        if ' -' not in args_string:
+            return []
+
         issues = []
 
         # Check for single dash with long names
-        import re
-        single_dash_long = re.findall(r'\s(-[a-zA-Z]{2,})', args_string)
+        single_dash_long = _SINGLE_DASH_LONG_RE.findall(args_string)
         for match in single_dash_long:
             if match in self.common_flag_mistakes:
                 issues.append(f"Found '{match}' - use {self.common_flag_mistakes[match]} instead")
@@ -99,24 +177,14 @@ class CLIValidator:
         Returns:
             Suggested corrected command or None
         """
-        corrected = original_command
+        corrected, fixes = FLAG_FIX_PATTERN.subn(r'--\1', original_command)
+        return corrected if fixes else None
 
-        # Apply common corrections
-        corrections = {
-            ' -html': ' --html',
-            ' -verbose': ' --verbose',
-            ' -count': ' --count',
-            ' -media': ' --media',
-            ' -output': ' --output',
-            ' -update': ' --update',
-            ' -quiet': ' --quiet',
-        }
 
-        for mistake, correction in corrections.items():
-            if mistake in corrected:
-                corrected = corrected.replace(mistake, correction)
-
-        return corrected if corrected != original_command else None
+@lru_cache(maxsize=1)
+def _get_validator() -> CLIValidator:
+    """Return the shared CLIValidator; it holds no per-call state."""
+    return CLIValidator()
 
 
 def validate_cli_args(args: Any, command_line: str) -> None:
@@ -130,7 +198,10 @@ def validate_cli_args(args: Any, command_line: str) -> None:
     Raises:
         CLIValidationError: If validation fails
     """
-    validator = CLIValidator()
+    if ' -' not in command_line:
+        return
+
+    validator = _get_validator()
 
     # Check for common flag typos in original command
     issues = validator.detect_flag_typos(command_line)
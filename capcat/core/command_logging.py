@@ -3,18 +3,27 @@
 Enhanced command logging for CLI debugging and audit trail.
 """
 
-import time
 import json
+import logging
+import time
 from typing import Dict, Any, List, Optional
 from capcat.core.logging_config import get_logger
 
 
+def _format_raw_command(raw_args: List[str]) -> str:
+    """Render raw CLI arguments as the full 'capcat ...' command line."""
+    return "capcat " + " ".join(raw_args) if raw_args else "capcat"
+
+
 class CommandLogger:
     """Logger for CLI command execution and debugging."""
 
+    __slots__ = ("logger", "session_start")
+
     def __init__(self):
         self.logger = get_logger("cli_commands")
-        self.session_start = time.time()
+        # Monotonic so session_time is immune to wall-clock adjustments
+        self.session_start = time.monotonic()
 
     def log_command_start(self, command: str, args: Dict[str, Any], raw_args: List[str]):
         """
@@ -25,23 +34,31 @@ class CommandLogger:
             args: Parsed arguments dictionary
             raw_args: Raw command line arguments
         """
+        logger = self.logger
+        # DEBUG sits below INFO, so nothing here is emitted when INFO is off
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        raw_command = _format_raw_command(raw_args)
         context = {
             "event": "command_start",
             "command": command,
             "parsed_args": args,
-            "raw_command": " ".join(["capcat"] + raw_args),
+            "raw_command": raw_command,
             "timestamp": time.time(),
-            "session_time": time.time() - self.session_start
+            "session_time": time.monotonic() - self.session_start
         }
 
-        self.logger.info(
+        logger.info(
             f"Command started: {command}",
             extra={"cli_context": context}
         )
 
-        # Also log to debug for troubleshooting
-        self.logger.debug(f"Raw command line: {' '.join(['capcat'] + raw_args)}")
-        self.logger.debug(f"Parsed arguments: {json.dumps(args, indent=2)}")
+        # Also log to debug for troubleshooting; the JSON dump walks the
+        # whole args dict, so only build it when DEBUG records are kept
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Raw command line: {raw_command}")
+            logger.debug(f"Parsed arguments: {json.dumps(args, indent=2)}")
 
     def log_command_end(self, command: str, success: bool, duration: float,
                        error: Optional[str] = None):
@@ -54,25 +71,29 @@ class CommandLogger:
             duration: Execution duration in seconds
             error: Error message if failed
         """
+        logger = self.logger
+        level = logging.INFO if success else logging.ERROR
+        if not logger.isEnabledFor(level):
+            return
+
         context = {
             "event": "command_end",
             "command": command,
             "success": success,
             "duration": duration,
             "timestamp": time.time(),
-            "session_time": time.time() - self.session_start
+            "session_time": time.monotonic() - self.session_start
         }
 
         if error:
             context["error"] = error
 
-        level = "info" if success else "error"
         message = f"Command {'completed' if success else 'failed'}: {command} ({duration:.2f}s)"
 
         if error:
             message += f" - {error}"
 
-        getattr(self.logger, level)(message, extra={"cli_context": context})
+        logger.log(level, message, extra={"cli_context": context})
 
     def log_argument_error(self, command: str, error_type: str, error_message: str,
                           raw_args: List[str], suggestions: Optional[List[str]] = None):
@@ -86,18 +107,22 @@ class CommandLogger:
             raw_args: Raw command line arguments
             suggestions: Suggested corrections
         """
+        logger = self.logger
+        if not logger.isEnabledFor(logging.WARNING):
+            return
+
         context = {
             "event": "argument_error",
             "command": command,
             "error_type": error_type,
             "error_message": error_message,
-            "raw_command": " ".join(["capcat"] + raw_args),
+            "raw_command": _format_raw_command(raw_args),
             "suggestions": suggestions or [],
             "timestamp": time.time(),
-            "session_time": time.time() - self.session_start
+            "session_time": time.monotonic() - self.session_start
         }
 
-        self.logger.warning(
+        logger.warning(
             f"Argument error in {command}: {error_type} - {error_message}",
             extra={"cli_context": context}
         )
@@ -110,26 +135,33 @@ class CommandLogger:
             command: Command name (None for main help)
             trigger_reason: Why help was shown (e.g., 'help_flag', 'invalid_syntax')
         """
+        logger = self.logger
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         context = {
             "event": "help_displayed",
             "command": command,
             "trigger_reason": trigger_reason,
             "timestamp": time.time(),
-            "session_time": time.time() - self.session_start
+            "session_time": time.monotonic() - self.session_start
         }
 
-        self.logger.info(
+        logger.info(
             f"Help displayed for {command or 'main'}: {trigger_reason}",
             extra={"cli_context": context}
         )
 
 
-# Global command logger instance
-_command_logger = CommandLogger()
+# Global command logger instance, created on first use
+_command_logger: Optional[CommandLogger] = None
 
 
 def get_command_logger() -> CommandLogger:
     """Get the global command logger instance."""
+    global _command_logger
+    if _command_logger is None:
+        _command_logger = CommandLogger()
     return _command_logger
 
 
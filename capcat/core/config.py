@@ -6,15 +6,27 @@ Handles settings from config files, environment variables, and CLI overrides.
 
 import json
 import os
-from dataclasses import asdict, dataclass, fields
+import pickle
+import sys
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-
+from . import disk_cache
 from .logging_config import get_logger
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Config objects are read on hot paths; slots (Python 3.10+) make attribute
+# access cheaper and instances smaller. On 3.9 they stay __dict__-backed.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class NetworkConfig:
     """Network-related configuration settings."""
 
@@ -41,7 +53,7 @@ class NetworkConfig:
     robots_cache_ttl_minutes: int = 15
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProcessingConfig:
     """Processing-related configuration settings."""
 
@@ -76,7 +88,7 @@ class ProcessingConfig:
     markdown_line_breaks: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class UIConfig:
     """User interface and experience configuration settings."""
 
@@ -87,7 +99,7 @@ class UIConfig:
 
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LoggingConfig:
     """Logging-related configuration settings."""
 
@@ -102,7 +114,7 @@ class LoggingConfig:
     log_file_backup_count: int = 5
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PdfConfig:
     """PDF download configuration settings."""
 
@@ -111,7 +123,7 @@ class PdfConfig:
     global_deduplication: bool = False  # Prevent same PDF URL from being downloaded multiple times across articles
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MediaConfig:
     """Per-session media download toggles.
 
@@ -127,13 +139,103 @@ class MediaConfig:
     download_documents: bool = False
 
 
+@lru_cache(maxsize=1)
+def _yaml_codecs() -> Optional[tuple]:
+    """Import PyYAML on first use.
+
+    Returns (yaml, SafeLoader, SafeDumper), preferring libyaml's C
+    implementations, or None when PyYAML is not installed.
+    """
+    try:
+        import yaml
+    except ImportError:
+        return None
+    try:
+        from yaml import CSafeDumper as dumper
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeDumper as dumper
+        from yaml import SafeLoader as loader
+    return yaml, loader, dumper
+
+
+# Parsed config files are pickled in the disk cache, keyed by path, mtime and
+# size, so an unchanged file is not re-parsed on the next run. One file is
+# kept per config path; only the most recent _CONFIG_CACHE_LIMIT survive.
+_CONFIG_CACHE_MISS = object()
+_CONFIG_CACHE_LIMIT = 32
+
+
+def _config_cache_file(resolved_path: str) -> Path:
+    """Return the cache file used for the config file at resolved_path."""
+    return disk_cache.cache_file("config-{digest}.pkl", resolved_path)
+
+
+def _read_config_cache(key: tuple) -> Any:
+    """Return cached parsed data for key, or _CONFIG_CACHE_MISS."""
+    if disk_cache.caching_disabled():
+        return _CONFIG_CACHE_MISS
+    try:
+        with open(_config_cache_file(key[0]), "rb") as f:
+            cached_key, data = pickle.load(f)
+    except Exception:
+        return _CONFIG_CACHE_MISS
+    return data if cached_key == key else _CONFIG_CACHE_MISS
+
+
+def _write_config_cache(key: tuple, data: Any) -> None:
+    """Atomically store parsed data for key; failures are ignored."""
+    if disk_cache.caching_disabled():
+        return
+    cache_file = _config_cache_file(key[0])
+    try:
+        disk_cache.write_atomic(
+            cache_file,
+            pickle.dumps((key, data), protocol=pickle.HIGHEST_PROTOCOL),
+        )
+    except Exception:
+        return
+    disk_cache.prune(cache_file.parent, "config-*.pkl", _CONFIG_CACHE_LIMIT)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls) -> tuple:
+    """Return the dataclass field names of cls in declaration order."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _load_yaml(raw: bytes) -> Any:
+    """Parse YAML config file contents."""
+    codecs = _yaml_codecs()
+    if codecs is None:
+        raise ImportError("PyYAML not installed, cannot load YAML config files")
+    yaml, loader, _ = codecs
+    return yaml.load(raw, Loader=loader)
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse JSON config file contents, with orjson when available."""
+    return _orjson.loads(raw) if _orjson else json.loads(raw)
+
+
+# Config file parsers by lower-cased suffix
+_LOADERS = {".yml": _load_yaml, ".yaml": _load_yaml, ".json": _load_json}
+
+
 def _filter_fields(cls, data: dict) -> dict:
     """Return only keys that are known fields on the dataclass cls."""
-    known = {f.name for f in fields(cls)}
+    known = _field_names(cls)
     return {k: v for k, v in data.items() if k in known}
 
 
-@dataclass
+def _section_dict(section) -> Dict[str, Any]:
+    """Return a flat field-name -> value dict for a section config."""
+    return {
+        name: getattr(section, name) for name in _field_names(type(section))
+    }
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class FetchNewsConfig:
     """Main configuration class containing all settings."""
 
@@ -169,28 +271,116 @@ class FetchNewsConfig:
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary.
 
+        Section configs hold only primitive values, so a flat copy of
+        each is enough; asdict() would deep-copy every field.
+
         Returns:
             Dictionary representation of full configuration
         """
-        return asdict(self)
+        return {
+            "network": _section_dict(self.network),
+            "processing": _section_dict(self.processing),
+            "logging": _section_dict(self.logging),
+            "ui": _section_dict(self.ui),
+            "pdf": _section_dict(self.pdf),
+            "media": _section_dict(self.media),
+            "source_overrides": {
+                name: dict(overrides)
+                for name, overrides in self.source_overrides.items()
+            },
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "FetchNewsConfig":
         """Create configuration from dictionary.
 
         Args:
-            data: Dictionary with network, processing, logging, ui, pdf sections
+            data: Dictionary with network, processing, logging, ui, pdf,
+                media sections
 
         Returns:
             New FetchNewsConfig instance
         """
-        return cls(
-            network=NetworkConfig(**_filter_fields(NetworkConfig, data.get("network", {}))),
-            processing=ProcessingConfig(**_filter_fields(ProcessingConfig, data.get("processing", {}))),
-            logging=LoggingConfig(**_filter_fields(LoggingConfig, data.get("logging", {}))),
-            ui=UIConfig(**_filter_fields(UIConfig, data.get("ui", {}))),
-            pdf=PdfConfig(**_filter_fields(PdfConfig, data.get("pdf", {}))),
-        )
+        cfg = cls()
+        for section_name in _SECTION_FIELDS:
+            section_data = data.get(section_name)
+            if section_data:
+                cls._apply(
+                    getattr(cfg, section_name), section_name, section_data
+                )
+        return cfg
+
+    @staticmethod
+    def _apply(section, section_name: str, section_data: Dict[str, Any]):
+        """Set known fields of section from section_data; ignore the rest."""
+        known = _SECTION_FIELDS[section_name]
+        for key, value in section_data.items():
+            if key in known:
+                setattr(section, key, value)
+
+
+# CAPCAT_* environment variables: (name, section, key, type)
+_ENV_MAPPINGS = (
+    # Network settings
+    ("CAPCAT_CONNECT_TIMEOUT", "network", "connect_timeout", int),
+    ("CAPCAT_READ_TIMEOUT", "network", "read_timeout", int),
+    ("CAPCAT_MEDIA_TIMEOUT", "network", "media_download_timeout", int),
+    ("CAPCAT_HEAD_TIMEOUT", "network", "head_request_timeout", int),
+    ("CAPCAT_POOL_CONNECTIONS", "network", "pool_connections", int),
+    ("CAPCAT_POOL_MAXSIZE", "network", "pool_maxsize", int),
+    ("CAPCAT_USER_AGENT", "network", "user_agent", str),
+    ("CAPCAT_MAX_RETRIES", "network", "max_retries", int),
+    ("CAPCAT_RETRY_DELAY", "network", "retry_delay", float),
+    # Processing settings
+    ("CAPCAT_MAX_WORKERS", "processing", "max_workers", int),
+    ("CAPCAT_MAX_FILENAME_LENGTH", "processing", "max_filename_length", int),
+    ("CAPCAT_DOWNLOAD_IMAGES", "processing", "download_images", bool),
+    ("CAPCAT_DOWNLOAD_VIDEOS", "processing", "download_videos", bool),
+    ("CAPCAT_DOWNLOAD_AUDIO", "processing", "download_audio", bool),
+    ("CAPCAT_DOWNLOAD_DOCUMENTS", "processing", "download_documents", bool),
+    # Logging settings
+    ("CAPCAT_LOG_LEVEL", "logging", "default_level", str),
+    # PDF settings
+    ("CAPCAT_PDF_MAX_SIZE", "pdf", "max_pdf_size_bytes", int),
+    ("CAPCAT_PDF_MAX_PER_ARTICLE", "pdf", "max_pdf_per_article", int),
+    ("CAPCAT_PDF_GLOBAL_DEDUP", "pdf", "global_deduplication", bool),
+)
+
+# Env var name -> (section, key, type) for a single pass over os.environ
+_ENV_INDEX = {
+    env_var: (section, key, type_func)
+    for env_var, section, key, type_func in _ENV_MAPPINGS
+}
+
+# Default config file names per search directory, JSON first
+_LOCAL_CONFIG_NAMES = ("capcat.json", "capcat.yml", "capcat.yaml")
+# The vault's Config/ directory only ever held YAML settings
+_VAULT_CONFIG_NAMES = ("capcat.yml", "capcat.yaml")
+_SYSTEM_CONFIG_NAMES = ("config.json", "config.yml", "config.yaml")
+
+# Field names per config section, so merging is a set lookup per key
+_SECTION_FIELDS = {
+    name: frozenset(_field_names(cls))
+    for name, cls in (
+        ("network", NetworkConfig),
+        ("processing", ProcessingConfig),
+        ("logging", LoggingConfig),
+        ("ui", UIConfig),
+        ("pdf", PdfConfig),
+        ("media", MediaConfig),
+    )
+}
+
+# Accepted spellings of a true boolean environment value
+_BOOL_TRUE = frozenset(("true", "1", "yes", "on", "t", "y"))
+
+# Environment value parsers by mapped field type
+_CONVERTERS = {
+    int: int,
+    float: float,
+    str: str,
+    bool: lambda value: value.lower() in _BOOL_TRUE,
+}
 
 
 class ConfigManager:
@@ -207,11 +397,13 @@ class ConfigManager:
     def __init__(self):
         """Initialize the configuration manager.
 
-        Creates default configuration and sets load status to false.
+        Creates default configuration; nothing is marked loaded yet.
         """
         self.logger = get_logger(__name__)
         self._config = FetchNewsConfig()
-        self._config_loaded = False
+        # Set to the loaded config once load_config() completes, so the
+        # get_config() fast path is a single attribute load
+        self._loaded_config: Optional[FetchNewsConfig] = None
 
     def _load_settings_file(self, path: Path) -> None:
         """Load a Global-settings.yaml file and merge into current config.
@@ -221,8 +413,10 @@ class ConfigManager:
         if not path.exists():
             return
         try:
-            import yaml
-            data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+            yaml, loader, _ = _yaml_codecs()
+            data = yaml.load(
+                path.read_text(encoding="utf-8"), Loader=loader
+            ) or {}
         except Exception as e:
             self.logger.warning(f"Failed to read settings file {path}: {e}")
             return
@@ -253,10 +447,12 @@ class ConfigManager:
         Returns:
             Loaded configuration instance
         """
-        if self._config_loaded:
-            return self._config
+        if self._loaded_config is not None:
+            return self._loaded_config
 
-        # Start with defaults
+        # Start with defaults. Constructing them directly is cheaper than
+        # copy.copy() of a prebuilt template: slotted dataclasses copy via
+        # __reduce_ex__, which costs far more than the generated __init__.
         self._config = FetchNewsConfig()
 
         # Load Global-settings.yaml from user-level then vault-level (unconditional)
@@ -276,35 +472,46 @@ class ConfigManager:
         if load_env:
             self._load_from_env()
 
-        self._config_loaded = True
+        self._loaded_config = self._config
         return self._config
 
     def _load_default_config_files(self):
         """Load from default config file locations.
 
         Searches in order: local dir, ~/.config/capcat/, /etc/capcat/.
-        Stops at first found file.
+        Within a directory JSON is tried before YAML because it parses
+        much faster. Stops at first found file.
         """
-        # Look for config files in order of preference
-        config_locations = [
-            "Config/capcat.yml",
-            "Config/capcat.yaml",
-            "capcat.yml",
-            "capcat.yaml",
-            "capcat.json",
-            os.path.expanduser("~/.config/capcat/config.yml"),
-            os.path.expanduser("~/.config/capcat/config.yaml"),
-            os.path.expanduser("~/.config/capcat/config.json"),
-            "/etc/capcat/config.yml",
-            "/etc/capcat/config.yaml",
-            "/etc/capcat/config.json",
-        ]
-
-        for config_path in config_locations:
-            if os.path.isfile(config_path):
+        # Directories in order of preference, each with its candidate
+        # file names; one scandir per directory replaces a stat per file
+        search_dirs = (
+            ("Config", _VAULT_CONFIG_NAMES),
+            (".", _LOCAL_CONFIG_NAMES),
+            (os.path.expanduser("~/.config/capcat"), _SYSTEM_CONFIG_NAMES),
+            ("/etc/capcat", _SYSTEM_CONFIG_NAMES),
+        )
+
+        for directory, names in search_dirs:
+            try:
+                with os.scandir(directory) as it:
+                    present = {e.name for e in it if e.is_file()}
+            except OSError:
+                continue
+
+            for name in names:
+                if name not in present:
+                    continue
+                config_path = (
+                    name if directory == "." else os.path.join(directory, name)
+                )
                 self.logger.debug(f"Found config file: {config_path}")
+                if not name.endswith(".json"):
+                    self.logger.debug(
+                        f"Loading YAML config {config_path}; a JSON config "
+                        f"in the same directory is preferred and loads faster"
+                    )
                 self._load_from_file(config_path)
-                break
+                return
 
     def _load_from_file(self, config_file: str):
         """Load configuration from a file.
@@ -316,29 +523,29 @@ class ConfigManager:
         """
         try:
             config_path = Path(config_file)
-            if not config_path.exists():
-                self.logger.warning(f"Config file not found: {config_file}")
+            parse = _LOADERS.get(config_path.suffix.lower())
+            if parse is None:
+                self.logger.error(
+                    f"Unsupported config file format: {config_path.suffix}"
+                )
                 return
 
-            with open(config_path, "r", encoding="utf-8") as f:
-                if config_path.suffix.lower() in [".yml", ".yaml"]:
-                    try:
-                        import yaml
-
-                        data = yaml.safe_load(f)
-                    except ImportError:
-                        self.logger.error(
-                            "PyYAML not installed, cannot load YAML "
-                            "config files"
-                        )
-                        return
-                elif config_path.suffix.lower() == ".json":
-                    data = json.load(f)
-                else:
-                    self.logger.error(
-                        f"Unsupported config file format: {config_path.suffix}"
-                    )
-                    return
+            # open() already fails on a missing file, and fstat on the open
+            # descriptor gives the cache key without a second path lookup
+            try:
+                f = open(config_path, "rb")
+            except FileNotFoundError:
+                self.logger.warning(f"Config file not found: {config_file}")
+                return
+            with f:
+                stat = os.fstat(f.fileno())
+                cache_key = (
+                    str(config_path.resolve()), stat.st_mtime_ns, stat.st_size
+                )
+                data = _read_config_cache(cache_key)
+                if data is _CONFIG_CACHE_MISS:
+                    data = parse(f.read())
+                    _write_config_cache(cache_key, data)
 
             # Merge loaded data with current config
             self._merge_config_data(data)
@@ -353,81 +560,28 @@ class ConfigManager:
         Maps CAPCAT_* environment variables to configuration settings.
         Handles type conversion for int, float, bool, and str types.
         """
-        env_mappings = {
-            # Network settings
-            "CAPCAT_CONNECT_TIMEOUT": (
-                "network", "connect_timeout", int
-            ),
-            "CAPCAT_READ_TIMEOUT": ("network", "read_timeout", int),
-            "CAPCAT_MEDIA_TIMEOUT": (
-                "network", "media_download_timeout", int
-            ),
-            "CAPCAT_HEAD_TIMEOUT": (
-                "network", "head_request_timeout", int
-            ),
-            "CAPCAT_POOL_CONNECTIONS": ("network", "pool_connections", int),
-            "CAPCAT_POOL_MAXSIZE": ("network", "pool_maxsize", int),
-            "CAPCAT_USER_AGENT": ("network", "user_agent", str),
-            "CAPCAT_MAX_RETRIES": ("network", "max_retries", int),
-            "CAPCAT_RETRY_DELAY": ("network", "retry_delay", float),
-            # Processing settings
-            "CAPCAT_MAX_WORKERS": ("processing", "max_workers", int),
-            "CAPCAT_MAX_FILENAME_LENGTH": (
-                "processing",
-                "max_filename_length",
-                int,
-            ),
-            "CAPCAT_DOWNLOAD_IMAGES": (
-                "processing",
-                "download_images",
-                bool,
-            ),
-            "CAPCAT_DOWNLOAD_VIDEOS": (
-                "processing",
-                "download_videos",
-                bool,
-            ),
-            "CAPCAT_DOWNLOAD_AUDIO": ("processing", "download_audio", bool),
-            "CAPCAT_DOWNLOAD_DOCUMENTS": (
-                "processing",
-                "download_documents",
-                bool,
-            ),
-            # Logging settings
-            "CAPCAT_LOG_LEVEL": ("logging", "default_level", str),
-            # PDF settings
-            "CAPCAT_PDF_MAX_SIZE": ("pdf", "max_pdf_size_bytes", int),
-            "CAPCAT_PDF_MAX_PER_ARTICLE": ("pdf", "max_pdf_per_article", int),
-            "CAPCAT_PDF_GLOBAL_DEDUP": ("pdf", "global_deduplication", bool),
-        }
-
-        for env_var, (section, key, type_func) in env_mappings.items():
-            value = os.getenv(env_var)
-            if value is not None:
-                try:
-                    if type_func is bool:
-                        # Handle boolean environment variables
-                        converted_value = value.lower() in (
-                            "true",
-                            "1",
-                            "yes",
-                            "on",
-                        )
-                    else:
-                        converted_value = type_func(value)
-
-                    # Set the value in the config
-                    section_obj = getattr(self._config, section)
-                    setattr(section_obj, key, converted_value)
-                    self.logger.debug(
-                        f"Set {section}.{key} = {converted_value} "
-                        f"from {env_var}"
-                    )
-
-                except (ValueError, TypeError) as e:
-                    self.logger.warning(
-                        f"Invalid value for {env_var}: {value} ({e})"
-                    )
+        # One pass over the environment; only variables that are actually
+        # set and mapped cost more than a dict miss
+        for env_var, value in os.environ.items():
+            spec = _ENV_INDEX.get(env_var)
+            if spec is None:
+                continue
+            section, key, type_func = spec
+            try:
+                converted_value = _CONVERTERS[type_func](value)
+
+                # Set the value in the config
+                section_obj = getattr(self._config, section)
+                setattr(section_obj, key, converted_value)
+                self.logger.debug(
+                    "Set %s.%s = %s from %s",
+                    section, key, converted_value, env_var,
+                )
+
+            except (ValueError, TypeError) as e:
+                self.logger.warning(
+                    f"Invalid value for {env_var}: {value} ({e})"
+                )
 
     def _merge_config_data(self, data: Dict[str, Any]):
         """Merge configuration data into current config.
@@ -452,7 +606,7 @@ class ConfigManager:
                     if overrides:
                         self._config.source_overrides[name] = overrides
                         self.logger.debug(
-                            f"Vault source override: {name} = {overrides}"
+                            "Vault source override: %s = %s", name, overrides
                         )
 
         # First pass: merge all sections except media.
@@ -460,20 +614,22 @@ class ConfigManager:
         for section_name, section_data in data.items():
             if section_name in ("sources", "bundles", "media"):
                 continue
-            if hasattr(self._config, section_name) and isinstance(
-                section_data, dict
-            ):
+            known = _SECTION_FIELDS.get(section_name)
+            if known is not None and isinstance(section_data, dict):
+                # Split keys with set operations; sections may be slotted,
+                # so known keys are assigned with setattr, not __dict__
+                keys = section_data.keys()
+                for key in sorted(keys - known, key=str):
+                    self.logger.warning(
+                        f"Unknown config key: {section_name}.{key}"
+                    )
                 section_obj = getattr(self._config, section_name)
-                for key, value in section_data.items():
-                    if hasattr(section_obj, key):
-                        setattr(section_obj, key, value)
-                        self.logger.debug(
-                            f"Set {section_name}.{key} = {value}"
-                        )
-                    else:
-                        self.logger.warning(
-                            f"Unknown config key: {section_name}.{key}"
-                        )
+                for key in keys & known:
+                    value = section_data[key]
+                    setattr(section_obj, key, value)
+                    self.logger.debug(
+                        "Set %s.%s = %s", section_name, key, value
+                    )
             else:
                 self.logger.warning(f"Unknown config section: {section_name}")
 
@@ -481,13 +637,15 @@ class ConfigManager:
         # ProcessingConfig always win over any processing: values above.
         media_data = data.get("media")
         if isinstance(media_data, dict):
+            media_fields = _SECTION_FIELDS["media"]
+            processing_fields = _SECTION_FIELDS["processing"]
             for key, value in media_data.items():
-                if hasattr(self._config.media, key):
+                if key in media_fields:
                     setattr(self._config.media, key, value)
-                    self.logger.debug(f"Set media.{key} = {value}")
+                    self.logger.debug("Set media.%s = %s", key, value)
                 else:
                     self.logger.warning(f"Unknown config key: media.{key}")
-                if key.startswith("download_") and hasattr(self._config.processing, key):
+                if key.startswith("download_") and key in processing_fields:
                     # media False always wins; media True only syncs if processing
                     # is already True - prevents overwriting an explicit False set
                     # in the processing: section of the same file.
@@ -500,18 +658,17 @@ class ConfigManager:
         Returns:
             Current configuration instance
         """
-        if not self._config_loaded:
-            return self.load_config()
-        return self._config
+        config = self._loaded_config
+        return config if config is not None else self.load_config()
 
-    def save_config(self, config_file: str, format: str = "yaml"):
+    def save_config(self, config_file: str, format: str = "json"):
         """Save current configuration to a file.
 
         Creates parent directories if needed. Supports YAML and JSON formats.
 
         Args:
             config_file: Path to save configuration
-            format: Output format - 'yaml', 'yml', or 'json'
+            format: Output format - 'json' (default), 'yaml', or 'yml'
 
         Returns:
             True if saved successfully, False otherwise
@@ -522,24 +679,33 @@ class ConfigManager:
 
             data = self._config.to_dict()
 
-            with open(config_path, "w", encoding="utf-8") as f:
-                if format.lower() in ["yml", "yaml"]:
-                    try:
-                        import yaml
-
-                        yaml.safe_dump(
-                            data, f, default_flow_style=False, indent=2
-                        )
-                    except ImportError:
-                        self.logger.error(
-                            "PyYAML not installed, cannot save YAML config"
-                        )
-                        return False
-                elif format.lower() == "json":
-                    json.dump(data, f, indent=2)
-                else:
-                    self.logger.error(f"Unsupported config format: {format}")
+            fmt = format.lower()
+            if fmt in ["yml", "yaml"]:
+                codecs = _yaml_codecs()
+                if codecs is None:
+                    self.logger.error(
+                        "PyYAML not installed, cannot save YAML config"
+                    )
                     return False
+                yaml, _, dumper = codecs
+                with open(config_path, "w", encoding="utf-8") as f:
+                    yaml.dump(
+                        data,
+                        f,
+                        Dumper=dumper,
+                        default_flow_style=False,
+                        indent=2,
+                    )
+            elif fmt == "json":
+                if _orjson:
+                    with open(config_path, "wb") as f:
+                        f.write(_orjson.dumps(data, option=_orjson.OPT_INDENT_2))
+                else:
+                    with open(config_path, "w", encoding="utf-8") as f:
+                        json.dump(data, f, indent=2)
+            else:
+                self.logger.error(f"Unsupported config format: {format}")
+                return False
 
             self.logger.info(f"Saved configuration to: {config_file}")
             return True
@@ -549,8 +715,16 @@ class ConfigManager:
             return False
 
 
-# Global configuration manager instance
-_config_manager = ConfigManager()
+# Global configuration manager instance, created on first use
+_config_manager: Optional[ConfigManager] = None
+
+
+def _get_manager() -> ConfigManager:
+    """Return the global ConfigManager, creating it on first call."""
+    global _config_manager
+    if _config_manager is None:
+        _config_manager = ConfigManager()
+    return _config_manager
 
 
 def get_config() -> FetchNewsConfig:
@@ -559,7 +733,11 @@ def get_config() -> FetchNewsConfig:
     Returns:
         Global configuration object (singleton)
     """
-    return _config_manager.get_config()
+    manager = _config_manager
+    if manager is None:
+        manager = _get_manager()
+    config = manager._loaded_config
+    return config if config is not None else manager.load_config()
 
 
 def load_config(
@@ -576,19 +754,19 @@ def load_config(
     Returns:
         Loaded configuration instance
     """
-    return _config_manager.load_config(config_file, load_env)
+    return _get_manager().load_config(config_file, load_env)
 
 
-def save_config(config_file: str, format: str = "yaml") -> bool:
+def save_config(config_file: str, format: str = "json") -> bool:
     """Save current configuration to a file.
 
     Module-level convenience function for global config manager.
 
     Args:
         config_file: Path to save configuration
-        format: Output format - 'yaml', 'yml', or 'json'
+        format: Output format - 'json' (default), 'yaml', or 'yml'
 
     Returns:
         True if saved successfully, False otherwise
     """
-    return _config_manager.save_config(config_file, format)
+    return _get_manager().save_config(config_file, format)
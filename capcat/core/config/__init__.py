@@ -41,120 +41,35 @@ from .source_registry import (
 # Import original config functions for backward compatibility.
 # capcat.core.config is this package, so we cannot use a relative import to
 # reach capcat/core/config.py (it would resolve circularly back to this
-# __init__).  Load the .py file explicitly via importlib instead.
+# __init__).  Load the .py file explicitly via importlib instead.  A failure
+# here is a real bug, so it propagates rather than falling back to defaults.
 _CONFIG_PY = Path(__file__).parent.parent / "config.py"
 _config_impl_name = "capcat.core._config_impl"
 
-try:
-    if _CONFIG_PY.exists() and _config_impl_name not in sys.modules:
-        _spec = importlib.util.spec_from_file_location(_config_impl_name, str(_CONFIG_PY))
-        _mod = importlib.util.module_from_spec(_spec)
-        sys.modules[_config_impl_name] = _mod
+if _config_impl_name not in sys.modules:
+    _spec = importlib.util.spec_from_file_location(_config_impl_name, str(_CONFIG_PY))
+    _mod = importlib.util.module_from_spec(_spec)
+    sys.modules[_config_impl_name] = _mod
+    try:
         _spec.loader.exec_module(_mod)
-
-    _impl = sys.modules[_config_impl_name]
-    FetchNewsConfig = _impl.FetchNewsConfig
-    LoggingConfig = _impl.LoggingConfig
-    MediaConfig = _impl.MediaConfig
-    NetworkConfig = _impl.NetworkConfig
-    PdfConfig = _impl.PdfConfig
-    ProcessingConfig = _impl.ProcessingConfig
-    UIConfig = _impl.UIConfig
-    _filter_fields = _impl._filter_fields
-    ConfigManager = _impl.ConfigManager
-    get_config = _impl.get_config
-    load_config = _impl.load_config
-    save_config = _impl.save_config
-except (ImportError, FileNotFoundError):
-    # Fallback if the original config module isn't available
-    def get_config():
-        """Fallback get_config function."""
-
-        class FallbackConfig:
-            """Minimal hard-coded defaults used when capcat.yml is absent."""
-
-            class network:
-                """Network timeout and connection pool defaults."""
-                connect_timeout = 10
-                read_timeout = 8
-                media_download_timeout = 10
-                head_request_timeout = 3
-                pool_connections = 20
-                pool_maxsize = 20
-                user_agent = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-                max_retries = 3
-                retry_delay = 1.0
-
-            class processing:
-                """Article processing and media download defaults."""
-                max_workers = 8
-                max_filename_length = 100
-                remove_style_tags = True
-                remove_nav_tags = True
-                download_images = True
-                download_videos = True
-                download_audio = True
-                download_documents = True
-
-            class logging:
-                """Logging output defaults."""
-                default_level = "INFO"
-
-            def to_dict(self):
-                """Convert config to dictionary format for compatibility."""
-                return {
-                    "network": {
-                        "connect_timeout": self.network.connect_timeout,
-                        "read_timeout": self.network.read_timeout,
-                        "media_download_timeout": self.network.media_download_timeout,
-                        "head_request_timeout": self.network.head_request_timeout,
-                        "pool_connections": self.network.pool_connections,
-                        "pool_maxsize": self.network.pool_maxsize,
-                        "user_agent": self.network.user_agent,
-                        "max_retries": self.network.max_retries,
-                        "retry_delay": self.network.retry_delay,
-                    },
-                    "processing": {
-                        "max_workers": self.processing.max_workers,
-                        "max_filename_length": self.processing.max_filename_length,
-                        "remove_style_tags": self.processing.remove_style_tags,
-                        "remove_nav_tags": self.processing.remove_nav_tags,
-                        "download_images": self.processing.download_images,
-                        "download_videos": self.processing.download_videos,
-                        "download_audio": self.processing.download_audio,
-                        "download_documents": self.processing.download_documents,
-                    },
-                    "logging": {
-                        "default_level": self.logging.default_level,
-                    },
-                }
-
-        return FallbackConfig()
-
-    load_config = get_config
-    def save_config(x, _="yaml"):
-        return True
-
-    class FetchNewsConfig:
-        """Stub for FetchNewsConfig when the main config module is unavailable."""
-
-    class NetworkConfig:
-        """Stub for NetworkConfig when the main config module is unavailable."""
-
-    class ProcessingConfig:
-        """Stub for ProcessingConfig when the main config module is unavailable."""
-
-    class LoggingConfig:
-        """Stub for LoggingConfig when the main config module is unavailable."""
-
-    class UIConfig:
-        """Stub for UIConfig when the main config module is unavailable."""
-
-    class MediaConfig:
-        """Stub for MediaConfig when the main config module is unavailable."""
-
-    class PdfConfig:
-        """Stub for PdfConfig when the main config module is unavailable."""
+    except BaseException:
+        # Don't leave a half-initialised module behind for the next import
+        del sys.modules[_config_impl_name]
+        raise
+
+_impl = sys.modules[_config_impl_name]
+FetchNewsConfig = _impl.FetchNewsConfig
+LoggingConfig = _impl.LoggingConfig
+MediaConfig = _impl.MediaConfig
+NetworkConfig = _impl.NetworkConfig
+PdfConfig = _impl.PdfConfig
+ProcessingConfig = _impl.ProcessingConfig
+UIConfig = _impl.UIConfig
+_filter_fields = _impl._filter_fields
+ConfigManager = _impl.ConfigManager
+get_config = _impl.get_config
+load_config = _impl.load_config
+save_config = _impl.save_config
 
 
 __all__ = [
@@ -4,17 +4,131 @@ Base configuration classes for news sources.
 Provides the foundation for source-specific configuration management.
 """
 
+import copy
 import json
-from dataclasses import dataclass, field
+import os
+import sys
+from dataclasses import MISSING, dataclass, field, fields, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+from .. import disk_cache
 from ..logging_config import get_logger
 
-
-@dataclass
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# User agent for sources that do not configure one
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# Source and bundle configs are frozen so the registry can hand the same
+# instance to every thread; they are also slotted on Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Fields where a null or empty value in a config file means "use the
+# default" rather than being stored as-is
+_DEFAULT_WHEN_EMPTY = frozenset(
+    (
+        "user_agent",
+        "headers",
+        "selectors",
+        "custom_settings",
+        "bundle_settings",
+    )
+)
+
+# SourceConfig dict fields whose keys are interned by from_dict
+_INTERNED_KEY_FIELDS = ("headers", "selectors")
+
+# How SourceConfig.merge_with decides whether a field of the other config
+# overrides: when truthy, when not the declared default, or merged by key
+_MERGE_TRUTHY_FIELDS = ("name", "source_id", "base_url", "user_agent")
+_MERGE_NON_DEFAULT_FIELDS = (
+    "timeout",
+    "max_retries",
+    "retry_delay",
+    "rate_limit",
+    "max_articles",
+)
+_MERGE_DICT_FIELDS = ("headers", "selectors", "custom_settings")
+
+# libyaml's C parser when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls) -> Tuple[str, ...]:
+    """Return the dataclass field names of cls, computed once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+@lru_cache(maxsize=None)
+def _field_defaults(cls) -> Dict[str, Any]:
+    """Return {name: default} for the fields of cls with a plain default."""
+    return {f.name: f.default for f in fields(cls) if f.default is not MISSING}
+
+
+def _known_fields(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick cls's fields out of data; absent ones fall back to defaults."""
+    return {
+        name: data[name]
+        for name in _field_names(cls)
+        if name in data
+        and (data[name] or name not in _DEFAULT_WHEN_EMPTY)
+    }
+
+
+def _intern_keys(mapping: Any) -> Any:
+    """Return mapping with its string keys interned.
+
+    Header names and selector keys repeat across every source; interning
+    makes them one shared object each and lets dict lookups match by
+    identity.
+    """
+    if not isinstance(mapping, dict):
+        return mapping
+    return {
+        sys.intern(key) if type(key) is str else key: value
+        for key, value in mapping.items()
+    }
+
+
+def _json_sidecar_path(file_path: Path) -> Path:
+    """Return the cached JSON copy of a YAML config file.
+
+    Sidecars live in the user cache directory so installed package data is
+    never written to.
+    """
+    return disk_cache.cache_file(
+        f"sources/{file_path.stem}-{{digest}}.json", str(file_path.resolve())
+    )
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes, with orjson when available."""
+    return _orjson.loads(raw) if _orjson else json.loads(raw)
+
+
+def _dumps_json(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to JSON bytes, with orjson when available.
+
+    With indent, output matches json.dumps(indent=2) in key order and
+    layout, non-string keys included.
+    """
+    if _orjson:
+        option = 0
+        if indent:
+            option = _orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS
+        return _orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SourceConfig:
     """Base configuration for news sources."""
 
@@ -30,7 +144,7 @@ class SourceConfig:
     rate_limit: Optional[float] = None
 
     # Request configuration
-    user_agent: Optional[str] = None
+    user_agent: str = DEFAULT_USER_AGENT
     headers: Dict[str, str] = field(default_factory=dict)
 
     # Content extraction selectors
@@ -44,99 +158,54 @@ class SourceConfig:
     # Source-specific settings
     custom_settings: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        """Initialize default values after creation."""
-        if not self.headers:
-            self.headers = {}
-        if not self.selectors:
-            self.selectors = {}
-        if not self.custom_settings:
-            self.custom_settings = {}
-
-        # Set default user agent if not provided
-        if not self.user_agent:
-            self.user_agent = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary format."""
-        return {
-            "name": self.name,
-            "source_id": self.source_id,
-            "base_url": self.base_url,
-            "timeout": self.timeout,
-            "max_retries": self.max_retries,
-            "retry_delay": self.retry_delay,
-            "rate_limit": self.rate_limit,
-            "user_agent": self.user_agent,
-            "headers": self.headers,
-            "selectors": self.selectors,
-            "extract_comments": self.extract_comments,
-            "max_articles": self.max_articles,
-            "enable_media_download": self.enable_media_download,
-            "custom_settings": self.custom_settings,
-        }
+        return {name: getattr(self, name) for name in _field_names(type(self))}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SourceConfig":
-        """Create SourceConfig from dictionary data."""
-        return cls(
-            name=data["name"],
-            source_id=data["source_id"],
-            base_url=data["base_url"],
-            timeout=data.get("timeout", 30),
-            max_retries=data.get("max_retries", 3),
-            retry_delay=data.get("retry_delay", 1.0),
-            rate_limit=data.get("rate_limit"),
-            user_agent=data.get("user_agent"),
-            headers=data.get("headers", {}),
-            selectors=data.get("selectors", {}),
-            extract_comments=data.get("extract_comments", True),
-            max_articles=data.get("max_articles", 30),
-            enable_media_download=data.get("enable_media_download", True),
-            custom_settings=data.get("custom_settings", {}),
-        )
+        """Create SourceConfig from dictionary data.
+
+        Unknown keys are ignored; missing optional keys take the field
+        defaults declared above.
+        """
+        values = _known_fields(cls, data)
+        for name in _INTERNED_KEY_FIELDS:
+            if name in values:
+                values[name] = _intern_keys(values[name])
+        return cls(**values)
 
     def merge_with(self, other: "SourceConfig") -> "SourceConfig":
-        """Merge this configuration with another, with other taking precedence."""
-        merged_headers = {**self.headers, **other.headers}
-        merged_selectors = {**self.selectors, **other.selectors}
-        merged_custom = {**self.custom_settings, **other.custom_settings}
-
-        return SourceConfig(
-            name=other.name or self.name,
-            source_id=other.source_id or self.source_id,
-            base_url=other.base_url or self.base_url,
-            timeout=other.timeout if other.timeout != 30 else self.timeout,
-            max_retries=(
-                other.max_retries
-                if other.max_retries != 3
-                else self.max_retries
-            ),
-            retry_delay=(
-                other.retry_delay
-                if other.retry_delay != 1.0
-                else self.retry_delay
-            ),
-            rate_limit=(
-                other.rate_limit
-                if other.rate_limit is not None
-                else self.rate_limit
-            ),
-            user_agent=other.user_agent or self.user_agent,
-            headers=merged_headers,
-            selectors=merged_selectors,
+        """Merge this configuration with another, with other taking precedence.
+
+        Identity fields and the user agent override when non-empty, tuning
+        fields when they differ from their declared default, and the
+        dict fields are merged key by key. Only overriding fields are
+        copied; everything else is shared with self.
+        """
+        changes = {
+            name: value
+            for name in _MERGE_TRUTHY_FIELDS
+            if (value := getattr(other, name))
+        }
+        defaults = _field_defaults(SourceConfig)
+        for name in _MERGE_NON_DEFAULT_FIELDS:
+            value = getattr(other, name)
+            if value != defaults[name]:
+                changes[name] = value
+        for name in _MERGE_DICT_FIELDS:
+            value = getattr(other, name)
+            if value:
+                changes[name] = {**getattr(self, name), **value}
+        return replace(
+            self,
             extract_comments=other.extract_comments,
-            max_articles=(
-                other.max_articles
-                if other.max_articles != 30
-                else self.max_articles
-            ),
             enable_media_download=other.enable_media_download,
-            custom_settings=merged_custom,
+            **changes,
         )
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class BundleConfig:
     """Configuration for source bundles."""
 
@@ -146,31 +215,14 @@ class BundleConfig:
     parallel_processing: bool = True
     bundle_settings: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        """Initialize default values after creation."""
-        if not self.bundle_settings:
-            self.bundle_settings = {}
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert bundle configuration to dictionary format."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "sources": self.sources,
-            "parallel_processing": self.parallel_processing,
-            "bundle_settings": self.bundle_settings,
-        }
+        return {name: getattr(self, name) for name in _field_names(type(self))}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BundleConfig":
         """Create BundleConfig from dictionary data."""
-        return cls(
-            name=data["name"],
-            description=data["description"],
-            sources=data["sources"],
-            parallel_processing=data.get("parallel_processing", True),
-            bundle_settings=data.get("bundle_settings", {}),
-        )
+        return cls(**_known_fields(cls, data))
 
 
 class SourceConfigLoader:
@@ -179,6 +231,13 @@ class SourceConfigLoader:
     def __init__(self):
         """Initialize the configuration loader."""
         self.logger = get_logger(__name__)
+        # path -> (mtime_ns, size, parsed data); entries are never handed
+        # out directly because callers mutate what they get back
+        self._parse_cache: Dict[str, Tuple[int, int, Any]] = {}
+
+    def clear_cache(self):
+        """Forget all parsed files so the next load re-reads them."""
+        self._parse_cache.clear()
 
     def load_from_file(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -194,21 +253,54 @@ class SourceConfigLoader:
             ValueError: If file format is not supported
             FileNotFoundError: If file does not exist
         """
-        if not file_path.exists():
+        return copy.deepcopy(self._load_shared(file_path))
+
+    def _load_shared(self, file_path: Path) -> Any:
+        """Return the parsed contents of file_path from the parse cache.
+
+        The result is the cached object itself and must not be mutated;
+        callers copy whatever part of it they hand out.
+        """
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Configuration file not found: {file_path}"
-            )
-
+            ) from None
+
+        cache_key = str(file_path)
+        cached = self._parse_cache.get(cache_key)
+        if (
+            cached is not None
+            and cached[0] == stat.st_mtime_ns
+            and cached[1] == stat.st_size
+        ):
+            return cached[2]
+
+        data = self._parse_file(file_path, stat)
+        self._parse_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, data)
+        return data
+
+    def _parse_file(self, file_path: Path, stat: os.stat_result) -> Any:
+        """Parse a YAML or JSON configuration file."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                if file_path.suffix.lower() in [".yml", ".yaml"]:
-                    return yaml.safe_load(f) or {}
-                elif file_path.suffix.lower() == ".json":
-                    return json.load(f) or {}
-                else:
-                    raise ValueError(
-                        f"Unsupported configuration file format: {file_path.suffix}"
-                    )
+            suffix = file_path.suffix.lower()
+            if suffix in (".yml", ".yaml"):
+                data = self._load_json_sidecar(file_path, stat)
+                if data is None:
+                    # One buffered read of raw bytes; libyaml detects the
+                    # encoding itself, so no text-mode decode layer
+                    with open(file_path, "rb") as f:
+                        data = yaml.load(f.read(), Loader=_YAML_LOADER)
+                    self._compile_to_json(file_path, data, stat)
+                return data or {}
+            elif suffix == ".json":
+                with open(file_path, "rb") as f:
+                    return _loads_json(f.read()) or {}
+            else:
+                raise ValueError(
+                    f"Unsupported configuration file format: {suffix}"
+                )
 
         except Exception as e:
             self.logger.error(
@@ -216,6 +308,47 @@ class SourceConfigLoader:
             )
             raise
 
+    def _load_json_sidecar(
+        self, file_path: Path, stat: os.stat_result
+    ) -> Optional[Any]:
+        """Return data from file_path's JSON sidecar if it is current.
+
+        A sidecar is current when it was compiled from a file with the same
+        mtime and size as file_path; otherwise None is returned.
+        """
+        if disk_cache.caching_disabled():
+            return None
+        try:
+            with open(_json_sidecar_path(file_path), "rb") as f:
+                sidecar = _loads_json(f.read())
+            if sidecar["source"] != [stat.st_mtime_ns, stat.st_size]:
+                return None
+            return sidecar["data"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _compile_to_json(
+        self, file_path: Path, data: Any, stat: os.stat_result
+    ) -> None:
+        """Write parsed YAML data to its JSON sidecar; failures are ignored.
+
+        Data that does not survive a JSON round trip unchanged (e.g. dates
+        or non-string keys) is not compiled, so the YAML stays authoritative.
+        """
+        if disk_cache.caching_disabled():
+            return
+        try:
+            raw = _dumps_json(
+                {"source": [stat.st_mtime_ns, stat.st_size], "data": data}
+            )
+            if _loads_json(raw)["data"] != data:
+                return
+            disk_cache.write_atomic(_json_sidecar_path(file_path), raw)
+        except Exception as e:
+            self.logger.debug(
+                f"Could not write JSON sidecar for {file_path}: {e}"
+            )
+
     def save_to_file(
         self, data: Dict[str, Any], file_path: Path, format_type: str = "yaml"
     ):
@@ -231,15 +364,17 @@ class SourceConfigLoader:
             # Ensure parent directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                if format_type.lower() == "yaml":
+            format_type = format_type.lower()
+            if format_type == "yaml":
+                with open(file_path, "w", encoding="utf-8") as f:
                     yaml.dump(
                         data, f, default_flow_style=False, sort_keys=False
                     )
-                elif format_type.lower() == "json":
-                    json.dump(data, f, indent=2, sort_keys=False)
-                else:
-                    raise ValueError(f"Unsupported format type: {format_type}")
+            elif format_type == "json":
+                with open(file_path, "wb") as f:
+                    f.write(_dumps_json(data, indent=True))
+            else:
+                raise ValueError(f"Unsupported format type: {format_type}")
 
             self.logger.info(f"Configuration saved to {file_path}")
 
@@ -263,7 +398,8 @@ class SourceConfigLoader:
             SourceConfig instance or None if not found
         """
         try:
-            data = self.load_from_file(file_path)
+            # Only the requested entry is copied, not the whole file
+            data = self._load_shared(file_path)
             sources = data.get("sources", {})
 
             if source_id not in sources:
@@ -272,7 +408,7 @@ class SourceConfigLoader:
                 )
                 return None
 
-            source_data = sources[source_id]
+            source_data = copy.deepcopy(sources[source_id])
             source_data["source_id"] = source_id
 
             return SourceConfig.from_dict(source_data)
@@ -297,7 +433,7 @@ class SourceConfigLoader:
             BundleConfig instance or None if not found
         """
         try:
-            data = self.load_from_file(file_path)
+            data = self._load_shared(file_path)
             bundles = data.get("bundles", {})
 
             if bundle_id not in bundles:
@@ -306,7 +442,7 @@ class SourceConfigLoader:
                 )
                 return None
 
-            bundle_data = bundles[bundle_id]
+            bundle_data = copy.deepcopy(bundles[bundle_id])
             bundle_data["name"] = bundle_id
 
             return BundleConfig.from_dict(bundle_data)
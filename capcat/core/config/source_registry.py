@@ -4,15 +4,71 @@ Source Registry for managing all available news sources and their configurations
 Provides centralized access to source definitions and bundle configurations.
 """
 
+import hashlib
+import os
+import pickle
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from .. import disk_cache
 from ..logging_config import get_logger
 from .source_base import BundleConfig, SourceConfig, SourceConfigLoader
 
 
+# Builtin source definition files are named <category>_sources.yml; the
+# known ones load in this order, which sets the default source ordering
+_SOURCE_FILE_SUFFIXES = ("_sources.yml", "_sources.yaml")
+_SOURCE_FILE_ORDER = {
+    name: rank
+    for rank, name in enumerate(
+        (
+            "tech_sources.yml",
+            "news_sources.yml",
+            "science_sources.yml",
+            "business_sources.yml",
+            "aggregator_sources.yml",
+        )
+    )
+}
+
+
+# Resolved once at import; reloads and new registries reuse them
+_BUILTIN_CONFIG_DIR = (
+    Path(__file__).parent.parent.parent / "sources" / "builtin"
+)
+_USER_CONFIG_DIR = Path.home() / ".capcat" / "sources"
+
+# Bumped whenever the pickled (sources, bundles, categories) layout changes
+_STATE_CACHE_FORMAT = 3
+
+# Keys SourceConfig.from_dict cannot default (source_id comes from the key)
+_REQUIRED_SOURCE_KEYS = frozenset(("name", "base_url"))
+
+
+def _list_source_files(config_dir: Path) -> List[str]:
+    """Return the source definition files in config_dir in load order.
+
+    One directory listing replaces an exists() stat per known file. Known
+    files keep their load order; any others follow by name.
+
+    Raises:
+        FileNotFoundError: If config_dir does not exist
+    """
+    with os.scandir(config_dir) as entries:
+        present = [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(_SOURCE_FILE_SUFFIXES) and entry.is_file()
+        ]
+    unknown_rank = len(_SOURCE_FILE_ORDER)
+    present.sort(
+        key=lambda name: (_SOURCE_FILE_ORDER.get(name, unknown_rank), name)
+    )
+    return present
+
+
 @dataclass
 class SourceRegistryConfig:
     """Configuration for the source registry."""
@@ -39,114 +95,231 @@ class SourceRegistry:
             config: Registry configuration settings
         """
         self.logger = get_logger(__name__)
-        self._lock = threading.RLock()
+        # Writers only; nothing called under it takes it again, so a plain
+        # Lock suffices (reload's _initialize never calls public methods)
+        self._lock = threading.Lock()
 
         # Configuration
         self.config = config or SourceRegistryConfig(
-            config_dir=Path(__file__).parent.parent.parent
-            / "sources"
-            / "builtin"
+            config_dir=_BUILTIN_CONFIG_DIR
         )
 
         # Storage
-        self._sources: Dict[str, SourceConfig] = {}
+        # Raw source dicts as loaded; SourceConfig objects are built on
+        # first lookup and memoized, since a run usually needs only a few
+        self._sources_raw: Dict[str, Dict[str, Any]] = {}
+        self._sources_cache: Dict[str, SourceConfig] = {}
+        # (source_id, lowercased "id\0name\0base_url") pairs, built on the
+        # first search and dropped whenever the source set changes
+        self._search_index: Optional[List[Tuple[str, str]]] = None
         self._bundles: Dict[str, BundleConfig] = {}
-        self._source_categories: Dict[str, List[str]] = {}
+        # category -> {source_id: None}; dict keys act as an ordered set,
+        # so membership is O(1) and listings keep file order
+        self._source_categories: Dict[str, Dict[str, None]] = {}
         self._config_loader = SourceConfigLoader()
 
         # Registry state
         self._initialized = False
+        self._all_bundle_dynamic = False
         self._last_load_time = 0
 
         # Initialize registry
         self._initialize()
 
     def _initialize(self):
-        """Initialize the registry by loading all available configurations."""
+        """Initialize the registry by loading all available configurations.
+
+        The new state is built in local containers and published only once
+        it is complete, so lock-free readers never see a partial registry.
+        """
         try:
-            self._load_default_sources()
-            self._load_default_bundles()
-            self._load_user_configurations()
+            manifest = self._config_manifest()
+            state = self._load_state_cache(manifest)
+            if state is not None:
+                self.logger.debug("Source registry loaded from cache")
+            else:
+                state = ({}, {}, {})
+                sources, bundles, categories = state
+                self._load_default_sources(sources, categories)
+                self._load_default_bundles(bundles)
+                self._load_user_configurations(sources, bundles, categories)
+                self._save_state_cache(manifest, state)
+                self.logger.debug("Source registry initialized successfully")
+            sources, bundles, categories = state
+
+            # An 'all' bundle without sources stands for every source; it
+            # is filled here and kept current by register_source
+            all_bundle = bundles.get("all")
+            all_bundle_dynamic = (
+                all_bundle is not None and not all_bundle.sources
+            )
+            if all_bundle_dynamic:
+                bundles["all"] = replace(all_bundle, sources=list(sources))
+
+            # Sources go out before the emptied config cache, so a reader
+            # that picks up the new cache also finds the new sources
+            self._sources_raw = sources
+            self._sources_cache = {}
+            self._search_index = None
+            self._bundles = bundles
+            self._source_categories = categories
+            self._all_bundle_dynamic = all_bundle_dynamic
             self._initialized = True
-            self.logger.debug("Source registry initialized successfully")
 
         except Exception as e:
             self.logger.error(f"Failed to initialize source registry: {e}")
             self._initialized = False
 
-    def _load_default_sources(self):
+    def _refresh_all_bundle(self):
+        """Rebuild the dynamic 'all' bundle from the registered sources."""
+        if self._all_bundle_dynamic:
+            bundles = dict(self._bundles)
+            bundles["all"] = replace(
+                bundles["all"], sources=list(self._sources_raw)
+            )
+            self._bundles = bundles
+
+    def _config_manifest(self) -> bytes:
+        """Digest of every config file _initialize reads, by mtime and size.
+
+        The package version and state format are included so a cache written
+        by another release, or in an older layout, is never reused.
+        """
+        from capcat import __version__
+
+        config_dir = self.config.config_dir
+        user_config_dir = _USER_CONFIG_DIR
+        try:
+            source_files = _list_source_files(config_dir)
+        except FileNotFoundError:
+            source_files = []
+        # Listed by name, so adding or removing a source file also
+        # changes the digest
+        candidates = [config_dir / name for name in source_files] + [
+            config_dir / "bundles.yml",
+            user_config_dir / "custom_sources.yml",
+            user_config_dir / "custom_bundles.yml",
+        ]
+        digest = hashlib.blake2b(
+            f"{__version__}:{_STATE_CACHE_FORMAT}".encode("utf-8")
+        )
+        for path in candidates:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            digest.update(
+                f"{path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode("utf-8")
+            )
+        return digest.digest()
+
+    def _state_cache_file(self) -> Path:
+        """Return the pickle file caching state for this config directory."""
+        return disk_cache.cache_file(
+            "registry-{digest}.pkl", str(self.config.config_dir.resolve())
+        )
+
+    def _load_state_cache(self, manifest: bytes) -> Optional[tuple]:
+        """Return cached (sources, bundles, categories) for manifest, if any."""
+        if disk_cache.caching_disabled():
+            return None
+        try:
+            with open(self._state_cache_file(), "rb") as f:
+                cached_manifest, state = pickle.load(f)
+        except Exception:
+            return None
+        return state if cached_manifest == manifest else None
+
+    def _save_state_cache(self, manifest: bytes, state: tuple):
+        """Atomically persist the loaded state; failures are ignored."""
+        if disk_cache.caching_disabled():
+            return
+        try:
+            disk_cache.write_atomic(
+                self._state_cache_file(),
+                pickle.dumps((manifest, state), protocol=5),
+            )
+        except Exception as e:
+            self.logger.debug(f"Could not cache source registry: {e}")
+
+    def _load_default_sources(
+        self,
+        sources: Dict[str, Dict[str, Any]],
+        categories: Dict[str, Dict[str, None]],
+    ):
         """Load default source configurations from config files."""
         config_dir = self.config.config_dir
-        if not config_dir.exists():
+        try:
+            present = _list_source_files(config_dir)
+        except FileNotFoundError:
             self.logger.warning(
                 f"Source config directory not found: {config_dir}"
             )
             return
 
-        # Load source configuration files
-        source_files = [
-            "tech_sources.yml",
-            "news_sources.yml",
-            "science_sources.yml",
-            "business_sources.yml",
-            "aggregator_sources.yml",
-        ]
-
-        for source_file in source_files:
-            file_path = config_dir / source_file
-            if file_path.exists():
-                self._load_sources_from_file(file_path)
+        for source_file in present:
+            self._load_sources_from_file(
+                config_dir / source_file, sources, categories
+            )
 
-    def _load_sources_from_file(self, file_path: Path):
-        """Load source configurations from a specific file."""
+    def _load_sources_from_file(
+        self,
+        file_path: Path,
+        sources: Dict[str, Dict[str, Any]],
+        categories: Dict[str, Dict[str, None]],
+    ):
+        """Load source configurations from a file into sources/categories."""
         try:
             data = self._config_loader.load_from_file(file_path)
-            sources = data.get("sources", {})
-
-            for source_id, source_data in sources.items():
+            file_sources = data.get("sources", {})
+
+            for source_id, source_data in file_sources.items():
+                missing = _REQUIRED_SOURCE_KEYS - source_data.keys()
+                if missing:
+                    self.logger.error(
+                        f"Source '{source_id}' in {file_path} is missing "
+                        f"{', '.join(sorted(missing))}; skipped"
+                    )
+                    continue
                 source_data["source_id"] = source_id
-                source_config = SourceConfig.from_dict(source_data)
-                self._sources[source_id] = source_config
+                sources[source_id] = source_data
 
                 # Add to category if specified
                 category = source_data.get("category")
                 if category:
-                    if category not in self._source_categories:
-                        self._source_categories[category] = []
-                    self._source_categories[category].append(source_id)
+                    categories.setdefault(category, {})[source_id] = None
 
             self.logger.debug(
-                f"Loaded {len(sources)} sources from {file_path}"
+                f"Loaded {len(file_sources)} sources from {file_path}"
             )
 
         except Exception as e:
             self.logger.error(f"Error loading sources from {file_path}: {e}")
 
-    def _load_default_bundles(self):
+    def _load_default_bundles(self, bundles: Dict[str, BundleConfig]):
         """Load default bundle configurations."""
         bundle_file = self.config.config_dir / "bundles.yml"
         if not bundle_file.exists():
             # Create default bundles if file doesn't exist
-            self._create_default_bundles()
+            self._create_default_bundles(bundles)
             return
 
         try:
             data = self._config_loader.load_from_file(bundle_file)
-            bundles = data.get("bundles", {})
+            file_bundles = data.get("bundles", {})
 
-            for bundle_id, bundle_data in bundles.items():
+            for bundle_id, bundle_data in file_bundles.items():
                 bundle_data["name"] = bundle_id
-                bundle_config = BundleConfig.from_dict(bundle_data)
-                self._bundles[bundle_id] = bundle_config
+                bundles[bundle_id] = BundleConfig.from_dict(bundle_data)
 
             self.logger.debug(
-                f"Loaded {len(bundles)} bundles from {bundle_file}"
+                f"Loaded {len(file_bundles)} bundles from {bundle_file}"
             )
 
         except Exception as e:
             self.logger.error(f"Error loading bundles from {bundle_file}: {e}")
 
-    def _create_default_bundles(self):
+    def _create_default_bundles(self, bundles: Dict[str, BundleConfig]):
         """Create and register default bundle configurations."""
         default_bundles = {
             "tech": BundleConfig(
@@ -187,12 +360,16 @@ class SourceRegistry:
             ),
         }
 
-        for bundle_id, bundle_config in default_bundles.items():
-            self._bundles[bundle_id] = bundle_config
+        bundles.update(default_bundles)
 
-    def _load_user_configurations(self):
+    def _load_user_configurations(
+        self,
+        sources: Dict[str, Dict[str, Any]],
+        bundles: Dict[str, BundleConfig],
+        categories: Dict[str, Dict[str, None]],
+    ):
         """Load user-specific source and bundle configurations."""
-        user_config_dir = Path.home() / ".capcat" / "sources"
+        user_config_dir = _USER_CONFIG_DIR
         if not user_config_dir.exists():
             return
 
@@ -200,18 +377,18 @@ class SourceRegistry:
             # Load user source overrides
             user_sources_file = user_config_dir / "custom_sources.yml"
             if user_sources_file.exists():
-                self._load_sources_from_file(user_sources_file)
+                self._load_sources_from_file(
+                    user_sources_file, sources, categories
+                )
 
             # Load user bundle overrides
             user_bundles_file = user_config_dir / "custom_bundles.yml"
             if user_bundles_file.exists():
                 data = self._config_loader.load_from_file(user_bundles_file)
-                bundles = data.get("bundles", {})
 
-                for bundle_id, bundle_data in bundles.items():
+                for bundle_id, bundle_data in data.get("bundles", {}).items():
                     bundle_data["name"] = bundle_id
-                    bundle_config = BundleConfig.from_dict(bundle_data)
-                    self._bundles[bundle_id] = bundle_config
+                    bundles[bundle_id] = BundleConfig.from_dict(bundle_data)
 
         except Exception as e:
             self.logger.error(f"Error loading user configurations: {e}")
@@ -233,14 +410,24 @@ class SourceRegistry:
             category: Optional category for grouping
         """
         with self._lock:
-            self._sources[source_id] = config
+            # Copy-on-write: readers use whichever dict they loaded without
+            # locking, so published dicts and lists are never mutated
+            sources = dict(self._sources_raw)
+            sources[source_id] = config.to_dict()
+            cache = dict(self._sources_cache)
+            cache[source_id] = config
+            self._sources_cache = cache
+            self._sources_raw = sources
+            self._search_index = None
 
             if category:
-                if category not in self._source_categories:
-                    self._source_categories[category] = []
-                if source_id not in self._source_categories[category]:
-                    self._source_categories[category].append(source_id)
+                members = self._source_categories.get(category, {})
+                if source_id not in members:
+                    categories = dict(self._source_categories)
+                    categories[category] = {**members, source_id: None}
+                    self._source_categories = categories
 
+            self._refresh_all_bundle()
             self.logger.debug(f"Registered source: {source_id}")
 
     def register_bundle(self, bundle_id: str, config: BundleConfig):
@@ -252,7 +439,12 @@ class SourceRegistry:
             config: Bundle configuration
         """
         with self._lock:
-            self._bundles[bundle_id] = config
+            bundles = dict(self._bundles)
+            bundles[bundle_id] = config
+            self._bundles = bundles
+            if bundle_id == "all":
+                self._all_bundle_dynamic = not config.sources
+                self._refresh_all_bundle()
             self.logger.debug(f"Registered bundle: {bundle_id}")
 
     def get_source_config(self, source_id: str) -> Optional[SourceConfig]:
@@ -265,8 +457,19 @@ class SourceRegistry:
         Returns:
             SourceConfig instance or None if not found
         """
-        with self._lock:
-            return self._sources.get(source_id)
+        # Configs are immutable and dict reads are atomic, so no lock. The
+        # cache is captured before the sources, and a config is stored only
+        # in the dict it was looked up in: a reload publishes new sources
+        # before its new cache, so a stale config never enters that cache.
+        cache = self._sources_cache
+        config = cache.get(source_id)
+        if config is None:
+            raw = self._sources_raw.get(source_id)
+            if raw is None:
+                return None
+            config = SourceConfig.from_dict(raw)
+            cache[source_id] = config
+        return config
 
     def get_bundle_config(self, bundle_id: str) -> Optional[BundleConfig]:
         """
@@ -278,14 +481,8 @@ class SourceRegistry:
         Returns:
             BundleConfig instance or None if not found
         """
-        with self._lock:
-            bundle = self._bundles.get(bundle_id)
-
-            # Special handling for 'all' bundle - populate with all available sources
-            if bundle and bundle_id == "all" and not bundle.sources:
-                bundle.sources = list(self._sources.keys())
-
-            return bundle
+        # The 'all' bundle is populated at load time, so this is a pure read
+        return self._bundles.get(bundle_id)
 
     def list_available_sources(self) -> List[str]:
         """
@@ -294,8 +491,7 @@ class SourceRegistry:
         Returns:
             List of source IDs
         """
-        with self._lock:
-            return list(self._sources.keys())
+        return list(self._sources_raw.keys())
 
     def list_available_bundles(self) -> List[str]:
         """
@@ -304,8 +500,7 @@ class SourceRegistry:
         Returns:
             List of bundle IDs
         """
-        with self._lock:
-            return list(self._bundles.keys())
+        return list(self._bundles.keys())
 
     def list_sources_by_category(self, category: str) -> List[str]:
         """
@@ -317,8 +512,7 @@ class SourceRegistry:
         Returns:
             List of source IDs in the category
         """
-        with self._lock:
-            return self._source_categories.get(category, [])
+        return list(self._source_categories.get(category, ()))
 
     def list_categories(self) -> List[str]:
         """
@@ -327,8 +521,7 @@ class SourceRegistry:
         Returns:
             List of category names
         """
-        with self._lock:
-            return list(self._source_categories.keys())
+        return list(self._source_categories.keys())
 
     def validate_source_ids(self, source_ids: List[str]) -> Dict[str, bool]:
         """
@@ -340,11 +533,8 @@ class SourceRegistry:
         Returns:
             Dictionary mapping source IDs to validation status
         """
-        with self._lock:
-            return {
-                source_id: source_id in self._sources
-                for source_id in source_ids
-            }
+        sources = self._sources_raw
+        return {source_id: source_id in sources for source_id in source_ids}
 
     def get_bundle_sources(self, bundle_id: str) -> List[str]:
         """
@@ -370,18 +560,17 @@ class SourceRegistry:
             List of matching source IDs
         """
         query_lower = query.lower()
-        matches = []
-
-        with self._lock:
-            for source_id, config in self._sources.items():
-                if (
-                    query_lower in source_id.lower()
-                    or query_lower in config.name.lower()
-                    or query_lower in config.base_url.lower()
-                ):
-                    matches.append(source_id)
-
-        return matches
+        index = self._search_index
+        if index is None:
+            with self._lock:
+                index = self._search_index = [
+                    (source_id, "\0".join(
+                        (source_id, raw["name"], raw["base_url"])
+                    ).lower())
+                    for source_id, raw in self._sources_raw.items()
+                ]
+
+        return [source_id for source_id, hay in index if query_lower in hay]
 
     def get_registry_stats(self) -> Dict[str, int]:
         """
@@ -390,21 +579,20 @@ class SourceRegistry:
         Returns:
             Dictionary with registry statistics
         """
-        with self._lock:
-            return {
-                "total_sources": len(self._sources),
-                "total_bundles": len(self._bundles),
-                "total_categories": len(self._source_categories),
-                "initialized": self._initialized,
-            }
+        return {
+            "total_sources": len(self._sources_raw),
+            "total_bundles": len(self._bundles),
+            "total_categories": len(self._source_categories),
+            "initialized": self._initialized,
+        }
 
     def reload_configurations(self):
         """Reload all configurations from disk."""
         with self._lock:
             self.logger.info("Reloading source configurations...")
-            self._sources.clear()
-            self._bundles.clear()
-            self._source_categories.clear()
+            # _initialize publishes the new state only once it is complete;
+            # until then readers keep seeing the previous registry
+            self._config_loader.clear_cache()
             self._initialize()
 
 
@@ -4,67 +4,147 @@ Shared executor pool for HTML-to-Markdown conversion to prevent nested ThreadPoo
 
 This module provides a global executor that can be safely used by multiple article
 processing threads without creating nested executors that exhaust thread resources.
+Conversion is pure-Python and CPU-bound, so it runs in worker processes where
+the platform supports them; threads would serialize on the GIL.
 """
 
-from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+# Processing settings html_to_markdown reads from the global config. Worker
+# processes load their own config, so the parent's values are passed along
+# with each job.
+CONVERSION_SETTINGS = (
+    "remove_style_tags",
+    "remove_nav_tags",
+    "markdown_line_breaks",
+)
+
+
+def _mp_context():
+    """Prefer forkserver (no inherited threads/locks), else spawn."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def convert_html(
+    html_content: str, url: Optional[str], settings: Dict[str, Any]
+) -> str:
+    """
+    Convert HTML to Markdown with the caller's processing settings.
+
+    Top-level so it can be pickled for worker processes.
+
+    Args:
+        html_content: HTML to convert
+        url: Base URL for resolving relative links
+        settings: Values for CONVERSION_SETTINGS from the caller's config
+
+    Returns:
+        Markdown text
+    """
+    from capcat.core.config import get_config
+    from capcat.core.formatter import html_to_markdown
+
+    processing = get_config().processing
+    for name, value in settings.items():
+        setattr(processing, name, value)
+    return html_to_markdown(html_content, url)
 
 
 class ConversionExecutorPool:
     """Singleton executor pool for HTML-to-Markdown conversions across all articles."""
 
     _instance: Optional['ConversionExecutorPool'] = None
-    _executor: Optional[ThreadPoolExecutor] = None
+    _executor: Optional[Executor] = None
+    # Guards singleton creation and executor (re)creation/shutdown, so
+    # concurrent first calls cannot each start a pool and leak one
+    _init_lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._init_lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
     def __init__(self):
-        """Initialize the shared executor pool."""
-        if self._executor is None:
-            # Create shared executor with reasonable worker count
-            # This pool is shared across ALL article processing
-            # Use fewer workers since conversion is CPU-bound
-            self._executor = ThreadPoolExecutor(
+        """Initialize the shared executor pool.
+
+        The executor itself is created on first use: worker processes import
+        this module too, and must not start pools of their own.
+        """
+
+    def _create_executor(self) -> Executor:
+        """Create the shared executor with one worker per core."""
+        # This pool is shared across ALL article processing
+        workers = os.cpu_count() or 4
+        try:
+            return ProcessPoolExecutor(
+                max_workers=workers, mp_context=_mp_context()
+            )
+        except (ImportError, NotImplementedError, OSError):
+            # No working process support (e.g. missing sem_open)
+            return ThreadPoolExecutor(
                 max_workers=4,
                 thread_name_prefix="conversion_worker"
             )
 
     @property
-    def executor(self) -> ThreadPoolExecutor:
-        """Get the shared executor instance."""
-        if self._executor is None:
-            self.__init__()
-        return self._executor
-
-    def shutdown(self, wait=True):
-        """Shutdown the executor pool."""
-        if self._executor is not None:
-            self._executor.shutdown(wait=wait)
+    def executor(self) -> Executor:
+        """Get the shared executor instance, creating it on first use."""
+        executor = self._executor
+        if executor is None:
+            with self._init_lock:
+                executor = self._executor
+                if executor is None:
+                    executor = self._executor = self._create_executor()
+        return executor
+
+    def shutdown(self, wait=True, executor: Optional[Executor] = None):
+        """Shutdown the executor pool; the next use creates a new one.
+
+        Args:
+            wait: If True, wait for all tasks to complete
+            executor: Only shut down if this is still the current pool.
+                A caller retiring a broken pool passes it here, so a
+                replacement another thread already started is left alone.
+        """
+        with self._init_lock:
+            current = self._executor
+            if executor is not None and current is not executor:
+                return
             self._executor = None
+        if current is not None:
+            current.shutdown(wait=wait)
 
 
 # Global accessor functions
 _pool = ConversionExecutorPool()
 
 
-def get_conversion_executor() -> ThreadPoolExecutor:
+def get_conversion_executor() -> Executor:
     """
     Get the shared HTML-to-Markdown conversion executor.
 
     Returns:
-        ThreadPoolExecutor: Shared executor for conversions
+        Executor: Shared executor for conversions
     """
     return _pool.executor
 
 
-def shutdown_conversion_executor(wait=True):
+def shutdown_conversion_executor(
+    wait=True, executor: Optional[Executor] = None
+):
     """
     Shutdown the shared conversion executor.
 
     Args:
         wait: If True, wait for all tasks to complete
+        executor: Only shut down if this is still the shared executor
     """
-    _pool.shutdown(wait=wait)
+    _pool.shutdown(wait=wait, executor=executor)
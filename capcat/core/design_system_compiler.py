@@ -5,11 +5,225 @@ Compiles CSS custom properties from the design system into hardcoded values
 for performance optimization and self-contained HTML generation.
 """
 
+import hashlib
+import json
 import re
+import time
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Hashable, List, Optional, Tuple
+from capcat.core import disk_cache
 from capcat.core.logging_config import get_logger
 
+# CSS patterns, compiled once at import
+_CSS_VAR_DEF_RE = re.compile(r'--([a-zA-Z0-9-]+):\s*([^;]+);')
+_VAR_REF_RE = re.compile(r'var\(--([a-zA-Z0-9-]+)\)')
+_REM_RE = re.compile(r'([\d.]+)rem')
+_IMPORT_RE = re.compile(r'@import\s+url\([\'"]?[^\'"]+[\'"]?\);?\s*')
+_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_KEBAB_RE = re.compile(r'-([a-z])')
+
+_COMPILATION_START_MARKER = "/* COMPILATION_TARGET_START */"
+_COMPILATION_END_MARKER = "/* COMPILATION_TARGET_END */"
+_COMPILATION_TARGET_RE = re.compile(
+    f"{re.escape(_COMPILATION_START_MARKER)}.*?"
+    f"{re.escape(_COMPILATION_END_MARKER)}",
+    re.DOTALL,
+)
+# Substrings marking color variables, which replace_css_variables keeps as
+# var() references so themes can switch them at runtime
+_COLOR_KEYWORDS = ('color', 'bg', 'shadow', 'border')
+
+# Sections of the compiled :root block and the name prefixes they collect
+_CSS_SECTION_CATEGORIES = {
+    'typography': ('text-', 'font-size-', 'mobile-text-'),
+    'spacing': ('space-', 'padding-', 'margin-', 'content-', 'header-', 'component-'),
+    'font-weights': ('font-weight-', 'weight-'),
+    'line-heights': ('line-height-',),
+    'layout': ('measure-', 'width-', 'breakpoint-'),
+}
+
+# Every category prefix, for a single C-level startswith check
+_ALL_CATEGORY_PREFIXES = tuple(
+    prefix
+    for prefixes in _CSS_SECTION_CATEGORIES.values()
+    for prefix in prefixes
+)
+
+
+def _categorize_variable(var_name: str) -> Optional[str]:
+    """Return the compiled-section category for var_name, or None."""
+    if not var_name.startswith(_ALL_CATEGORY_PREFIXES):
+        return None
+    for category, prefixes in _CSS_SECTION_CATEGORIES.items():
+        if var_name.startswith(prefixes):
+            return category
+    return None
+
+
+def _extract_block(css: str, marker: str, opener: str) -> str:
+    """
+    Return the first `opener ... }` block after marker, braces balanced.
+
+    The scan jumps between braces with str.find rather than walking the
+    text character by character. Returns "" if marker or opener is
+    missing or the block is never closed.
+    """
+    marker_pos = css.find(marker)
+    if marker_pos == -1:
+        return ""
+    block_start = css.find(opener, marker_pos)
+    if block_start == -1:
+        return ""
+
+    depth = 1
+    pos = block_start + len(opener)
+    while True:
+        close = css.find('}', pos)
+        if close == -1:
+            return ""
+        nested = css.find('{', pos, close)
+        if nested != -1:
+            depth += 1
+            pos = nested + 1
+            continue
+        depth -= 1
+        if depth == 0:
+            return css[block_start:close + 1]
+        pos = close + 1
+
+
+@lru_cache(maxsize=2048)
+def _is_color_variable(var_name: str) -> bool:
+    """Return True for variables kept as var() for theme switching."""
+    return any(keyword in var_name for keyword in _COLOR_KEYWORDS)
+
+
+@lru_cache(maxsize=2048)
+def _px_comment(value: str, base_font_size: int = 16) -> Optional[str]:
+    """Return a `/* Npx at 16px base */` comment for rem values, or None."""
+    # Colors, font stacks and keywords never match; skip the regex for them
+    if 'rem' not in value:
+        return None
+
+    # Match rem values: 1.5rem, 2.618rem, etc.
+    rem_matches = _REM_RE.findall(value)
+
+    if not rem_matches:
+        return None
+
+    # Calculate pixel equivalents for reference
+    px_refs = []
+    for rem_str in rem_matches:
+        rem_value = float(rem_str)
+        px_value = rem_value * base_font_size
+        if px_value == int(px_value):
+            px_refs.append(f"{int(px_value)}px")
+        else:
+            px_refs.append(f"{px_value:.2f}px")
+
+    # Create reference comment
+    if len(px_refs) == 1:
+        return f"/* {px_refs[0]} at 16px base */"
+    return f"/* {', '.join(px_refs)} at 16px base */"
+
+
+def _declaration(var_name: str, value: str, include_px_references: bool) -> str:
+    """Format one custom property line, with a px comment for rem values."""
+    if include_px_references:
+        px_comment = _px_comment(value)
+        if px_comment:
+            return f"  --{var_name}: {value}; {px_comment}"
+    return f"  --{var_name}: {value};"
+
+
+@lru_cache(maxsize=2048)
+def _to_camel_case(var_name: str) -> str:
+    """Convert kebab-case to camelCase: text-large -> textLarge."""
+    if '-' not in var_name:
+        return var_name
+    return _KEBAB_RE.sub(lambda m: m.group(1).upper(), var_name)
+
+
+# Bumped whenever the persisted design-system build layout or the
+# resolution rules that produce it change
+_PRECOMPILED_FORMAT = 3
+
+# Seconds an observed design-system.css mtime/size is trusted before the
+# file is stat()ed again; clear_cache forces an immediate check
+_STAT_INTERVAL = 0.5
+
+# Read buffer for design-system.css; large enough to take it in one read
+_READ_BUFFER_SIZE = 64 * 1024
+
+# Entries per generation in the compile/replace memo caches
+_MEMO_GENERATION_SIZE = 64
+
+
+class _GenerationalCache:
+    """Bounded memo with two generations.
+
+    New entries go into the current generation; once it is full it
+    becomes the old one and the previous old generation is dropped.
+    A hit in the old generation is promoted, so hot keys survive.
+    """
+
+    __slots__ = ("_current", "_old", "_limit")
+
+    def __init__(self, limit: int = _MEMO_GENERATION_SIZE):
+        self._current: Dict[Hashable, str] = {}
+        self._old: Dict[Hashable, str] = {}
+        self._limit = limit
+
+    def get(self, key: Hashable) -> Optional[str]:
+        value = self._current.get(key)
+        if value is None:
+            value = self._old.get(key)
+            if value is not None:
+                self.put(key, value)
+        return value
+
+    def put(self, key: Hashable, value: str):
+        if len(self._current) >= self._limit:
+            self._old = self._current
+            self._current = {}
+        self._current[key] = value
+
+    def clear(self):
+        self._current = {}
+        self._old = {}
+
+
+class _DesignSystemBuild:
+    """Everything derived from one version of design-system.css.
+
+    Resolved values and color definitions are filled when the build is
+    made; the other outputs are filled on first use and then reused until
+    the file changes.
+    """
+
+    __slots__ = (
+        "source", "computed_values", "compiled_css", "color_definitions",
+        "substitutions", "compiled_section", "js_tokens",
+    )
+
+    def __init__(
+        self,
+        source: Optional[Tuple[int, int]],
+        computed_values: Dict[str, str],
+        color_definitions: str,
+    ):
+        self.source = source
+        self.computed_values = computed_values
+        self.color_definitions = color_definitions
+        self.compiled_css: Optional[str] = None
+        # The generated :root section shared by every compiled document
+        self.compiled_section: Optional[str] = None
+        self.js_tokens: Optional[Dict[str, str]] = None
+        # Non-color name -> value table used by replace_css_variables
+        self.substitutions: Optional[Dict[str, str]] = None
+
 
 class DesignSystemCompiler:
     """
@@ -31,10 +245,64 @@ class DesignSystemCompiler:
         self.themes_dir = themes_dir or Path(__file__).parent.parent / "themes"
         self.design_system_path = self.themes_dir / "design-system.css"
 
-        # Cache for computed values
-        self._computed_values: Optional[Dict[str, str]] = None
-        self._compiled_css: Optional[str] = None
-        self._replace_css_cache: Dict[int, str] = {}
+        # Outputs derived from the current design-system.css
+        self._build: Optional[_DesignSystemBuild] = None
+        # Last (mtime_ns, size) seen and when it was checked
+        self._source: Optional[Tuple[int, int]] = None
+        self._source_checked_at = float("-inf")
+        # (mtime_ns, size, text) of the last design-system.css read
+        self._raw_css_cache: Optional[Tuple[int, int, str]] = None
+        # Memoized compile_design_system / replace_css_variables results
+        self._compile_cache = _GenerationalCache()
+        self._replace_css_cache = _GenerationalCache()
+
+    def _read_design_css(self) -> str:
+        """
+        Return the text of design-system.css, re-reading only when changed.
+
+        Raises:
+            FileNotFoundError: If the design system file does not exist
+        """
+        stat = self.design_system_path.stat()
+        cached = self._raw_css_cache
+        if (
+            cached is not None
+            and cached[0] == stat.st_mtime_ns
+            and cached[1] == stat.st_size
+        ):
+            return cached[2]
+
+        with open(
+            self.design_system_path, 'r', encoding='utf-8',
+            buffering=_READ_BUFFER_SIZE,
+        ) as f:
+            design_css = f.read()
+        self._raw_css_cache = (stat.st_mtime_ns, stat.st_size, design_css)
+        return design_css
+
+    def _design_source(self) -> Optional[Tuple[int, int]]:
+        """
+        Return (mtime_ns, size) of design-system.css, or None if missing.
+
+        The file is stat()ed at most once per _STAT_INTERVAL seconds; in
+        between, every accessor trusts the last result.
+        """
+        now = time.monotonic()
+        if now - self._source_checked_at >= _STAT_INTERVAL:
+            try:
+                stat = self.design_system_path.stat()
+                self._source = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                self._source = None
+            self._source_checked_at = now
+        return self._source
+
+    def _memo_key(self, css_content: str) -> Tuple[bytes, Optional[Tuple[int, int]]]:
+        """Key a CSS input together with the design system's version."""
+        digest = hashlib.blake2b(
+            css_content.encode("utf-8"), digest_size=16
+        ).digest()
+        return digest, self._design_source()
 
     def _extract_css_variables(self, css_content: str) -> Dict[str, str]:
         """
@@ -46,52 +314,75 @@ class DesignSystemCompiler:
         Returns:
             Dictionary mapping variable names to their values
         """
-        variables = {}
-
-        # Match CSS custom properties: --variable-name: value;
-        pattern = r'--([a-zA-Z0-9-]+):\s*([^;]+);'
-        matches = re.findall(pattern, css_content)
-
-        for var_name, value in matches:
-            # Clean up the value (remove comments and whitespace)
-            clean_value = re.sub(r'/\*.*?\*/', '', value).strip()
-            variables[var_name] = clean_value
-
-        return variables
+        # Strip comments from the whole stylesheet once, then match CSS
+        # custom properties: --variable-name: value;
+        css_content = _COMMENT_RE.sub('', css_content)
+        return {
+            var_name: value.strip()
+            for var_name, value in _CSS_VAR_DEF_RE.findall(css_content)
+        }
 
     def _resolve_variable_references(self, variables: Dict[str, str]) -> Dict[str, str]:
         """
         Resolve CSS custom property references within values.
 
+        Variables are resolved once each in dependency order, so every
+        reference is substituted with an already-resolved value. Variables
+        caught in a reference cycle are left unresolved.
+
         Args:
             variables: Dictionary of CSS variables
 
         Returns:
             Dictionary with resolved variable references
         """
-        resolved = variables.copy()
-        max_iterations = 10  # Prevent infinite loops
-
-        for _ in range(max_iterations):
-            changed = False
-
-            for var_name, value in resolved.items():
-                # Find var() references in the value
-                var_refs = re.findall(r'var\(--([a-zA-Z0-9-]+)\)', value)
-
-                for ref_var in var_refs:
-                    if ref_var in resolved:
-                        # Replace the var() reference with the actual value
-                        old_value = value
-                        value = value.replace(f'var(--{ref_var})', resolved[ref_var])
-                        if value != old_value:
-                            changed = True
-                            resolved[var_name] = value
-
-            if not changed:
-                break
-
-        return resolved
+        # Parallel arrays indexed by definition order; values[i] is updated
+        # in place as variable i is resolved
+        names = list(variables)
+        values = list(variables.values())
+        index = {name: i for i, name in enumerate(names)}
+
+        # Edges only for references to defined variables; others stay as-is
+        dependencies: List[Tuple[int, ...]] = []
+        dependents: List[List[int]] = [[] for _ in names]
+        for i, value in enumerate(values):
+            # Most values are literals; skip the regex when there is no var()
+            if 'var(' not in value:
+                dependencies.append(())
+                continue
+            refs = tuple({
+                index[ref] for ref in _VAR_REF_RE.findall(value) if ref in index
+            })
+            dependencies.append(refs)
+            for ref in refs:
+                dependents[ref].append(i)
+
+        def substitute(match: re.Match) -> str:
+            i = index.get(match.group(1))
+            return match.group(0) if i is None else values[i]
+
+        # Kahn's algorithm: a variable is ready once all its references are
+        pending = [len(refs) for refs in dependencies]
+        ready = deque(i for i, count in enumerate(pending) if count == 0)
+        while ready:
+            i = ready.popleft()
+            if dependencies[i]:
+                values[i] = _VAR_REF_RE.sub(substitute, values[i])
+            for dependent in dependents[i]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        # Variables in, or depending on, a reference cycle are invalid in
+        # CSS too; leave them as written rather than expanding the cycle
+        unresolved = [names[i] for i, count in enumerate(pending) if count]
+        if unresolved:
+            self.logger.warning(
+                "Circular CSS variable references left unresolved: %s",
+                ", ".join(unresolved),
+            )
+
+        return dict(zip(names, values))
 
     def _add_pixel_reference(self, value: str, base_font_size: int = 16) -> Tuple[str, Optional[str]]:
         """
@@ -104,46 +395,95 @@ class DesignSystemCompiler:
         Returns:
             Tuple of (original_value, pixel_reference_comment)
         """
-        # Match rem values: 1.5rem, 2.618rem, etc.
-        rem_matches = re.findall(r'([\d.]+)rem', value)
-
-        if not rem_matches:
-            return value, None
-
-        # Calculate pixel equivalents for reference
-        px_refs = []
-        for rem_str in rem_matches:
-            rem_value = float(rem_str)
-            px_value = rem_value * base_font_size
-            if px_value == int(px_value):
-                px_refs.append(f"{int(px_value)}px")
-            else:
-                px_refs.append(f"{px_value:.2f}px")
+        return value, _px_comment(value, base_font_size)
 
-        # Create reference comment
-        if len(px_refs) == 1:
-            comment = f"/* {px_refs[0]} at 16px base */"
-        else:
-            comment = f"/* {', '.join(px_refs)} at 16px base */"
+    def _ensure_built(self) -> _DesignSystemBuild:
+        """
+        Return the build for the current design-system.css.
+
+        The file is read and its variables resolved once per version of
+        the file; every accessor shares the result. Resolved values and
+        color definitions are also persisted in the user cache directory,
+        so later processes skip reading and resolving an unchanged file.
+        """
+        source = self._design_source()
+        build = self._build
+        if build is not None and build.source == source:
+            return build
 
-        return value, comment
+        if source is None:
+            self.logger.warning(f"Design system file not found: {self.design_system_path}")
+            build = _DesignSystemBuild(None, {}, "")
+        else:
+            build = self._load_precompiled(source)
+            if build is None:
+                try:
+                    design_css = self._read_design_css()
+                    # The file may have changed since it was stat()ed
+                    source = self._source = self._raw_css_cache[:2]
+                    build = _DesignSystemBuild(
+                        source,
+                        self._compute_hardcoded_values(design_css),
+                        self._find_color_definitions(design_css),
+                    )
+                    self._save_precompiled(build)
+                except (OSError, UnicodeError) as e:
+                    self.logger.error(f"Error reading design system: {e}")
+                    build = _DesignSystemBuild(source, {}, "")
+        self._build = build
+        return build
+
+    def _precompiled_path(self) -> Path:
+        """Return the cache file holding this design system's build."""
+        return disk_cache.cache_file(
+            "design-system/{digest}.json", str(self.design_system_path.resolve())
+        )
+
+    def _load_precompiled(self, source: Tuple[int, int]) -> Optional[_DesignSystemBuild]:
+        """Return the persisted build if it was made from this file version."""
+        if disk_cache.caching_disabled():
+            return None
+        try:
+            with open(self._precompiled_path(), 'rb') as f:
+                data = json.loads(f.read())
+            if (
+                data["format"] != _PRECOMPILED_FORMAT
+                or data["source"] != list(source)
+            ):
+                return None
+            return _DesignSystemBuild(
+                source, data["computed_values"], data["color_definitions"]
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_precompiled(self, build: _DesignSystemBuild):
+        """Persist a build's values and color block; failures are ignored."""
+        if disk_cache.caching_disabled():
+            return
+        try:
+            raw = json.dumps({
+                "format": _PRECOMPILED_FORMAT,
+                "source": list(build.source),
+                "computed_values": build.computed_values,
+                "color_definitions": build.color_definitions,
+            }).encode("utf-8")
+            disk_cache.write_atomic(self._precompiled_path(), raw)
+        except Exception as e:
+            self.logger.debug(f"Could not write precompiled design system: {e}")
 
-    def _compute_hardcoded_values(self) -> Dict[str, str]:
+    def _compute_hardcoded_values(self, design_css: str) -> Dict[str, str]:
         """
         Compute hardcoded values from design system.
         All variables (typography, spacing, colors) are now in design-system.css.
 
+        Args:
+            design_css: Content of design-system.css
+
         Returns:
             Dictionary mapping CSS properties to their hardcoded values
         """
-        if not self.design_system_path.exists():
-            self.logger.warning(f"Design system file not found: {self.design_system_path}")
-            return {}
-
         try:
-            with open(self.design_system_path, 'r', encoding='utf-8') as f:
-                design_css = f.read()
-
             # Extract all variables from design-system.css
             all_variables = self._extract_css_variables(design_css)
             self.logger.debug(f"Extracted {len(all_variables)} variables from design-system.css")
@@ -169,10 +509,7 @@ class DesignSystemCompiler:
         Returns:
             Dictionary mapping CSS variable names to hardcoded values
         """
-        if self._computed_values is None:
-            self._computed_values = self._compute_hardcoded_values()
-
-        return self._computed_values
+        return self._ensure_built().computed_values
 
     def _generate_compiled_css_section(self, computed_values: Dict[str, str], include_px_references: bool = True) -> str:
         """
@@ -196,57 +533,32 @@ class DesignSystemCompiler:
             ":root {",
         ]
 
-        # Group variables by category for better organization
-        categories = {
-            'typography': ['text-', 'font-size-', 'mobile-text-'],
-            'spacing': ['space-', 'padding-', 'margin-', 'content-', 'header-', 'component-'],
-            'font-weights': ['font-weight-', 'weight-'],
-            'line-heights': ['line-height-'],
-            'layout': ['measure-', 'width-', 'breakpoint-']
-        }
-
-        for category, prefixes in categories.items():
-            category_vars = []
-            for var_name, value in computed_values.items():
-                if any(var_name.startswith(prefix) for prefix in prefixes):
-                    category_vars.append((var_name, value))
+        # Group variables by category for better organization, in one pass
+        grouped = {category: [] for category in _CSS_SECTION_CATEGORIES}
+        remaining_vars = []
+        for var_name, value in computed_values.items():
+            category = _categorize_variable(var_name)
+            if category is None:
+                remaining_vars.append((var_name, value))
+            else:
+                grouped[category].append((var_name, value))
 
+        for category, category_vars in grouped.items():
             if category_vars:
                 css_lines.append(f"  /* {category.title()} */")
-                for var_name, value in sorted(category_vars):
-                    # Add pixel reference comment if value contains rem
-                    if include_px_references:
-                        _, px_comment = self._add_pixel_reference(value)
-                        if px_comment:
-                            css_lines.append(f"  --{var_name}: {value}; {px_comment}")
-                        else:
-                            css_lines.append(f"  --{var_name}: {value};")
-                    else:
-                        css_lines.append(f"  --{var_name}: {value};")
+                css_lines.extend(
+                    _declaration(var_name, value, include_px_references)
+                    for var_name, value in sorted(category_vars)
+                )
                 css_lines.append("")
 
         # Add any remaining variables not categorized
-        remaining_vars = []
-        for var_name, value in computed_values.items():
-            categorized = False
-            for prefixes in categories.values():
-                if any(var_name.startswith(prefix) for prefix in prefixes):
-                    categorized = True
-                    break
-            if not categorized:
-                remaining_vars.append((var_name, value))
-
         if remaining_vars:
             css_lines.append("  /* Other */")
-            for var_name, value in sorted(remaining_vars):
-                if include_px_references:
-                    _, px_comment = self._add_pixel_reference(value)
-                    if px_comment:
-                        css_lines.append(f"  --{var_name}: {value}; {px_comment}")
-                    else:
-                        css_lines.append(f"  --{var_name}: {value};")
-                else:
-                    css_lines.append(f"  --{var_name}: {value};")
+            css_lines.extend(
+                _declaration(var_name, value, include_px_references)
+                for var_name, value in sorted(remaining_vars)
+            )
 
         css_lines.append("}")
 
@@ -263,31 +575,47 @@ class DesignSystemCompiler:
         Returns:
             CSS content with compiled hardcoded values
         """
-        computed_values = self.get_computed_values()
+        memo_key = self._memo_key(target_css)
+        cached = self._compile_cache.get(memo_key)
+        if cached is not None:
+            return cached
 
-        if not computed_values:
+        build = self._ensure_built()
+        if not build.computed_values:
             self.logger.warning("No computed values available for compilation")
             return target_css
 
-        # Generate the compiled CSS section
-        compiled_section = self._generate_compiled_css_section(computed_values)
+        compiled_css = self._compile_with(target_css, build)
+        self._compile_cache.put(memo_key, compiled_css)
+        return compiled_css
+
+    def _compile_with(self, target_css: str, build: _DesignSystemBuild) -> str:
+        """Replace or append the build's compiled section in target_css."""
+        # Generate the compiled CSS section once per design system version
+        compiled_section = build.compiled_section
+        if compiled_section is None:
+            compiled_section = build.compiled_section = (
+                self._generate_compiled_css_section(build.computed_values)
+            )
 
         # Replace the compilation target section
-        start_marker = "/* COMPILATION_TARGET_START */"
-        end_marker = "/* COMPILATION_TARGET_END */"
+        start_marker = _COMPILATION_START_MARKER
+        end_marker = _COMPILATION_END_MARKER
 
         if start_marker in target_css and end_marker in target_css:
             # Replace everything between the markers
-            pattern = f"{re.escape(start_marker)}.*?{re.escape(end_marker)}"
             replacement = f"{start_marker}\n{compiled_section}\n{end_marker}"
-            compiled_css = re.sub(pattern, replacement, target_css, flags=re.DOTALL)
+            compiled_css = _COMPILATION_TARGET_RE.sub(
+                replacement, target_css
+            )
 
             self.logger.debug("Successfully compiled design system values")
-            return compiled_css
         else:
             self.logger.warning("Compilation target markers not found in CSS")
             # Append the compiled section to the end
-            return target_css + "\n\n" + compiled_section
+            compiled_css = target_css + "\n\n" + compiled_section
+
+        return compiled_css
 
     def get_compiled_design_system_css(self) -> str:
         """
@@ -296,23 +624,29 @@ class DesignSystemCompiler:
         Returns:
             Compiled CSS content
         """
-        if self._compiled_css is None:
+        build = self._ensure_built()
+        if build.compiled_css is None:
             try:
-                with open(self.design_system_path, 'r', encoding='utf-8') as f:
-                    original_css = f.read()
-
-                self._compiled_css = self.compile_design_system(original_css)
+                design_css = self._read_design_css()
+                if build.computed_values:
+                    build.compiled_css = self._compile_with(design_css, build)
+                else:
+                    self.logger.warning("No computed values available for compilation")
+                    build.compiled_css = design_css
 
             except Exception as e:
                 self.logger.error(f"Error compiling design system CSS: {e}")
-                self._compiled_css = "/* Error compiling design system */"
+                build.compiled_css = "/* Error compiling design system */"
 
-        return self._compiled_css
+        return build.compiled_css
 
     def clear_cache(self):
         """Clear the internal caches to force recompilation."""
-        self._computed_values = None
-        self._compiled_css = None
+        self._build = None
+        self._source_checked_at = float("-inf")
+        self._raw_css_cache = None
+        self._compile_cache.clear()
+        self._replace_css_cache.clear()
 
     def _extract_color_variable_definitions(self) -> str:
         """
@@ -322,64 +656,17 @@ class DesignSystemCompiler:
         Returns:
             CSS string with color variable definitions
         """
-        if not self.design_system_path.exists():
-            return ""
+        return self._ensure_built().color_definitions
 
+    def _find_color_definitions(self, design_css: str) -> str:
+        """Build the color definitions block from design-system.css text."""
         try:
-            with open(self.design_system_path, 'r', encoding='utf-8') as f:
-                design_css = f.read()
-
-            # Find the COLOR SYSTEM - DARK THEME section
-            color_dark_marker = 'COLOR SYSTEM - DARK THEME'
-            color_dark_start = design_css.find(color_dark_marker)
-            if color_dark_start != -1:
-                # Search FORWARD from the marker for `:root {`
-                root_start = design_css.find(':root {', color_dark_start)
-                if root_start != -1:
-                    # Find the closing brace by counting braces
-                    brace_count = 0
-                    i = root_start + len(':root {')
-                    while i < len(design_css):
-                        if design_css[i] == '{':
-                            brace_count += 1
-                        elif design_css[i] == '}':
-                            if brace_count == 0:
-                                root_block = design_css[root_start:i+1]
-                                break
-                            brace_count -= 1
-                        i += 1
-                    else:
-                        root_block = ""
-                else:
-                    root_block = ""
-            else:
-                root_block = ""
-
-            # Find the COLOR SYSTEM - LIGHT THEME section
-            color_light_marker = 'COLOR SYSTEM - LIGHT THEME'
-            color_light_start = design_css.find(color_light_marker)
-            if color_light_start != -1:
-                # Search FORWARD from the marker for `[data-theme="light"] {`
-                light_start = design_css.find('[data-theme="light"] {', color_light_start)
-                if light_start != -1:
-                    # Find the closing brace by counting braces
-                    brace_count = 0
-                    i = light_start + len('[data-theme="light"] {')
-                    while i < len(design_css):
-                        if design_css[i] == '{':
-                            brace_count += 1
-                        elif design_css[i] == '}':
-                            if brace_count == 0:
-                                light_block = design_css[light_start:i+1]
-                                break
-                            brace_count -= 1
-                        i += 1
-                    else:
-                        light_block = ""
-                else:
-                    light_block = ""
-            else:
-                light_block = ""
+            root_block = _extract_block(
+                design_css, 'COLOR SYSTEM - DARK THEME', ':root {'
+            )
+            light_block = _extract_block(
+                design_css, 'COLOR SYSTEM - LIGHT THEME', '[data-theme="light"] {'
+            )
 
             if root_block and light_block:
                 return f"/* COLOR SYSTEM - Injected from design-system.css */\n{root_block}\n\n{light_block}\n"
@@ -404,18 +691,20 @@ class DesignSystemCompiler:
         Returns:
             CSS content with typography/spacing hardcoded and colors injected.
         """
-        content_hash = hash(css_content)
-        if content_hash in self._replace_css_cache:
-            return self._replace_css_cache[content_hash]
+        memo_key = self._memo_key(css_content)
+        cached = self._replace_css_cache.get(memo_key)
+        if cached is not None:
+            return cached
 
-        computed_values = self.get_computed_values()
+        build = self._ensure_built()
+        computed_values = build.computed_values
 
         if not computed_values:
             self.logger.warning("No computed values available for variable replacement")
             return css_content
 
         # Remove @import statements - no longer needed after compilation
-        compiled_css = re.sub(r'@import\s+url\([\'"]?[^\'"]+[\'"]?\);?\s*', '', css_content)
+        compiled_css = _IMPORT_RE.sub('', css_content)
 
         # Inject color variable definitions
         color_definitions = self._extract_color_variable_definitions()
@@ -423,33 +712,34 @@ class DesignSystemCompiler:
             compiled_css = color_definitions + "\n" + compiled_css
 
         # Preserve only COLOR variables for theme switching
-        # Everything else (typography, spacing, layout) gets hardcoded
-        def is_color_variable(var_name: str) -> bool:
-            color_keywords = ['color', 'bg', 'shadow', 'border']
-            return any(keyword in var_name for keyword in color_keywords)
-
+        # Everything else (typography, spacing, layout) gets hardcoded,
+        # in one scan of the CSS with a table built once per design system
+        substitutions = build.substitutions
+        if substitutions is None:
+            substitutions = build.substitutions = {
+                var_name: value
+                for var_name, value in computed_values.items()
+                if not _is_color_variable(var_name)
+            }
+        skipped_colors = len(computed_values) - len(substitutions)
         replacements_made = 0
-        skipped_colors = 0
 
-        # Replace only non-color variables
-        for var_name, value in computed_values.items():
-            # Preserve color variables for theme switching
-            if is_color_variable(var_name):
-                skipped_colors += 1
-                continue
+        def substitute(match: re.Match) -> str:
+            nonlocal replacements_made
+            value = substitutions.get(match.group(1))
+            if value is None:
+                return match.group(0)
+            replacements_made += 1
+            return value
 
-            pattern = rf'var\(--{re.escape(var_name)}\)'
-            matches = re.findall(pattern, compiled_css)
-            if matches:
-                compiled_css = re.sub(pattern, value, compiled_css)
-                replacements_made += len(matches)
+        compiled_css = _VAR_REF_RE.sub(substitute, compiled_css)
 
         if replacements_made > 0:
             self.logger.debug(f"Replaced {replacements_made} variable references, preserved {skipped_colors} color variables")
         else:
             self.logger.debug("No variable references found to replace")
 
-        self._replace_css_cache[content_hash] = compiled_css
+        self._replace_css_cache.put(memo_key, compiled_css)
         return compiled_css
 
     def get_design_tokens_for_js(self) -> Dict[str, str]:
@@ -459,13 +749,11 @@ class DesignSystemCompiler:
         Returns:
             Dictionary of design tokens with camelCase keys
         """
-        computed_values = self.get_computed_values()
-
-        # Convert CSS variable names to camelCase for JavaScript
-        js_tokens = {}
-        for var_name, value in computed_values.items():
-            # Convert kebab-case to camelCase: text-large -> textLarge
-            camel_case = re.sub(r'-([a-z])', lambda m: m.group(1).upper(), var_name)
-            js_tokens[camel_case] = value
-
-        return js_tokens
\ No newline at end of file
+        build = self._ensure_built()
+        if build.js_tokens is None:
+            # Convert CSS variable names to camelCase for JavaScript
+            build.js_tokens = {
+                _to_camel_case(var_name): value
+                for var_name, value in build.computed_values.items()
+            }
+        return build.js_tokens
\ No newline at end of file
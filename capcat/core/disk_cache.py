@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+On-disk caches for Capcat.
+
+Parsed config files, source registry state and the compiled design system
+are cached under $XDG_CACHE_HOME/capcat (~/.cache/capcat by default) so an
+unchanged input is not processed again on the next run. Setting
+CAPCAT_CONFIG_NOCACHE disables all of them.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+
+def caching_disabled() -> bool:
+    """Return True when CAPCAT_CONFIG_NOCACHE is set."""
+    return bool(os.environ.get("CAPCAT_CONFIG_NOCACHE"))
+
+
+def cache_root() -> Path:
+    """Return the capcat cache directory (it may not exist yet)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(base) / "capcat"
+
+
+def cache_file(name: str, key: str) -> Path:
+    """Return the cache file for key.
+
+    Args:
+        name: Path relative to the cache root; '{digest}' is replaced by a
+            short hash of key, e.g. 'config-{digest}.pkl'
+        key: Identity of the cached item, usually a resolved file path
+    """
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return cache_root() / name.replace("{digest}", digest)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write data to path via a temporary file and os.replace.
+
+    Readers never see a partial file. The temporary file is removed if
+    anything fails, and the error is re-raised.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.stem}-", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def prune(directory: Path, pattern: str, keep: int) -> None:
+    """Delete all but the `keep` most recently written files matching pattern.
+
+    Failures are ignored; pruning is best-effort housekeeping.
+    """
+    try:
+        entries = sorted(
+            ((p.stat().st_mtime_ns, p) for p in directory.glob(pattern)),
+            reverse=True,
+        )
+    except OSError:
+        return
+    for _, path in entries[keep:]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
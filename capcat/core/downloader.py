@@ -4,9 +4,16 @@ Media downloader for Capcat.
 Handles downloading of images, documents, audio, and video files.
 """
 
+import errno
 import os
-from typing import Optional
-from urllib.parse import urlparse
+import re
+import secrets
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import unquote
 
 import requests
 
@@ -37,110 +44,198 @@ session.mount(
 )
 
 
+# File extensions by media kind, flattened into one lookup table below
+_EXTENSIONS_BY_KIND = {
+    "document": (
+        ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
+        ".txt", ".rtf", ".odt", ".ods", ".odp",
+    ),
+    "audio": (
+        ".mp3", ".wav", ".ogg", ".flac", ".aac", ".m4a", ".wma", ".opus",
+    ),
+    "video": (
+        ".mp4", ".avi", ".mkv", ".mov", ".wmv", ".flv", ".webm", ".m4v",
+        ".3gp",
+    ),
+    "image": (
+        ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".tif", ".webp",
+        ".svg", ".ico", ".jpe", ".jfif",
+    ),
+}
+_EXT_KIND = {
+    ext: kind for kind, exts in _EXTENSIONS_BY_KIND.items() for ext in exts
+}
+_HTML_EXTENSIONS = frozenset((".html", ".htm"))
+
+# Extensions kept as-is on saved files - arXiv IDs like "2603.20220" look like
+# they have an extension but ".20220" is not a real one; treat those as
+# "no extension"
+_KNOWN_EXTENSIONS = frozenset((
+    ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
+    ".odt", ".ods", ".odp", ".rtf", ".txt",
+    ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp",
+    ".mp3", ".wav", ".ogg", ".flac", ".mp4", ".avi", ".mov", ".webm",
+))
+_MAX_EXT_LEN = max(len(ext) for ext in _EXT_KIND)
+# File extension for a response MIME type, used to name files whose URL
+# carries no usable extension. HTML is deliberately absent.
+_CONTENT_TYPE_EXTENSIONS = {
+    "application/pdf": ".pdf",
+    "application/msword": ".doc",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
+    "application/vnd.ms-excel": ".xls",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": ".xlsx",
+    "application/vnd.ms-powerpoint": ".ppt",
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation": ".pptx",
+    "text/plain": ".txt",
+    "text/rtf": ".rtf",
+    "application/rtf": ".rtf",
+    "application/vnd.oasis.opendocument.text": ".odt",
+    "application/vnd.oasis.opendocument.spreadsheet": ".ods",
+    "application/vnd.oasis.opendocument.presentation": ".odp",
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/pjpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/bmp": ".bmp",
+    "image/tiff": ".tiff",
+    "image/webp": ".webp",
+    "audio/mpeg": ".mp3",
+    "audio/mp3": ".mp3",
+    "audio/wav": ".wav",
+    "audio/x-wav": ".wav",
+    "audio/wave": ".wav",
+    "audio/ogg": ".ogg",
+    "audio/flac": ".flac",
+    "audio/x-flac": ".flac",
+    "video/mp4": ".mp4",
+    "video/avi": ".avi",
+    "video/x-msvideo": ".avi",
+    "video/quicktime": ".mov",
+    "video/webm": ".webm",
+}
+# Fallback extension per file type when the MIME type does not match it
+_DEFAULT_EXTENSIONS = {
+    "image": ".jpg",
+    "audio": ".mp3",
+    "video": ".mp4",
+    "document": ".bin",
+}
+_BYTES_PER_MB = 1024 * 1024
+# Size cap for audio, video and --media images
+_MAX_MEDIA_SIZE_BYTES = 20 * _BYTES_PER_MB
+_COPY_BUFFER_SIZE = 1024 * 1024
+_EXCLUSIVE_CREATE = (
+    os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+)
+_UNIQUE_FILE_ATTEMPTS = 4
+_NON_NETWORK_SCHEMES = ("data:", "javascript:", "mailto:")
+_SCHEME_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*:")
+
+
+def _last_segment_bounds(url: str) -> Tuple[int, int]:
+    """Locate the last path segment of a URL without parsing it.
+
+    Matches ``os.path.basename(urlparse(url).path)`` for http(s) and
+    relative URLs: query, fragment and ``;params`` are excluded, and a URL
+    with no path yields an empty segment.
+
+    Returns:
+        (start, end) indices of the segment within url
+    """
+    end = len(url)
+    for sep in ("?", "#"):
+        pos = url.find(sep, 0, end)
+        if pos >= 0:
+            end = pos
+
+    # Skip past the authority so a host like "example.pdf" is not matched
+    scheme = _SCHEME_RE.match(url)
+    start = scheme.end() if scheme else 0
+    if url.startswith("//", start):
+        start = url.find("/", start + 2, end)
+        if start < 0:
+            return end, end
+
+    segment = url.rfind("/", start, end) + 1 or start
+    params = url.find(";", segment, end)
+    if params >= 0:
+        end = params
+    return segment, end
+
+
+def classify_url(url: str) -> Optional[str]:
+    """Classify a URL by the file extension of its path.
+
+    Scans the string directly instead of going through urlparse: the
+    query, fragment and ``;params`` are cut off and only the last path
+    segment's extension is lowercased and looked up. Network URLs are
+    cached, so asking each is_*_url predicate about the same link scans it
+    once; data:, javascript: and mailto: links are rejected before the
+    cache so large inline data URIs are never kept as keys.
+
+    Returns:
+        'document', 'audio', 'video', 'image', or None if the URL has no
+        recognised file extension
+    """
+    if url.startswith(_NON_NETWORK_SCHEMES):
+        return None
+    return _classify_network_url(url)
+
+
+@lru_cache(maxsize=8192)
+def _classify_network_url(url: str) -> Optional[str]:
+    """Cached extension lookup behind classify_url."""
+    segment, end = _last_segment_bounds(url)
+    dot = url.rfind(".", segment, end)
+    if dot < 0 or end - dot > _MAX_EXT_LEN:
+        return None
+    return _EXT_KIND.get(url[dot:end].lower())
+
+
 def is_document_url(url: str) -> bool:
     """Check if a URL points to a document file using file extension only (fast)."""
-    # Skip data URLs and other non-network URLs
-    if (
-        url.startswith("data:")
-        or url.startswith("javascript:")
-        or url.startswith("mailto:")
-    ):
-        return False
-
-    try:
-        parsed_url = urlparse(url)
-        # Check file extension (case insensitive) - fast local check only
-        path_lower = parsed_url.path.lower()
-        # Don't treat HTML files as documents to download
-        if path_lower.endswith((".html", ".htm")):
-            return False
-        return path_lower.endswith(
-            (
-                ".pdf",
-                ".doc",
-                ".docx",
-                ".xls",
-                ".xlsx",
-                ".ppt",
-                ".pptx",
-                ".txt",
-                ".rtf",
-                ".odt",
-                ".ods",
-                ".odp",
-            )
-        )
-    except Exception:
-        return False
+    return classify_url(url) == "document"
 
 
 def is_audio_url(url: str) -> bool:
     """Check if a URL points to an audio file using file extension only (fast)."""
-    try:
-        parsed_url = urlparse(url)
-        # Check file extension (case insensitive) - fast local check only
-        path_lower = parsed_url.path.lower()
-        return path_lower.endswith(
-            (".mp3", ".wav", ".ogg", ".flac", ".aac", ".m4a", ".wma", ".opus")
-        )
-    except Exception:
-        return False
+    return classify_url(url) == "audio"
 
 
 def is_video_url(url: str) -> bool:
     """Check if a URL points to a video file using file extension only (fast)."""
-    try:
-        parsed_url = urlparse(url)
-        # Check file extension (case insensitive) - fast local check only
-        path_lower = parsed_url.path.lower()
-        return path_lower.endswith(
-            (
-                ".mp4",
-                ".avi",
-                ".mkv",
-                ".mov",
-                ".wmv",
-                ".flv",
-                ".webm",
-                ".m4v",
-                ".3gp",
-            )
-        )
-    except Exception:
-        return False
+    return classify_url(url) == "video"
 
 
 def is_image_url(url: str) -> bool:
     """Check if a URL points to an image file using file extension only (fast)."""
-    # Skip data URLs and other non-network URLs
-    if (
-        url.startswith("data:")
-        or url.startswith("javascript:")
-        or url.startswith("mailto:")
-    ):
-        return False
+    return classify_url(url) == "image"
 
-    try:
-        parsed_url = urlparse(url)
-        # Check file extension (case insensitive) - fast local check only
-        path_lower = parsed_url.path.lower()
-        image_extensions = (
-            ".jpg",
-            ".jpeg",
-            ".png",
-            ".gif",
-            ".bmp",
-            ".tiff",
-            ".tif",
-            ".webp",
-            ".svg",
-            ".ico",
-            ".jpe",
-            ".jfif",
-        )
-        return path_lower.endswith(image_extensions)
-    except Exception:
-        return False
+
+def _create_unique_file(files_folder: str, filename: str):
+    """Create a new file in files_folder without overwriting an existing one.
+
+    The file is created with O_EXCL, so there is no exists()/open() race.
+    On a collision a short random suffix is appended and creation retried.
+
+    Returns:
+        Tuple of (binary file object open for writing, final filename)
+    """
+    base_name, ext = os.path.splitext(filename)
+    for _ in range(_UNIQUE_FILE_ATTEMPTS):
+        try:
+            fd = os.open(
+                os.path.join(files_folder, filename), _EXCLUSIVE_CREATE, 0o644
+            )
+        except FileExistsError:
+            filename = f"{base_name}_{secrets.token_hex(3)}{ext}"
+        else:
+            return os.fdopen(fd, "wb"), filename
+    raise FileExistsError(
+        errno.EEXIST, "No free file name", os.path.join(files_folder, filename)
+    )
 
 
 @fast_media_retry
@@ -176,60 +271,8 @@ def download_file(
         if file_type == "document":
             request_headers["Accept"] = "application/pdf, application/octet-stream, */*"
 
-        # Make a single HEAD request to check size and content-type
-        response = None
-        content_length = None
-        content_type = None
-
-        head_response = None
-        try:
-            head_response = session.head(
-                file_url,
-                timeout=config.network.head_request_timeout,
-                headers=request_headers,
-            )
-            head_response.raise_for_status()
-            content_length = head_response.headers.get("content-length")
-            content_type = head_response.headers.get(
-                "content-type", ""
-            ).lower()
-
-            # Check if content type suggests this should be skipped (e.g., HTML)
-            if "text/html" in content_type:
-                logger.debug(f"Skipping HTML content for {file_url}")
-                return None
-
-            # Apply size limits
-            if content_length:
-                size_mb = int(content_length) / (1024 * 1024)
-
-                if file_type == "image" and not media_enabled:
-                    max_size_mb = config.processing.max_image_size_bytes / (1024 * 1024)
-                    if size_mb > max_size_mb:
-                        logger.debug(
-                            f"Skipping large image: {file_url} ({size_mb:.1f}MB)"
-                        )
-                        return None
-                else:
-                    if file_type in ("pdf", "document"):
-                        max_size_mb = config.pdf.max_pdf_size_bytes / (1024 * 1024)
-                    else:
-                        max_size_mb = 20
-                    if size_mb > max_size_mb:
-                        logger.info(
-                            f"Skipping {file_type} download: {file_url} is {size_mb:.1f}MB (exceeds {max_size_mb}MB limit)"
-                        )
-                        return None
-        except Exception as e:
-            logger.debug(
-                f"HEAD request failed for {file_url}: {e}, proceeding with download"
-            )
-            # Continue with download if HEAD fails
-        finally:
-            if head_response:
-                head_response.close()
-
-        # Now do the actual download
+        # A single streamed GET: headers arrive before the body, so the
+        # content-type and size checks can abort without reading it
         try:
             response = session.get(
                 file_url,
@@ -238,16 +281,6 @@ def download_file(
                 headers=request_headers,
             )
             response.raise_for_status()
-
-            # If we didn't get content-type from HEAD, get it from GET response
-            if not content_type:
-                content_type = response.headers.get("content-type", "").lower()
-                # Final check for HTML content
-                if "text/html" in content_type:
-                    logger.debug(f"Skipping HTML content for {file_url}")
-                    response.close()
-                    return None
-
         except requests.exceptions.HTTPError as e:
             if e.response is not None and 400 <= e.response.status_code < 500:
                 logger.debug(
@@ -261,20 +294,56 @@ def download_file(
             )
             raise NetworkError(file_url, e)
 
+        content_type = response.headers.get("content-type", "").lower()
+        mime_type = content_type.split(";", 1)[0].strip()
+        content_length = response.headers.get("content-length", "")
+
+        # Check if content type suggests this should be skipped (e.g., HTML)
+        if "text/html" in content_type:
+            logger.debug(f"Skipping HTML content for {file_url}")
+            response.close()
+            return None
+
+        # Apply size limits as plain byte compares; MB figures are only
+        # worked out by the logger when a skip is actually reported
+        # (isdigit alone would accept "²", which int() rejects)
+        if content_length.isascii() and content_length.isdecimal():
+            size = int(content_length)
+
+            if file_type == "image" and not media_enabled:
+                if size > config.processing.max_image_size_bytes:
+                    logger.debug(
+                        "Skipping large image: %s (%.1fMB)",
+                        file_url, size / _BYTES_PER_MB,
+                    )
+                    response.close()
+                    return None
+            else:
+                if file_type in ("pdf", "document"):
+                    max_size = config.pdf.max_pdf_size_bytes
+                else:
+                    max_size = _MAX_MEDIA_SIZE_BYTES
+                if size > max_size:
+                    logger.info(
+                        "Skipping %s download: %s is %.1fMB (exceeds %gMB limit)",
+                        file_type, file_url, size / _BYTES_PER_MB,
+                        max_size / _BYTES_PER_MB,
+                    )
+                    response.close()
+                    return None
+
         # Get filename from URL or create one
-        parsed_url = urlparse(file_url)
-        filename = os.path.basename(parsed_url.path)
+        filename = file_url[slice(*_last_segment_bounds(file_url))]
 
         # Handle URL-encoded filenames (e.g., Substack URLs that contain encoded URLs)
         if filename and "%" in filename:
             try:
-                from urllib.parse import unquote
-
                 decoded_filename = unquote(filename)
                 # If the decoded filename looks like a URL, extract the actual filename
                 if decoded_filename.startswith(("http://", "https://")):
-                    decoded_parsed = urlparse(decoded_filename)
-                    actual_filename = os.path.basename(decoded_parsed.path)
+                    actual_filename = decoded_filename[
+                        slice(*_last_segment_bounds(decoded_filename))
+                    ]
                     if actual_filename and "." in actual_filename:
                         filename = actual_filename
                         logger.debug(
@@ -287,82 +356,17 @@ def download_file(
                 # Continue with original filename
 
         # Prevent HTML files from being downloaded as documents
-        if filename and filename.lower().endswith((".html", ".htm")):
+        if os.path.splitext(filename)[1].lower() in _HTML_EXTENSIONS:
             logger.debug(f"Skipping HTML file download for {file_url}")
             return None
 
         # If no filename in URL, create one based on content type (already retrieved)
         if not filename or "." not in filename:
-            if not content_type:
-                content_type = response.headers.get("content-type", "")
-
-            if file_type == "image":
-                if "jpeg" in content_type or "jpg" in content_type:
-                    filename = "image_1.jpg"
-                elif "png" in content_type:
-                    filename = "image_1.png"
-                elif "gif" in content_type:
-                    filename = "image_1.gif"
-                else:
-                    filename = "image_1.jpg"
-            elif file_type == "audio":
-                if "mpeg" in content_type or "mp3" in content_type:
-                    filename = f"audio_{1}.mp3"
-                elif "wav" in content_type:
-                    filename = f"audio_{1}.wav"
-                elif "ogg" in content_type:
-                    filename = f"audio_{1}.ogg"
-                elif "flac" in content_type:
-                    filename = f"audio_{1}.flac"
-                else:
-                    filename = f"audio_{1}.mp3"
-            elif file_type == "video":
-                if "mp4" in content_type:
-                    filename = f"video_{1}.mp4"
-                elif "avi" in content_type:
-                    filename = f"video_{1}.avi"
-                elif "quicktime" in content_type:
-                    filename = f"video_{1}.mov"
-                elif "webm" in content_type:
-                    filename = f"video_{1}.webm"
-                else:
-                    filename = f"video_{1}.mp4"
-            else:  # document
-                if "pdf" in content_type:
-                    filename = f"document_{1}.pdf"
-                elif "msword" in content_type:
-                    filename = f"document_{1}.doc"
-                elif "officedocument" in content_type:
-                    if "word" in content_type:
-                        filename = f"document_{1}.docx"
-                    elif "excel" in content_type:
-                        filename = f"document_{1}.xlsx"
-                    elif "presentation" in content_type:
-                        filename = f"document_{1}.pptx"
-                    else:
-                        filename = f"document_{1}.docx"  # default to docx
-                elif "rtf" in content_type:
-                    filename = f"document_{1}.rtf"
-                elif "text/plain" in content_type:
-                    filename = f"document_{1}.txt"
-                elif "text/html" in content_type:
-                    # HTML files should not be downloaded as documents
-                    # This should not happen, but if it does, we should skip them
-                    logger.debug(
-                        f"Skipping HTML file download for {file_url} with content type {content_type}"
-                    )
-                    return None
-                elif "opendocument" in content_type:
-                    if "text" in content_type:
-                        filename = f"document_{1}.odt"
-                    elif "spreadsheet" in content_type:
-                        filename = f"document_{1}.ods"
-                    elif "presentation" in content_type:
-                        filename = f"document_{1}.odp"
-                    else:
-                        filename = f"document_{1}.odt"  # default to odt
-                else:
-                    filename = f"document_{1}.bin"
+            kind = file_type if file_type in _DEFAULT_EXTENSIONS else "document"
+            ext = _CONTENT_TYPE_EXTENSIONS.get(mime_type)
+            if _EXT_KIND.get(ext) != kind:
+                ext = _DEFAULT_EXTENSIONS[kind]
+            filename = f"{kind}_1{ext}"
 
         # Create the folder only now that we have validated content to save
         try:
@@ -370,69 +374,26 @@ def download_file(
         except OSError as e:
             raise FileSystemError("create directory", files_folder, e)
 
-        # Ensure unique filename (now that folder exists)
         base_name, ext = os.path.splitext(filename)
-        counter = 1
-        while os.path.exists(os.path.join(files_folder, filename)):
-            filename = f"{base_name}_{counter}{ext}"
-            counter += 1
-
-        # Known file extensions - arXiv IDs like "2603.20220" look like they have
-        # an extension but ".20220" is not a real one; treat those as "no extension"
-        _KNOWN_EXTENSIONS = {
-            ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
-            ".odt", ".ods", ".odp", ".rtf", ".txt",
-            ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp",
-            ".mp3", ".wav", ".ogg", ".flac", ".mp4", ".avi", ".mov", ".webm",
-        }
         if ext and ext.lower() not in _KNOWN_EXTENSIONS:
             # Unrecognised extension - treat filename as having no extension
             base_name = filename
             ext = ""
 
         # If the file has no extension, try to determine it from content type (already retrieved)
-        if not ext and content_type:
-            content_type_clean = content_type.split(";")[0].strip()
-            extension_map = {
-                "application/pdf": ".pdf",
-                "application/msword": ".doc",
-                "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
-                "application/vnd.ms-excel": ".xls",
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": ".xlsx",
-                "application/vnd.ms-powerpoint": ".ppt",
-                "application/vnd.openxmlformats-officedocument.presentationml.presentation": ".pptx",
-                "text/plain": ".txt",
-                # HTML files should not be downloaded as documents
-                # 'text/html': '.html',  # Removed this line
-                "text/rtf": ".rtf",
-                "application/rtf": ".rtf",
-                "application/vnd.oasis.opendocument.text": ".odt",
-                "application/vnd.oasis.opendocument.spreadsheet": ".ods",
-                "application/vnd.oasis.opendocument.presentation": ".odp",
-                "image/jpeg": ".jpg",
-                "image/png": ".png",
-                "image/gif": ".gif",
-                "image/bmp": ".bmp",
-                "image/tiff": ".tiff",
-                "image/webp": ".webp",
-                "audio/mpeg": ".mp3",
-                "audio/wav": ".wav",
-                "audio/ogg": ".ogg",
-                "video/mp4": ".mp4",
-                "video/avi": ".avi",
-                "video/quicktime": ".mov",
-                "video/webm": ".webm",
-            }
-            if content_type_clean in extension_map:
-                filename = base_name + extension_map[content_type_clean]
-                ext = extension_map[content_type_clean]
-
-        # Save the file using streaming to handle large files
+        if not ext and mime_type in _CONTENT_TYPE_EXTENSIONS:
+            ext = _CONTENT_TYPE_EXTENSIONS[mime_type]
+            filename = base_name + ext
+
+        # Stream the body straight into the file in large blocks; the copy
+        # loop runs inside shutil rather than once per 8 KiB chunk here
         file_path = os.path.join(files_folder, filename)
         try:
-            with open(file_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            response.raw.decode_content = True
+            f, filename = _create_unique_file(files_folder, filename)
+            file_path = os.path.join(files_folder, filename)
+            with f:
+                shutil.copyfileobj(response.raw, f, _COPY_BUFFER_SIZE)
             logger.debug(f"Successfully downloaded {file_type}: {filename}")
         except OSError as e:
             raise FileSystemError("write file", file_path, e)
@@ -455,3 +416,63 @@ def download_file(
     except Exception as e:
         logger.debug(f"Could not download {file_type} from {file_url}: {e}")
         raise
+
+
+def download_files(
+    file_urls: Iterable[str],
+    folder_path: str,
+    file_type: str,
+    media_enabled: bool = False,
+) -> Dict[str, Optional[str]]:
+    """Download several files of one type concurrently.
+
+    Requests run on one process-wide thread pool no wider than the shared
+    session's connection pool, however many articles download at once, so
+    every worker reuses a kept-alive connection rather than waiting on a
+    sequential GET. Duplicate URLs are fetched once.
+
+    Args:
+        file_urls: URLs of the files to download
+        folder_path: Path to the article folder
+        file_type: Type of file ('image', 'audio', 'video', 'document')
+        media_enabled: Whether --media flag is enabled (affects size limits)
+
+    Returns:
+        Dictionary mapping each URL to its relative path, or None if the
+        download was skipped or failed
+    """
+    urls = list(dict.fromkeys(file_urls))
+    logger = get_logger(__name__)
+
+    def fetch(url: str) -> Optional[str]:
+        try:
+            return download_file(url, folder_path, file_type, media_enabled)
+        except Exception as e:
+            logger.debug(f"Could not download {file_type} from {url}: {e}")
+            return None
+
+    if len(urls) <= 1:
+        return {url: fetch(url) for url in urls}
+
+    return dict(zip(urls, _get_download_executor().map(fetch, urls)))
+
+
+# Shared by every download_files call; sized to the session's pool so
+# concurrent articles cannot open more connections than it keeps alive
+_download_executor: Optional[ThreadPoolExecutor] = None
+_download_executor_lock = threading.Lock()
+
+
+def _get_download_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor used by download_files."""
+    global _download_executor
+
+    if _download_executor is None:
+        with _download_executor_lock:
+            if _download_executor is None:
+                _download_executor = ThreadPoolExecutor(
+                    max_workers=config.network.pool_maxsize,
+                    thread_name_prefix="capcat-download",
+                )
+
+    return _download_executor
@@ -10,6 +10,7 @@ from threading import Lock
 from typing import Dict, Optional
 
 import requests
+from urllib3.util.retry import Retry
 
 from capcat.core.config import get_config
 from capcat.core.logging_config import get_logger
@@ -31,6 +32,9 @@ USER_AGENTS = [
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:122.0) Gecko/20100101 Firefox/122.0',
 ]
 
+# Transient upstream failures worth retrying at the connection-pool level
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
 
 class SessionPool:
     """
@@ -113,11 +117,23 @@ class SessionPool:
 
         self.logger.debug(f"Using User-Agent for {source_name}: {user_agent[:50]}...")
 
-        # Configure adapters with connection pooling
+        # Configure adapters with connection pooling. pool_block=False lets a
+        # burst of PDF/media downloads open extra connections instead of
+        # waiting, while up to pool_maxsize of them stay alive for reuse.
+        # raise_on_status=False hands the final 5xx response back so callers
+        # still see it through raise_for_status().
+        retries = Retry(
+            total=self.config.network.max_retries,
+            backoff_factor=0.3,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            raise_on_status=False,
+        )
         adapter = requests.adapters.HTTPAdapter(
             pool_connections=self.config.network.pool_connections,
             pool_maxsize=self.config.network.pool_maxsize,
-            max_retries=self.config.network.max_retries,
+            max_retries=retries,
+            pool_block=False,
         )
 
         session.mount("http://", adapter)
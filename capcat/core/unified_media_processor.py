@@ -152,24 +152,21 @@ class UnifiedMediaProcessor:
         if not matches:
             return content
 
-        from .downloader import download_file
+        from .downloader import download_files
 
-        downloaded = 0
-
-        for alt_text, img_url in matches:
-            # Skip URLs that are already local
-            if img_url.startswith(("images/", "files/", "./")):
-                continue
+        # Skip URLs that are already local
+        remote_urls = [
+            img_url
+            for _alt_text, img_url in matches
+            if not img_url.startswith(("images/", "files/", "./"))
+        ]
+        local_paths = download_files(remote_urls, article_folder, "image", False)
 
-            try:
-                local_path = download_file(
-                    img_url, article_folder, "image", False
-                )
-                if local_path:
-                    content = content.replace(img_url, local_path)
-                    downloaded += 1
-            except Exception as exc:
-                logger.debug(f"Inline image download failed {img_url}: {exc}")
+        downloaded = 0
+        for img_url, local_path in local_paths.items():
+            if local_path:
+                content = content.replace(img_url, local_path)
+                downloaded += 1
 
         if downloaded:
             logger.debug(
@@ -214,7 +214,7 @@ class TestMaxRetriesConfig:
             mock_adapter.return_value = MagicMock()
             pool._create_session("test_source")
             kwargs = mock_adapter.call_args.kwargs
-            assert kwargs["max_retries"] == 0
+            assert kwargs["max_retries"].total == 0
 
     def test_max_retries_custom_value(self):
         pool = self._pool_with_retries(5)
@@ -222,7 +222,7 @@ class TestMaxRetriesConfig:
             mock_adapter.return_value = MagicMock()
             pool._create_session("test_source")
             kwargs = mock_adapter.call_args.kwargs
-            assert kwargs["max_retries"] == 5
+            assert kwargs["max_retries"].total == 5
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,87 @@
+"""
+Error articles: each failure is classified into the right category.
+
+_create_error_article matches the lowercased error type and details
+against _ERROR_TABLE in order; the first match picks the category and
+recommendation written to the generated article.
+"""
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from capcat.core.article_fetcher import NewsSourceArticleFetcher
+
+
+_SOURCE_CONFIG = {
+    "name": "test",
+    "content_selectors": ["body"],
+    "skip_patterns": [],
+}
+
+
+@pytest.fixture
+def fetcher():
+    session = MagicMock()
+    session.timeout = None
+    with patch("capcat.core.article_fetcher.get_config"), \
+         patch("capcat.core.article_fetcher.initialize_pdf_manager"), \
+         patch("capcat.core.ethical_scraping.get_ethical_manager"):
+        return NewsSourceArticleFetcher(_SOURCE_CONFIG, session)
+
+
+def _error_article(fetcher, tmp_path, error_type, error_details):
+    success, _, folder = fetcher._create_error_article(
+        "Some Title",
+        "https://example.com/a",
+        error_type,
+        error_details,
+        str(tmp_path),
+    )
+    assert success
+    (name,) = [f for f in os.listdir(folder) if f.endswith(".md")]
+    with open(os.path.join(folder, name), encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize(
+    "error_type, error_details, category, advice",
+    [
+        ("HTTP 403", "", "Access Denied (403 Forbidden)", "ethical scraping"),
+        ("HTTP error", "Forbidden", "Access Denied (403 Forbidden)",
+         "ethical scraping"),
+        ("HTTP 404", "", "Article Not Found (404)", "may have been removed"),
+        ("HTTP error", "Not Found", "Article Not Found (404)",
+         "may have been removed"),
+        ("Timeout", "read timed out", "Connection Timeout",
+         "took too long"),
+        ("ConnectionError", "refused", "Connection Error",
+         "Could not establish connection"),
+        ("HTTP 500", "", "Server Error", "experiencing issues"),
+        ("HTTP 502", "", "Server Error", "experiencing issues"),
+        ("HTTP 503", "", "Server Error", "experiencing issues"),
+        ("HTTP 504", "", "Server Error", "experiencing issues"),
+        ("ValueError", "bad markup", "Unknown Error",
+         "Try accessing the article directly"),
+    ],
+)
+def test_error_category_and_recommendation(
+    fetcher, tmp_path, error_type, error_details, category, advice
+):
+    content = _error_article(fetcher, tmp_path, error_type, error_details)
+    assert f"**Error:** {category}\n" in content
+    assert advice in content
+
+
+def test_first_matching_category_wins(fetcher, tmp_path):
+    # "connection timeout" matches both timeout and connection; timeout is
+    # listed first.
+    content = _error_article(
+        fetcher, tmp_path, "Error", "Connection timeout after 30s"
+    )
+    assert "**Error:** Connection Timeout\n" in content
+
+
+def test_error_details_are_matched_case_insensitively(fetcher, tmp_path):
+    content = _error_article(fetcher, tmp_path, "Error", "403 FORBIDDEN")
+    assert "**Error:** Access Denied (403 Forbidden)\n" in content
@@ -0,0 +1,74 @@
+"""CircuitBreakerPool breaker lookup under contention."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from capcat.core import circuit_breaker
+from capcat.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerPool,
+)
+
+
+def _pool() -> CircuitBreakerPool:
+    return CircuitBreakerPool(
+        {
+            "default": CircuitBreakerConfig(failure_threshold=5),
+            "slow": CircuitBreakerConfig(failure_threshold=2),
+        }
+    )
+
+
+class TestGetBreaker:
+    def test_concurrent_first_lookups_share_one_breaker(self, monkeypatch):
+        class SlowBreaker(CircuitBreaker):
+            def __init__(self, *args, **kwargs):
+                time.sleep(0.01)  # widen the window between check and insert
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(circuit_breaker, "CircuitBreaker", SlowBreaker)
+        pool = _pool()
+        start = threading.Barrier(16)
+
+        def lookup(source):
+            start.wait()
+            return pool.get_breaker(source)
+
+        sources = ["slow", "hn"] * 8
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            breakers = list(executor.map(lookup, sources))
+
+        assert len({id(b) for b in breakers[0::2]}) == 1
+        assert len({id(b) for b in breakers[1::2]}) == 1
+        assert breakers[0].config.failure_threshold == 2
+        assert breakers[1].config.failure_threshold == 5
+        assert sorted(pool.breakers) == ["hn", "slow"]
+
+    def test_existing_breaker_lookup_does_not_wait_for_pool_lock(self):
+        pool = _pool()
+        existing = pool.get_breaker("hn")
+        result = []
+
+        with pool.lock:
+            worker = threading.Thread(
+                target=lambda: result.append(pool.get_breaker("hn"))
+            )
+            worker.start()
+            worker.join(timeout=1)
+            assert result == [existing]
+        worker.join()
+
+    def test_stats_snapshot_while_breakers_are_added(self):
+        pool = _pool()
+
+        def add(n):
+            pool.get_breaker(f"s{n}")
+            return pool.get_all_states()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(add, range(32)))
+
+        assert len(pool.get_all_stats()) == 32
+        pool.reset_all()
+        assert set(pool.get_all_states().values()) == {"closed"}
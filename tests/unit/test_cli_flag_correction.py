@@ -0,0 +1,82 @@
+"""Single-dash long-flag correction shared by CLIValidator and CLIRecovery."""
+import pytest
+
+from capcat.core.cli_recovery import CLIRecovery
+from capcat.core.cli_validation import CLIValidationError, CLIValidator
+
+
+class TestFlagCorrection:
+    """Both correction paths rewrite ' -flag' to ' --flag' in one pass."""
+
+    def test_suggest_correct_command_fixes_every_flag(self):
+        suggestion = CLIValidator().suggest_correct_command(
+            "capcat fetch hn -html -count 5"
+        )
+        assert suggestion == "capcat fetch hn --html --count 5"
+
+    def test_suggest_correct_command_returns_none_when_clean(self):
+        assert CLIValidator().suggest_correct_command(
+            "capcat fetch hn --html"
+        ) is None
+
+    def test_auto_correct_leaves_longer_tokens_alone(self):
+        corrected = CLIRecovery()._auto_correct_command(
+            "capcat fetch hn -htmlx -quiet"
+        )
+        assert corrected == "capcat fetch hn -htmlx --quiet"
+
+    def test_auto_correct_fixes_flag_with_equals_value(self):
+        corrected = CLIRecovery()._auto_correct_command(
+            "capcat fetch hn -count=5 -output=out"
+        )
+        assert corrected == "capcat fetch hn --count=5 --output=out"
+
+
+class TestUnknownArgSuggestions:
+    """validate_unknown_args suggests close flags for typos."""
+
+    def test_typo_suggests_close_flag(self):
+        with pytest.raises(CLIValidationError, match="--verbose"):
+            CLIValidator().validate_unknown_args(
+                ["--verbsoe"], ["--verbose", "--count", "--html"]
+            )
+
+    def test_unrelated_flag_points_to_help(self):
+        with pytest.raises(CLIValidationError, match="see --help"):
+            CLIValidator().validate_unknown_args(
+                ["--zzzzzzzz"], ["--verbose", "--count", "--html"]
+            )
+
+    def test_length_prefilter_keeps_truncated_flag(self):
+        """A short prefix like --verb is still within reach of --verbose."""
+        with pytest.raises(CLIValidationError, match="--verbose"):
+            CLIValidator().validate_unknown_args(
+                ["--verb"], ["--verbose", "--count", "--html"]
+            )
+
+    def test_prefix_match_found_without_fuzzy_scoring(self):
+        """Flags sharing the first three letters are suggested directly."""
+        with pytest.raises(CLIValidationError, match="--media"):
+            CLIValidator().validate_unknown_args(
+                ["--medai-files"], ["--verbose", "--media", "--html"]
+            )
+
+
+class TestHelpTriggeredByError:
+    """Suspicious single-dash flags are reported in one pass."""
+
+    def test_reports_each_suspicious_flag(self, capsys):
+        handled = CLIRecovery().handle_help_triggered_by_error(
+            ["fetch", "hn", "-html", "-quiet"]
+        )
+        err = capsys.readouterr().err
+        assert handled is True
+        assert "'-html' should be '--html'" in err
+        assert "'-quiet' should be '--quiet'" in err
+        assert "capcat fetch hn --html --quiet" in err
+
+    def test_clean_args_are_not_handled(self, capsys):
+        assert CLIRecovery().handle_help_triggered_by_error(
+            ["fetch", "hn", "--html"]
+        ) is False
+        assert capsys.readouterr().err == ""
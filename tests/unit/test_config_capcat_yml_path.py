@@ -72,3 +72,25 @@ class TestConfigManagerFindsVaultCapcatYml:
         assert cfg.source_overrides.get("hn", {}).get("article_count") == 3, (
             "Config/capcat.yml (3) must win over root capcat.yml (99)"
         )
+
+    def test_config_subdir_json_is_not_a_config_location(self, tmp_path):
+        """Only YAML is read from Config/; a stray capcat.json there is ignored."""
+        cfg_dir = tmp_path / "Config"
+        cfg_dir.mkdir()
+        (cfg_dir / "capcat.json").write_text(
+            '{"sources": [{"name": "hn", "article_count": 42}]}'
+        )
+        (tmp_path / "capcat.yml").write_text(yaml.dump({
+            "sources": [{"name": "hn", "article_count": 7}],
+        }))
+
+        old_cwd = os.getcwd()
+        os.chdir(tmp_path)
+        try:
+            from capcat.core.config import ConfigManager
+            mgr = ConfigManager()
+            cfg = mgr.load_config()
+        finally:
+            os.chdir(old_cwd)
+
+        assert cfg.source_overrides.get("hn", {}).get("article_count") == 7
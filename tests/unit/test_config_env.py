@@ -0,0 +1,46 @@
+"""CAPCAT_* environment variables override loaded configuration."""
+import os
+
+from capcat.core.config import ConfigManager, FetchNewsConfig
+
+
+def _load_env() -> FetchNewsConfig:
+    mgr = ConfigManager()
+    mgr._config = FetchNewsConfig()
+    mgr._load_from_env()
+    return mgr._config
+
+
+class TestLoadFromEnv:
+    def test_typed_values_are_converted(self, monkeypatch):
+        monkeypatch.setenv("CAPCAT_READ_TIMEOUT", "45")
+        monkeypatch.setenv("CAPCAT_RETRY_DELAY", "2.5")
+        monkeypatch.setenv("CAPCAT_LOG_LEVEL", "DEBUG")
+        cfg = _load_env()
+        assert cfg.network.read_timeout == 45
+        assert cfg.network.retry_delay == 2.5
+        assert cfg.logging.default_level == "DEBUG"
+
+    def test_boolean_values(self, monkeypatch):
+        monkeypatch.setenv("CAPCAT_DOWNLOAD_VIDEOS", "Yes")
+        monkeypatch.setenv("CAPCAT_DOWNLOAD_IMAGES", "off")
+        cfg = _load_env()
+        assert cfg.processing.download_videos is True
+        assert cfg.processing.download_images is False
+
+    def test_short_boolean_spellings(self, monkeypatch):
+        monkeypatch.setenv("CAPCAT_DOWNLOAD_VIDEOS", "y")
+        monkeypatch.setenv("CAPCAT_DOWNLOAD_AUDIO", "T")
+        cfg = _load_env()
+        assert cfg.processing.download_videos is True
+        assert cfg.processing.download_audio is True
+
+    def test_invalid_value_keeps_default(self, monkeypatch):
+        monkeypatch.setenv("CAPCAT_MAX_WORKERS", "many")
+        cfg = _load_env()
+        assert cfg.processing.max_workers == 8
+
+    def test_no_capcat_variables_keeps_defaults(self, monkeypatch):
+        for name in [n for n in os.environ if n.startswith("CAPCAT_")]:
+            monkeypatch.delenv(name)
+        assert _load_env() == FetchNewsConfig()
@@ -0,0 +1,62 @@
+"""Parsed config files are cached by (path, mtime, size) between runs."""
+import os
+import sys
+
+from capcat.core.config import ConfigManager, FetchNewsConfig
+
+
+def _manager() -> ConfigManager:
+    mgr = ConfigManager()
+    mgr._config = FetchNewsConfig()
+    return mgr
+
+
+class TestConfigFileCache:
+    def test_unchanged_file_is_served_from_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.delenv("CAPCAT_CONFIG_NOCACHE", raising=False)
+        config_file = tmp_path / "capcat.yml"
+        config_file.write_text("network:\n  read_timeout: 42\n")
+
+        _manager()._load_from_file(str(config_file))
+        assert list((tmp_path / "cache" / "capcat").glob("config-*.pkl"))
+
+        # A cache hit must not need the YAML parser at all
+        config_impl = sys.modules[ConfigManager.__module__]
+        monkeypatch.setattr(config_impl, "_yaml_codecs", lambda: None)
+        mgr = _manager()
+        mgr._load_from_file(str(config_file))
+        assert mgr._config.network.read_timeout == 42
+
+    def test_modified_file_is_reparsed(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.delenv("CAPCAT_CONFIG_NOCACHE", raising=False)
+        config_file = tmp_path / "capcat.yml"
+        config_file.write_text("network:\n  read_timeout: 42\n")
+        _manager()._load_from_file(str(config_file))
+
+        config_file.write_text("network:\n  read_timeout: 7\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        mgr = _manager()
+        mgr._load_from_file(str(config_file))
+        assert mgr._config.network.read_timeout == 7
+
+    def test_nocache_env_skips_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.setenv("CAPCAT_CONFIG_NOCACHE", "1")
+        config_file = tmp_path / "capcat.yml"
+        config_file.write_text("network:\n  read_timeout: 42\n")
+        _manager()._load_from_file(str(config_file))
+        assert not (tmp_path / "cache" / "capcat").exists()
+
+    def test_cache_files_are_pruned(self, tmp_path, monkeypatch):
+        config_impl = sys.modules[ConfigManager.__module__]
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.delenv("CAPCAT_CONFIG_NOCACHE", raising=False)
+        monkeypatch.setattr(config_impl, "_CONFIG_CACHE_LIMIT", 2)
+        for i in range(4):
+            config_file = tmp_path / f"capcat-{i}.yml"
+            config_file.write_text("network:\n  read_timeout: 42\n")
+            _manager()._load_from_file(str(config_file))
+        assert len(list((tmp_path / "cache" / "capcat").glob("config-*.pkl"))) == 2
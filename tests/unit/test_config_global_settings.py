@@ -50,6 +50,19 @@ class TestFetchNewsConfigPdf:
         cfg = FetchNewsConfig.from_dict(data)
         assert cfg.ui.progress_spinner_style == "wave"
 
+    def test_from_dict_media_preserved(self):
+        data = {"media": {"download_pdfs": True}}
+        cfg = FetchNewsConfig.from_dict(data)
+        assert cfg.media.download_pdfs is True
+
+    def test_from_dict_round_trips_to_dict(self):
+        cfg = FetchNewsConfig()
+        cfg.network.read_timeout = 3
+        cfg.logging.default_level = "DEBUG"
+        restored = FetchNewsConfig.from_dict(cfg.to_dict())
+        assert restored.network.read_timeout == 3
+        assert restored.logging.default_level == "DEBUG"
+
 
 class TestFilterFields:
     def test_keeps_known_fields(self):
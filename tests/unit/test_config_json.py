@@ -0,0 +1,32 @@
+"""JSON config files round-trip with and without orjson installed."""
+import json
+import sys
+
+import pytest
+
+from capcat.core.config import ConfigManager, FetchNewsConfig
+
+config_impl = sys.modules[ConfigManager.__module__]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_then_load_json(tmp_path, monkeypatch, use_orjson):
+    if use_orjson and config_impl._orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(config_impl, "_orjson", None)
+    monkeypatch.setenv("CAPCAT_CONFIG_NOCACHE", "1")
+
+    mgr = ConfigManager()
+    mgr._config = FetchNewsConfig()
+    mgr._config.network.read_timeout = 99
+    mgr._config.ui.progress_spinner_style = "wave"
+    path = tmp_path / "capcat.json"
+    assert mgr.save_config(str(path))
+    assert json.loads(path.read_text())["network"]["read_timeout"] == 99
+
+    loaded = ConfigManager()
+    loaded._config = FetchNewsConfig()
+    loaded._load_from_file(str(path))
+    assert loaded._config.network.read_timeout == 99
+    assert loaded._config.ui.progress_spinner_style == "wave"
@@ -0,0 +1,121 @@
+"""HTML-to-Markdown conversion runs in the shared worker pool."""
+from capcat.core.article_fetcher import convert_html_with_timeout
+from capcat.core.config import get_config
+from capcat.core.conversion_executor import convert_html
+
+
+class TestConvertHtml:
+    def test_settings_override_worker_config(self):
+        processing = get_config().processing
+        original = processing.markdown_line_breaks
+        try:
+            assert convert_html(
+                "<p>a<br>b</p>", None, {"markdown_line_breaks": False}
+            ) == "a\nb"
+            assert convert_html(
+                "<p>a<br>b</p>", None, {"markdown_line_breaks": True}
+            ) == "a\\\nb"
+        finally:
+            processing.markdown_line_breaks = original
+
+    def test_convert_with_timeout_uses_pool(self):
+        html = "<html><body><h1>Test</h1><p>hi <a href='/x'>l</a></p></body></html>"
+        result = convert_html_with_timeout(html, "https://example.com", timeout=60)
+        assert result == "# Test\n\nhi [l](https://example.com/x)"
+
+
+class TestExecutorPool:
+    def test_concurrent_first_use_creates_one_executor(self, monkeypatch):
+        import threading
+        from capcat.core.conversion_executor import ConversionExecutorPool
+
+        pool = ConversionExecutorPool()
+        pool.shutdown()
+        created = []
+        real_create = pool._create_executor
+
+        def slow_create():
+            created.append(1)
+            threading.Event().wait(0.05)
+            return real_create()
+
+        monkeypatch.setattr(pool, "_create_executor", slow_create)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(pool.executor))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(created) == 1
+        assert all(r is results[0] for r in results)
+        pool.shutdown()
+
+    def test_late_broken_pool_handler_keeps_replacement(self, monkeypatch):
+        """A thread retiring a broken pool must not shut down its successor.
+
+        B and A both fail on the broken pool and A retires it. C then
+        gets the replacement, and B's handler runs before C submits.
+        """
+        import threading
+        from concurrent.futures import Executor, Future, ThreadPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+        from capcat.core import article_fetcher
+        from capcat.core.conversion_executor import ConversionExecutorPool
+
+        b_submitting = threading.Event()
+        release_b = threading.Event()
+
+        class BrokenPool(Executor):
+            calls = 0
+
+            def submit(self, fn, *args, **kwargs):
+                BrokenPool.calls += 1
+                if BrokenPool.calls == 1:
+                    b_submitting.set()
+                    release_b.wait(5)
+                future = Future()
+                future.set_exception(BrokenProcessPool("worker died"))
+                return future
+
+        pool = ConversionExecutorPool()
+        pool.shutdown()
+        executors = iter(
+            [BrokenPool(), ThreadPoolExecutor(max_workers=1)]
+        )
+        monkeypatch.setattr(pool, "_create_executor", lambda: next(executors))
+
+        html = "<h1>Test</h1>"
+        b_result = []
+        b = threading.Thread(
+            target=lambda: b_result.append(
+                convert_html_with_timeout(html, "https://b", timeout=5)
+            )
+        )
+        b.start()
+        assert b_submitting.wait(5)
+        # A hits the broken pool and retires it
+        assert convert_html_with_timeout(html, "https://a", timeout=5) == ""
+
+        real_get = article_fetcher.get_conversion_executor
+
+        def get_then_let_b_fail():
+            executor = real_get()
+            release_b.set()
+            b.join(5)
+            return executor
+
+        monkeypatch.setattr(
+            article_fetcher, "get_conversion_executor", get_then_let_b_fail
+        )
+        try:
+            assert convert_html_with_timeout(
+                html, "https://c", timeout=5
+            ) == "# Test"
+            assert b_result == [""]
+        finally:
+            release_b.set()
+            b.join(5)
+            pool.shutdown()
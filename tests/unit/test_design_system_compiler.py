@@ -0,0 +1,300 @@
+"""DesignSystemCompiler memoization and variable handling."""
+from unittest.mock import patch
+
+import pytest
+
+from capcat.core import design_system_compiler
+from capcat.core.design_system_compiler import DesignSystemCompiler
+
+
+DESIGN_SYSTEM = """\
+:root {
+  --space-base: 1rem;
+  --space-large: calc(var(--space-base) * 2);
+  --text-body: 1.125rem; /* body copy */
+  --color-ink: #111;
+}
+"""
+
+
+@pytest.fixture
+def compiler(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv("CAPCAT_CONFIG_NOCACHE", raising=False)
+    (tmp_path / "design-system.css").write_text(DESIGN_SYSTEM)
+    return DesignSystemCompiler(themes_dir=tmp_path)
+
+
+class TestMemoization:
+    def test_replace_is_memoized_per_input(self, compiler, monkeypatch):
+        css = "p { margin: var(--space-large); color: var(--color-ink); }"
+        first = compiler.replace_css_variables(css)
+        assert "calc(1rem * 2)" in first
+        assert "var(--color-ink)" in first
+
+        monkeypatch.setattr(compiler, "_ensure_built", pytest.fail)
+        assert compiler.replace_css_variables(css) == first
+
+    def test_clear_cache_drops_memo(self, compiler, tmp_path):
+        css = "p { margin: var(--space-base); }"
+        compiler.replace_css_variables(css)
+        path = tmp_path / "design-system.css"
+        path.write_text(DESIGN_SYSTEM.replace("1rem;", "2rem;", 1))
+        compiler.clear_cache()
+        assert "2rem" in compiler.replace_css_variables(css)
+
+    def test_compile_is_memoized(self, compiler, monkeypatch):
+        target = "/* COMPILATION_TARGET_START */x/* COMPILATION_TARGET_END */"
+        first = compiler.compile_design_system(target)
+        assert "--space-base: 1rem; /* 16px at 16px base */" in first
+
+        monkeypatch.setattr(compiler, "_ensure_built", pytest.fail)
+        assert compiler.compile_design_system(target) == first
+
+    def test_compiled_section_generated_once_per_build(self, compiler):
+        targets = [
+            f"/* {i} */\n/* COMPILATION_TARGET_START */"
+            "/* COMPILATION_TARGET_END */"
+            for i in range(3)
+        ]
+        with patch.object(
+            compiler,
+            "_generate_compiled_css_section",
+            wraps=compiler._generate_compiled_css_section,
+        ) as generate:
+            results = [compiler.compile_design_system(t) for t in targets]
+        generate.assert_called_once()
+        assert [r.split("\n", 1)[0] for r in results] == [
+            "/* 0 */", "/* 1 */", "/* 2 */"
+        ]
+        assert all("--space-base: 1rem;" in r for r in results)
+
+
+class TestReplaceCssVariables:
+    def test_single_pass_keeps_colors_and_unknowns(self, compiler):
+        css = (
+            "@import url('design-system.css');\n"
+            "a { padding: var(--space-base) var(--space-unknown); "
+            "color: var(--color-ink); font-size: var(--text-body); }"
+        )
+        result = compiler.replace_css_variables(css)
+        assert "@import" not in result
+        assert "padding: 1rem var(--space-unknown);" in result
+        assert "color: var(--color-ink);" in result
+        assert "font-size: 1.125rem;" in result
+
+
+class TestExtractCssVariables:
+    def test_comments_are_stripped_before_matching(self, compiler):
+        variables = compiler._extract_css_variables(
+            ":root {\n"
+            "  --a: 1rem /* inline */;\n"
+            "  /* --retired: 2rem; */\n"
+            "  --b: 3px; /* note; with semicolon */\n"
+            "}\n"
+        )
+        assert variables == {"a": "1rem", "b": "3px"}
+
+
+class TestResolveVariableReferences:
+    def test_deep_chain_resolves_fully(self, compiler):
+        # Deeper than the old 10-pass limit, defined in reverse order
+        variables = {f"v{i}": f"var(--v{i + 1})" for i in range(15)}
+        variables["v15"] = "4px"
+        resolved = compiler._resolve_variable_references(variables)
+        assert set(resolved.values()) == {"4px"}
+        assert list(resolved) == list(variables)
+
+    def test_cycles_are_left_unresolved(self, compiler):
+        variables = {
+            "a": "var(--b) var(--b)",
+            "b": "var(--a) var(--a)",
+            "d": "var(--a) var(--c)",
+            "c": "1px",
+        }
+        resolved = compiler._resolve_variable_references(variables)
+        assert resolved == {**variables, "c": "1px"}
+
+
+class TestCompiledSection:
+    def test_variables_grouped_by_prefix(self, compiler):
+        section = compiler._generate_compiled_css_section(
+            {
+                "space-b": "2rem",
+                "text-a": "1rem",
+                "font-weight-bold": "700",
+                "z-index": "3",
+                "space-a": "1rem",
+            },
+            include_px_references=False,
+        )
+        body = section.split(":root {\n", 1)[1].splitlines()
+        assert body == [
+            "  /* Typography */",
+            "  --text-a: 1rem;",
+            "",
+            "  /* Spacing */",
+            "  --space-a: 1rem;",
+            "  --space-b: 2rem;",
+            "",
+            "  /* Font-Weights */",
+            "  --font-weight-bold: 700;",
+            "",
+            "  /* Other */",
+            "  --z-index: 3;",
+            "}",
+        ]
+
+
+class TestDesignCssReads:
+    def test_file_read_once_while_unchanged(self, compiler, monkeypatch):
+        import builtins
+
+        compiler.get_computed_values()
+        monkeypatch.setattr(builtins, "open", pytest.fail)
+        assert compiler._extract_color_variable_definitions() == ""
+        assert "--space-base" in compiler.get_compiled_design_system_css()
+
+    def test_changed_file_is_reread(self, compiler, tmp_path):
+        import os
+
+        path = tmp_path / "design-system.css"
+        assert "1rem" in compiler._read_design_css()
+        path.write_text(DESIGN_SYSTEM.replace("1rem;", "3rem;", 1))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert "3rem" in compiler._read_design_css()
+
+
+class TestColorBlocks:
+    def test_extract_block_balances_nested_braces(self):
+        from capcat.core.design_system_compiler import _extract_block
+
+        css = "/* DARK */ x :root { a { b } c } tail }"
+        assert _extract_block(css, "DARK", ":root {") == ":root { a { b } c }"
+        assert _extract_block(css, "LIGHT", ":root {") == ""
+        assert _extract_block("DARK :root { {", "DARK", ":root {") == ""
+
+    def test_color_definitions_include_both_themes(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CAPCAT_CONFIG_NOCACHE", "1")
+        (tmp_path / "design-system.css").write_text(
+            "/* COLOR SYSTEM - DARK THEME */\n:root { --color-ink: #eee; }\n"
+            "/* COLOR SYSTEM - LIGHT THEME */\n"
+            '[data-theme="light"] { --color-ink: #111; }\n'
+        )
+        definitions = DesignSystemCompiler(
+            themes_dir=tmp_path
+        )._extract_color_variable_definitions()
+        assert ":root { --color-ink: #eee; }" in definitions
+        assert '[data-theme="light"] { --color-ink: #111; }' in definitions
+
+
+class TestBuildPipeline:
+    def test_outputs_follow_design_system_changes(
+        self, compiler, tmp_path, monkeypatch
+    ):
+        import os
+
+        monkeypatch.setattr(design_system_compiler, "_STAT_INTERVAL", 0)
+
+        assert compiler.get_computed_values()["space-base"] == "1rem"
+        assert "1rem" in compiler.get_compiled_design_system_css()
+
+        path = tmp_path / "design-system.css"
+        path.write_text(DESIGN_SYSTEM.replace("1rem;", "5rem;", 1))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert compiler.get_computed_values()["space-base"] == "5rem"
+        assert "--space-base: 5rem;" in compiler.get_compiled_design_system_css()
+
+    def test_missing_file(self, tmp_path):
+        compiler = DesignSystemCompiler(themes_dir=tmp_path)
+        assert compiler.get_computed_values() == {}
+        assert compiler._extract_color_variable_definitions() == ""
+        assert compiler.get_compiled_design_system_css() == (
+            "/* Error compiling design system */"
+        )
+
+    def test_unreadable_file_leaves_css_unchanged(self, tmp_path):
+        (tmp_path / "design-system.css").write_bytes(b":root { --a: \xff; }")
+        compiler = DesignSystemCompiler(themes_dir=tmp_path)
+        css = "p { margin: var(--a); }"
+        assert compiler.replace_css_variables(css) == css
+        assert compiler.compile_design_system(css) == css
+        assert compiler.get_design_tokens_for_js() == {}
+
+    def test_file_deleted_after_stat_is_treated_as_missing(
+        self, compiler, tmp_path
+    ):
+        compiler._design_source()
+        (tmp_path / "design-system.css").unlink()
+        css = "p { margin: var(--space-base); }"
+        assert compiler.replace_css_variables(css) == css
+
+
+class TestPixelReference:
+    def test_px_comment_for_rem_values(self, compiler):
+        assert compiler._add_pixel_reference("1.5rem") == (
+            "1.5rem", "/* 24px at 16px base */"
+        )
+        assert compiler._add_pixel_reference("0.3rem 1rem")[1] == (
+            "/* 4.80px, 16px at 16px base */"
+        )
+        assert compiler._add_pixel_reference("700") == ("700", None)
+
+
+class TestPrecompiledBuild:
+    def test_new_process_reuses_persisted_build(self, compiler, tmp_path):
+        compiler.get_computed_values()
+        assert list((tmp_path / "cache" / "capcat" / "design-system").glob("*.json"))
+
+        fresh = DesignSystemCompiler(themes_dir=tmp_path)
+        with patch.object(
+            fresh, "_compute_hardcoded_values", side_effect=AssertionError
+        ), patch.object(fresh, "_read_design_css", side_effect=AssertionError):
+            assert fresh.get_computed_values() == compiler.get_computed_values()
+            assert fresh._extract_color_variable_definitions() == ""
+
+    def test_changed_file_is_not_served_from_cache(self, compiler, tmp_path):
+        import os
+
+        compiler.get_computed_values()
+        path = tmp_path / "design-system.css"
+        path.write_text(DESIGN_SYSTEM.replace("1rem;", "6rem;", 1))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        fresh = DesignSystemCompiler(themes_dir=tmp_path)
+        assert fresh.get_computed_values()["space-base"] == "6rem"
+
+    def test_nocache_env_skips_persisting(self, compiler, tmp_path, monkeypatch):
+        monkeypatch.setenv("CAPCAT_CONFIG_NOCACHE", "1")
+        compiler.get_computed_values()
+        assert not (tmp_path / "cache" / "capcat").exists()
+
+
+class TestSourceCheck:
+    def test_file_is_statted_once_per_interval(self, compiler, monkeypatch):
+        compiler.get_computed_values()
+        calls = []
+        real_stat = type(compiler.design_system_path).stat
+        monkeypatch.setattr(
+            type(compiler.design_system_path),
+            "stat",
+            lambda self, *a, **k: calls.append(self) or real_stat(self, *a, **k),
+        )
+        for _ in range(5):
+            compiler.get_computed_values()
+            compiler.replace_css_variables("a { margin: var(--space-base); }")
+        assert calls == []
+
+        compiler.clear_cache()
+        compiler.get_computed_values()
+        assert calls
+
+
+class TestJsTokens:
+    def test_tokens_are_camel_cased_and_cached(self, compiler):
+        tokens = compiler.get_design_tokens_for_js()
+        assert tokens["spaceBase"] == "1rem"
+        assert tokens["colorInk"] == "#111"
+        assert compiler.get_design_tokens_for_js() is tokens
@@ -0,0 +1,32 @@
+"""Shared on-disk cache helpers."""
+import os
+
+from capcat.core import disk_cache
+
+
+class TestDiskCache:
+    def test_cache_file_lives_under_xdg_cache_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        path = disk_cache.cache_file("sources/a-{digest}.json", "/x/a.yml")
+        assert path.parent == tmp_path / "capcat" / "sources"
+        assert path.name.startswith("a-") and path.suffix == ".json"
+        assert path != disk_cache.cache_file("sources/a-{digest}.json", "/y/a.yml")
+
+    def test_write_atomic_replaces_without_leftovers(self, tmp_path):
+        target = tmp_path / "nested" / "state.pkl"
+        disk_cache.write_atomic(target, b"one")
+        disk_cache.write_atomic(target, b"two")
+        assert target.read_bytes() == b"two"
+        assert os.listdir(target.parent) == ["state.pkl"]
+
+    def test_prune_keeps_newest_files(self, tmp_path):
+        for i in range(5):
+            path = tmp_path / f"config-{i}.pkl"
+            path.write_bytes(b"")
+            os.utime(path, ns=(i * 10**9, i * 10**9))
+        (tmp_path / "registry-0.pkl").write_bytes(b"")
+
+        disk_cache.prune(tmp_path, "config-*.pkl", keep=2)
+        assert sorted(os.listdir(tmp_path)) == [
+            "config-3.pkl", "config-4.pkl", "registry-0.pkl"
+        ]
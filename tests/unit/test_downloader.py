@@ -1,4 +1,6 @@
 """Tests for download_file retry and error handling."""
+import io
+
 import requests
 from unittest.mock import MagicMock, patch
 
@@ -17,7 +19,6 @@ def _mock_4xx_response(status_code):
 def test_download_file_returns_none_on_403_without_retry(monkeypatch):
     """4xx response must return None immediately - no retry attempts."""
     mock_session = MagicMock()
-    mock_session.head.side_effect = Exception("head blocked")
     mock_session.get.return_value = _mock_4xx_response(403)
 
     with patch("capcat.core.downloader.session", mock_session):
@@ -30,7 +31,6 @@ def test_download_file_returns_none_on_403_without_retry(monkeypatch):
 def test_download_file_returns_none_on_404_without_retry(monkeypatch):
     """404 must also return None without retry."""
     mock_session = MagicMock()
-    mock_session.head.side_effect = Exception("head blocked")
     mock_session.get.return_value = _mock_4xx_response(404)
 
     with patch("capcat.core.downloader.session", mock_session):
@@ -40,17 +40,19 @@ def test_download_file_returns_none_on_404_without_retry(monkeypatch):
     assert mock_session.get.call_count == 1
 
 
-def _head_response_with_length(content_length_bytes: int):
+def _get_response_with_length(content_length_bytes: int):
     resp = MagicMock()
     resp.headers = {"content-length": str(content_length_bytes), "content-type": "application/pdf"}
     resp.raise_for_status.return_value = None
+    resp.raw = io.BytesIO(b"PDF data")
     return resp
 
 
 def test_download_file_skips_pdf_exceeding_config_limit(monkeypatch):
     """download_file must skip documents larger than PdfConfig.max_pdf_size_bytes."""
     mock_session = MagicMock()
-    mock_session.head.return_value = _head_response_with_length(2_000_000)  # 2MB - over 500KB limit
+    get_resp = _get_response_with_length(2_000_000)  # 2MB - over 500KB limit
+    mock_session.get.return_value = get_resp
 
     import capcat.core.downloader as dl
     original_config = dl.config
@@ -65,18 +67,15 @@ def test_download_file_skips_pdf_exceeding_config_limit(monkeypatch):
         dl.config = original_config
 
     assert result is None
-    mock_session.get.assert_not_called()
+    mock_session.head.assert_not_called()
+    assert get_resp.raw.tell() == 0  # body never read
+    get_resp.close.assert_called_once()
 
 
 def test_download_file_allows_pdf_within_config_limit(tmp_path):
     """download_file must proceed when document size is within PdfConfig.max_pdf_size_bytes."""
     mock_session = MagicMock()
-    mock_session.head.return_value = _head_response_with_length(300_000)  # 300KB - under 500KB limit
-
-    get_resp = MagicMock()
-    get_resp.headers = {"content-type": "application/pdf"}
-    get_resp.raise_for_status.return_value = None
-    get_resp.iter_content.return_value = [b"PDF data"]
+    get_resp = _get_response_with_length(300_000)  # 300KB - under 500KB limit
     mock_session.get.return_value = get_resp
 
     import capcat.core.downloader as dl
@@ -92,3 +91,200 @@ def test_download_file_allows_pdf_within_config_limit(tmp_path):
         dl.config = original_config
 
     assert result is not None
+    mock_session.head.assert_not_called()
+    assert (tmp_path / result).read_bytes() == b"PDF data"
+
+
+def test_url_predicates_classify_by_path_extension():
+    from capcat.core.downloader import (
+        classify_url,
+        is_audio_url,
+        is_document_url,
+        is_image_url,
+        is_video_url,
+    )
+
+    assert is_document_url("https://example.com/paper.PDF?download=1")
+    assert is_image_url("//cdn.example.com/a/photo.jpeg#top")
+    assert is_audio_url("episodes/show.mp3")
+    assert is_video_url("https://example.com/clip.webm;jsessionid=1")
+    assert not is_image_url("data:image/png;base64,iVBOR")
+    assert not is_document_url("https://example.com/page.html")
+    # Host names and query strings never decide the type
+    assert classify_url("https://example.pdf") is None
+    assert classify_url("https://example.com/view?file=a.pdf") is None
+    assert classify_url("https://example.com/2603.20220") is None
+
+
+def test_existing_file_is_not_overwritten(tmp_path):
+    """A name collision gets a suffixed file instead of clobbering the old one."""
+    files_dir = tmp_path / "files"
+    files_dir.mkdir()
+    (files_dir / "paper.pdf").write_bytes(b"old")
+
+    get_resp = _get_response_with_length(3)
+    get_resp.raw = io.BytesIO(b"new")
+    mock_session = MagicMock()
+    mock_session.get.return_value = get_resp
+
+    with patch("capcat.core.downloader.session", mock_session):
+        result = download_file("https://example.com/paper.pdf", str(tmp_path), "document")
+
+    assert result != "files/paper.pdf"
+    assert result.startswith("files/paper_") and result.endswith(".pdf")
+    assert (files_dir / "paper.pdf").read_bytes() == b"old"
+    assert (tmp_path / result).read_bytes() == b"new"
+
+
+def test_extensionless_urls_are_named_from_content_type(tmp_path):
+    cases = [
+        ("image", "image/webp", "images/image_1.webp"),
+        ("image", "application/pdf", "images/image_1.jpg"),
+        ("audio", "audio/x-wav; charset=binary", "audio/audio_1.wav"),
+        ("video", "application/octet-stream", "video/video_1.mp4"),
+        ("document", "application/msword", "files/document_1.doc"),
+    ]
+    for file_type, content_type, expected in cases:
+        get_resp = _get_response_with_length(4)
+        get_resp.headers["content-type"] = content_type
+        get_resp.raw = io.BytesIO(b"data")
+        mock_session = MagicMock()
+        mock_session.get.return_value = get_resp
+
+        with patch("capcat.core.downloader.session", mock_session):
+            result = download_file(
+                "https://example.com/media/", str(tmp_path / file_type), file_type, True
+            )
+        assert result == expected
+
+
+def test_download_files_fetches_each_url_once():
+    from capcat.core.downloader import download_files
+
+    def fake_download(url, folder, file_type, media_enabled):
+        if "broken" in url:
+            raise ConnectionError("reset")
+        return f"images/{url.rsplit('/', 1)[1]}"
+
+    urls = [
+        "https://example.com/a.png",
+        "https://example.com/broken.png",
+        "https://example.com/a.png",
+        "https://example.com/b.png",
+    ]
+    with patch("capcat.core.downloader.download_file", side_effect=fake_download) as mock_dl:
+        result = download_files(urls, "/tmp/article", "image")
+
+    assert mock_dl.call_count == 3
+    assert result == {
+        "https://example.com/a.png": "images/a.png",
+        "https://example.com/broken.png": None,
+        "https://example.com/b.png": "images/b.png",
+    }
+
+
+def test_media_size_cap_is_compared_in_bytes(tmp_path):
+    limit = 20 * 1024 * 1024
+    for size, downloaded in ((limit, True), (limit + 1, False)):
+        get_resp = _get_response_with_length(size)
+        get_resp.headers["content-type"] = "video/mp4"
+        mock_session = MagicMock()
+        mock_session.get.return_value = get_resp
+
+        with patch("capcat.core.downloader.session", mock_session):
+            result = download_file("https://example.com/clip.mp4", str(tmp_path), "video")
+
+        assert (result is not None) is downloaded
+
+
+def test_url_predicates_share_one_classification():
+    from capcat.core import downloader
+
+    url = "https://example.com/shared/lookup-once.MP3"
+    cached = downloader._classify_network_url
+    cached.cache_clear()
+    assert not downloader.is_document_url(url)
+    assert downloader.is_audio_url(url)
+    assert not downloader.is_video_url(url)
+    assert not downloader.is_image_url(url)
+    info = cached.cache_info()
+    assert (info.misses, info.hits) == (1, 3)
+
+    assert not downloader.is_image_url("data:image/png;base64," + "A" * 4096)
+    assert cached.cache_info().currsize == 1
+
+
+def test_filename_taken_from_last_path_segment(tmp_path):
+    cases = [
+        ("https://example.com/a/report.pdf?v=2#page=3", "files/report.pdf"),
+        ("https://example.com/dl/paper.pdf;jsessionid=9", "files/paper.pdf"),
+        (
+            "https://cdn.example.com/fetch/https%3A%2F%2Fs3.example.com%2Fdocs%2Fnotes.txt",
+            "files/notes.txt",
+        ),
+        ("https://example.com", "files/document_1.pdf"),
+    ]
+    for i, (url, expected) in enumerate(cases):
+        get_resp = _get_response_with_length(4)
+        get_resp.raw = io.BytesIO(b"data")
+        mock_session = MagicMock()
+        mock_session.get.return_value = get_resp
+
+        with patch("capcat.core.downloader.session", mock_session):
+            result = download_file(url, str(tmp_path / str(i)), "document", True)
+        assert result == expected
+
+
+def test_concurrent_download_files_share_one_bounded_pool(monkeypatch):
+    import threading
+    import time
+
+    from capcat.core import downloader
+
+    monkeypatch.setattr(downloader.config.network, "pool_maxsize", 2)
+    monkeypatch.setattr(downloader, "_download_executor", None)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fake_download(url, folder, file_type, media_enabled):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return url
+
+    results = []
+
+    def article(n):
+        urls = [f"https://example.com/{n}/{i}.png" for i in range(4)]
+        results.append(
+            downloader.download_files(urls, "/tmp", "image")
+            == {url: url for url in urls}
+        )
+
+    with patch("capcat.core.downloader.download_file", side_effect=fake_download):
+        threads = [threading.Thread(target=article, args=(n,)) for n in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        executor = downloader._download_executor
+    executor.shutdown()
+
+    assert results == [True, True, True]
+    assert peak[0] == 2
+
+
+def test_non_ascii_content_length_is_ignored(tmp_path):
+    get_resp = _get_response_with_length(0)
+    get_resp.headers["content-length"] = "²"
+    mock_session = MagicMock()
+    mock_session.get.return_value = get_resp
+
+    with patch("capcat.core.downloader.session", mock_session):
+        result = download_file("https://example.com/paper.pdf", str(tmp_path), "document")
+
+    assert result == "files/paper.pdf"
+    assert mock_session.get.call_count == 1
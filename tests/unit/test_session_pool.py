@@ -9,3 +9,14 @@ def test_accept_encoding_excludes_brotli():
     enc = session.headers.get("Accept-Encoding", "")
     assert "br" not in enc, f"Session advertises brotli but dep is removed: {enc}"
     assert "gzip" in enc
+
+
+def test_adapter_reuses_connections_and_retries_5xx():
+    """Pooled adapter keeps connections alive and retries transient 5xx."""
+    pool = SessionPool()
+    session = pool.get_session("test_adapter_source")
+    adapter = session.get_adapter("https://arxiv.org/pdf/1234.pdf")
+    assert adapter._pool_maxsize == pool.config.network.pool_maxsize
+    assert adapter._pool_block is False
+    assert 503 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.raise_on_status is False
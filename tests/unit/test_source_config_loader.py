@@ -0,0 +1,190 @@
+"""SourceConfigLoader caching, JSON output and dict round trips."""
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from capcat.core.config import SourceConfigLoader
+from capcat.core.config import source_base
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv("CAPCAT_CONFIG_NOCACHE", raising=False)
+    return tmp_path / "cache"
+
+
+def _sources_file(tmp_path, timeout):
+    path = tmp_path / "tech_sources.yml"
+    path.write_text(
+        f"sources:\n  hn:\n    name: Hacker News\n    timeout: {timeout}\n"
+    )
+    return path
+
+
+class TestJsonSidecar:
+    def test_sidecar_written_and_reused(self, tmp_path, cache_home):
+        path = _sources_file(tmp_path, 10)
+        first = SourceConfigLoader().load_from_file(path)
+        assert list((cache_home / "capcat" / "sources").glob("tech_sources-*.json"))
+
+        # A current sidecar means YAML is not parsed at all
+        with patch.object(source_base.yaml, "load", side_effect=AssertionError):
+            second = SourceConfigLoader().load_from_file(path)
+        assert second == first
+        assert second["sources"]["hn"]["timeout"] == 10
+
+    def test_modified_yaml_is_reparsed(self, tmp_path, cache_home):
+        path = _sources_file(tmp_path, 10)
+        SourceConfigLoader().load_from_file(path)
+
+        _sources_file(tmp_path, 200)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        data = SourceConfigLoader().load_from_file(path)
+        assert data["sources"]["hn"]["timeout"] == 200
+
+    def test_non_json_data_is_not_compiled(self, tmp_path, cache_home):
+        path = tmp_path / "dated.yml"
+        path.write_text("published: 2024-01-01\n")
+        SourceConfigLoader().load_from_file(path)
+        assert not list((cache_home / "capcat" / "sources").glob("dated-*.json"))
+
+    def test_nocache_env_skips_sidecar(self, tmp_path, cache_home, monkeypatch):
+        monkeypatch.setenv("CAPCAT_CONFIG_NOCACHE", "1")
+        SourceConfigLoader().load_from_file(_sources_file(tmp_path, 10))
+        assert not (cache_home / "capcat").exists()
+
+
+class TestParseCache:
+    def test_unchanged_file_is_not_reparsed(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CAPCAT_CONFIG_NOCACHE", "1")
+        path = _sources_file(tmp_path, 10)
+        loader = SourceConfigLoader()
+        loader.load_from_file(path)
+        with patch.object(source_base.yaml, "load", side_effect=AssertionError):
+            data = loader.load_from_file(path)
+        assert data["sources"]["hn"]["timeout"] == 10
+
+    def test_callers_get_independent_copies(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CAPCAT_CONFIG_NOCACHE", "1")
+        path = _sources_file(tmp_path, 10)
+        loader = SourceConfigLoader()
+        loader.load_from_file(path)["sources"]["hn"]["source_id"] = "hn"
+        assert "source_id" not in loader.load_from_file(path)["sources"]["hn"]
+
+    def test_clear_cache_forces_reparse(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CAPCAT_CONFIG_NOCACHE", "1")
+        path = _sources_file(tmp_path, 10)
+        loader = SourceConfigLoader()
+        loader.load_from_file(path)
+        loader.clear_cache()
+        with patch.object(source_base.yaml, "load", side_effect=AssertionError):
+            with pytest.raises(AssertionError):
+                loader.load_from_file(path)
+
+
+class TestSaveJson:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_output_matches_stdlib(self, tmp_path, monkeypatch, use_orjson):
+        import json
+
+        if not use_orjson:
+            monkeypatch.setattr(source_base, "_orjson", None)
+        data = {"name": "Hacker News", "timeout": 10, "tags": ["a", "b"], 1: "x"}
+        path = tmp_path / "out.json"
+        SourceConfigLoader().save_to_file(data, path, "json")
+        assert path.read_text() == json.dumps(data, indent=2)
+
+
+class TestFromDict:
+    def test_missing_and_null_keys_take_field_defaults(self):
+        from capcat.core.config import SourceConfig
+
+        config = SourceConfig.from_dict(
+            {
+                "name": "HN",
+                "source_id": "hn",
+                "base_url": "https://news.ycombinator.com",
+                "headers": None,
+                "unknown": 1,
+            }
+        )
+        assert config.timeout == 30
+        assert config.headers == {}
+        assert config.user_agent == source_base.DEFAULT_USER_AGENT
+
+    def test_header_and_selector_keys_are_interned(self):
+        from capcat.core.config import SourceConfig
+
+        name = "".join(["Accept-", "Encoding"])
+        config = SourceConfig.from_dict(
+            {
+                "name": "HN",
+                "source_id": "hn",
+                "base_url": "https://x",
+                "headers": {name: "gzip"},
+            }
+        )
+        (key,) = config.headers
+        assert key is sys.intern("Accept-Encoding")
+        assert config.user_agent is source_base.DEFAULT_USER_AGENT
+
+    def test_round_trip(self):
+        from capcat.core.config import BundleConfig, SourceConfig
+
+        source = SourceConfig(
+            name="HN", source_id="hn", base_url="https://x", timeout=5
+        )
+        assert SourceConfig.from_dict(source.to_dict()) == source
+        bundle = BundleConfig(name="tech", description="d", sources=["hn"])
+        assert BundleConfig.from_dict(bundle.to_dict()) == bundle
+
+
+class TestMergeWith:
+    def test_other_overrides_non_default_values(self):
+        from capcat.core.config import SourceConfig
+
+        base = SourceConfig(
+            name="HN", source_id="hn", base_url="https://x",
+            timeout=5, headers={"a": "1"}, extract_comments=False,
+        )
+        other = SourceConfig(
+            name="", source_id="", base_url="", max_retries=9,
+            headers={"b": "2"},
+        )
+        merged = base.merge_with(other)
+        assert merged.name == "HN"
+        assert merged.timeout == 5
+        assert merged.max_retries == 9
+        assert merged.headers == {"a": "1", "b": "2"}
+        assert merged.extract_comments is True
+        # Untouched dict fields are shared rather than copied
+        assert merged.selectors is base.selectors
+
+
+class TestLoadSourceConfig:
+    def test_single_lookup_copies_only_the_entry(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CAPCAT_CONFIG_NOCACHE", "1")
+        path = tmp_path / "tech_sources.yml"
+        path.write_text(
+            "sources:\n"
+            "  hn:\n    name: HN\n    base_url: https://x\n"
+            "    headers: {a: '1'}\n"
+            "  lb:\n    name: Lobsters\n    base_url: https://y\n"
+        )
+        loader = SourceConfigLoader()
+        config = loader.load_source_config(path, "hn")
+        assert config.source_id == "hn"
+        config.headers["a"] = "changed"
+
+        # The cached file data is neither copied wholesale nor mutated
+        with patch.object(
+            source_base.copy, "deepcopy", wraps=source_base.copy.deepcopy
+        ) as deepcopy:
+            again = loader.load_source_config(path, "hn")
+        deepcopy.assert_called_once()
+        assert again.headers == {"a": "1"}
+        assert "source_id" not in loader.load_from_file(path)["sources"]["hn"]
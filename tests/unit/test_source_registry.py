@@ -0,0 +1,193 @@
+"""SourceRegistry state caching and the dynamic 'all' bundle."""
+import os
+from unittest.mock import patch
+
+import pytest
+
+from capcat.core.config import source_registry
+from capcat.core.config.source_registry import (
+    SourceRegistry,
+    SourceRegistryConfig,
+)
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(
+        source_registry, "_USER_CONFIG_DIR", tmp_path / "home" / "sources"
+    )
+    monkeypatch.delenv("CAPCAT_CONFIG_NOCACHE", raising=False)
+    directory = tmp_path / "builtin"
+    directory.mkdir()
+    (directory / "tech_sources.yml").write_text(
+        "sources:\n"
+        "  hn:\n"
+        "    name: Hacker News\n"
+        "    base_url: https://news.ycombinator.com\n"
+        "    category: tech\n"
+    )
+    return directory
+
+
+def _registry(config_dir) -> SourceRegistry:
+    return SourceRegistry(SourceRegistryConfig(config_dir=config_dir))
+
+
+class TestRegistryStateCache:
+    def test_second_start_skips_loading(self, config_dir):
+        first = _registry(config_dir)
+        assert first.list_available_sources() == ["hn"]
+
+        with patch.object(
+            SourceRegistry, "_load_default_sources", side_effect=AssertionError
+        ):
+            second = _registry(config_dir)
+        assert second.list_available_sources() == ["hn"]
+        assert second.list_sources_by_category("tech") == ["hn"]
+        assert second.get_registry_stats()["initialized"] is True
+
+    def test_changed_config_file_invalidates_cache(self, config_dir):
+        _registry(config_dir)
+        path = config_dir / "tech_sources.yml"
+        path.write_text(
+            path.read_text()
+            + "  lb:\n    name: Lobsters\n    base_url: https://lobste.rs\n"
+        )
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        sources = _registry(config_dir).list_available_sources()
+        assert sorted(sources) == ["hn", "lb"]
+
+    def test_edited_yaml_source_file_invalidates_cache(self, config_dir):
+        extra = config_dir / "extra_sources.yaml"
+        extra.write_text(
+            "sources:\n  lb:\n    name: Lobsters\n"
+            "    base_url: https://lobste.rs\n"
+        )
+        assert sorted(_registry(config_dir).list_available_sources()) == [
+            "hn", "lb"
+        ]
+
+        extra.write_text(
+            "sources:\n  lobsters:\n    name: Lobsters\n"
+            "    base_url: https://lobste.rs\n"
+            "  tilde:\n    name: Tildes\n    base_url: https://tildes.net\n"
+        )
+        stat = extra.stat()
+        os.utime(extra, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert sorted(_registry(config_dir).list_available_sources()) == [
+            "hn", "lobsters", "tilde"
+        ]
+
+        extra.unlink()
+        assert _registry(config_dir).list_available_sources() == ["hn"]
+
+    def test_nocache_env_skips_cache(self, config_dir, tmp_path, monkeypatch):
+        monkeypatch.setenv("CAPCAT_CONFIG_NOCACHE", "1")
+        _registry(config_dir)
+        assert not list((tmp_path / "cache").glob("capcat/registry-*.pkl"))
+
+
+class TestAllBundle:
+    def test_all_bundle_lists_every_source(self, config_dir):
+        registry = _registry(config_dir)
+        assert registry.get_bundle_sources("all") == ["hn"]
+
+    def test_all_bundle_restored_from_cache(self, config_dir):
+        _registry(config_dir)
+        assert _registry(config_dir).get_bundle_sources("all") == ["hn"]
+
+    def test_register_source_updates_all_bundle(self, config_dir):
+        registry = _registry(config_dir)
+        hn = registry.get_source_config("hn")
+        registry.register_source("hn2", hn)
+        assert registry.get_bundle_sources("all") == ["hn", "hn2"]
+
+
+class TestLazySourceConfigs:
+    def test_configs_built_on_first_lookup(self, config_dir):
+        registry = _registry(config_dir)
+        assert registry._sources_cache == {}
+        config = registry.get_source_config("hn")
+        assert config.name == "Hacker News"
+        assert registry.get_source_config("hn") is config
+
+    def test_entry_missing_required_keys_is_skipped(self, config_dir):
+        (config_dir / "news_sources.yml").write_text(
+            "sources:\n  broken:\n    name: Broken\n"
+        )
+        registry = _registry(config_dir)
+        assert registry.list_available_sources() == ["hn"]
+        assert registry.get_source_config("broken") is None
+
+
+class TestSearchSources:
+    def test_matches_id_name_and_url(self, config_dir):
+        registry = _registry(config_dir)
+        assert registry.search_sources("HACKER") == ["hn"]
+        assert registry.search_sources("ycombinator") == ["hn"]
+        assert registry.search_sources("nomatch") == []
+
+    def test_registered_source_is_searchable(self, config_dir):
+        registry = _registry(config_dir)
+        registry.search_sources("hn")
+        registry.register_source("lobsters", registry.get_source_config("hn"))
+        assert registry.search_sources("lobst") == ["lobsters"]
+
+
+class TestCategories:
+    def test_reloading_a_file_does_not_duplicate_members(self, config_dir):
+        registry = _registry(config_dir)
+        sources, categories = {}, {}
+        for _ in range(2):
+            registry._load_sources_from_file(
+                config_dir / "tech_sources.yml", sources, categories
+            )
+        assert categories == {"tech": {"hn": None}}
+
+    def test_listing_is_a_copy(self, config_dir):
+        registry = _registry(config_dir)
+        registry.list_sources_by_category("tech").append("x")
+        assert registry.list_sources_by_category("tech") == ["hn"]
+
+
+class TestLocking:
+    def test_reload_and_register_do_not_deadlock(self, config_dir):
+        from capcat.core.config import BundleConfig
+
+        registry = _registry(config_dir)
+        registry.reload_configurations()
+        registry.register_bundle(
+            "mine", BundleConfig(name="mine", description="", sources=["hn"])
+        )
+        assert registry.search_sources("hacker") == ["hn"]
+        assert registry.get_bundle_sources("mine") == ["hn"]
+
+    def test_readers_see_old_state_until_reload_completes(
+        self, config_dir, monkeypatch
+    ):
+        registry = _registry(config_dir)
+        assert registry.get_source_config("hn").name == "Hacker News"
+        path = config_dir / "tech_sources.yml"
+        path.write_text(path.read_text().replace("Hacker News", "HN"))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        seen = []
+        load_bundles = SourceRegistry._load_default_bundles
+
+        def observe(self, bundles):
+            # Runs mid-reload, after the new sources have been parsed
+            seen.append((
+                registry.list_available_sources(),
+                registry.get_source_config("hn").name,
+                registry.get_bundle_sources("all"),
+            ))
+            load_bundles(self, bundles)
+
+        monkeypatch.setattr(SourceRegistry, "_load_default_bundles", observe)
+        registry.reload_configurations()
+
+        assert seen == [(["hn"], "Hacker News", ["hn"])]
+        assert registry.get_source_config("hn").name == "HN"